@@ -0,0 +1,45 @@
+import argparse
+import json
+import sys
+
+from pack.bench.runner import compare, load, run_suite, save
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m pack.bench',
+        description='Benchmarks Point, Car and Unit hot paths.')
+    parser.add_argument('--scales', type=int, nargs='+',
+                        default=[1000, 10000, 100000],
+                        help='numbers of operations per case')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='measurements per case, the best is taken')
+    parser.add_argument('--filter', default='',
+                        help='run only cases with the substring in name')
+    parser.add_argument('--output', help='write JSON report to the file')
+    parser.add_argument('--baseline', help='JSON report to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed relative slowdown, 0.1 is 10%%')
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.scales, args.repeat, args.filter)
+
+    if args.output:
+        save(report, args.output)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if not args.baseline:
+        return 0
+
+    regressions = compare(report, load(args.baseline), args.threshold)
+    for name, before, after, change in regressions:
+        print(f'REGRESSION {name}: {before:.1f} -> {after:.1f} '
+              f'(+{change:.0%})', file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import copy
+import timeit
+
+from pack.car.car import Car
+from pack.point.point import Point
+from pack.snapshot.journal import Journal
+
+
+def run(count=100000, changes=100, repeat=5):
+    """
+    Measures branching of fleet state: copying every car with copy.copy
+    against a Journal checkpoint and rollback, with a few cars driven in
+    every branch.
+
+    :param count: Number of cars in fleet
+    :type count: int
+    :param changes: Number of cars driven per branch
+    :type changes: int
+    :param repeat: Number of measurements, the best one is taken
+    :type repeat: int
+
+    :return: Case name to seconds per branch
+    :rtype: dict
+    """
+
+    cars = [Car(50, 0.5, Point(i % 100, i % 37), 'Zpa')
+            for i in range(count)]
+    for car in cars:
+        car.refill(40)
+    driven = range(0, count, max(count // changes, 1))[:changes]
+    destination = Point(50, 20)
+
+    def copying():
+        branch = [copy.copy(car) for car in cars]
+        for index in driven:
+            branch[index].drive(destination)
+
+    journal = Journal(cars)
+
+    def journaling():
+        journal.checkpoint()
+        for index in driven:
+            cars[index].drive(destination)
+        journal.rollback()
+        journal.commit()
+
+    cases = {'copy.copy': copying, 'Journal': journaling}
+    try:
+        return {name: min(timeit.repeat(case, number=1, repeat=repeat))
+                for name, case in cases.items()}
+    finally:
+        journal.release()
+
+
+if __name__ == '__main__':
+    report = run()
+    for name, seconds in report.items():
+        print(f'{name:<10} {seconds * 1e3:10.3f} ms per branch')
+    print(f'Journal is x{report["copy.copy"] / report["Journal"]:.0f} '
+          f'faster')
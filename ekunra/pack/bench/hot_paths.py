@@ -0,0 +1,245 @@
+import copy
+
+import numpy as np
+
+from pack.car.car import Car
+from pack.car.dispatch import Dispatcher
+from pack.car.events import Scheduler
+from pack.point.metric import HAVERSINE, CachedMetric
+from pack.point.point import FrozenPoint, Point
+from pack.point.point_array import PointArray
+from pack.unit.effects import EffectEngine
+from pack.unit.unit import Unit
+
+
+CASES = {}
+
+
+def case(name):
+    """
+    Registers benchmark case.
+
+    A case is called with number of operations and returns callable
+    performing them.
+
+    :param name: Name of the case
+    :type name: str
+    """
+
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def _points(n):
+    return [Point(i % 100, i % 37 + 0.5) for i in range(n)]
+
+
+@case('point.add')
+def point_add(n):
+    points, other = _points(n), Point(1, 2.5)
+
+    def run():
+        for point in points:
+            point + other
+
+    return run
+
+
+@case('point.sub')
+def point_sub(n):
+    points, other = _points(n), Point(1, 2.5)
+
+    def run():
+        for point in points:
+            point - other
+
+    return run
+
+
+@case('point.distance')
+def point_distance(n):
+    points, other = _points(n), Point(1, 2.5)
+
+    def run():
+        for point in points:
+            point.distance(other)
+
+    return run
+
+
+@case('car.compute_fuel_needed')
+def car_compute_fuel_needed(n):
+    car, points = Car(50, 0.7, Point(2, 21.11), 'Zpa'), _points(n)
+
+    def run():
+        for point in points:
+            car.compute_fuel_needed(point)
+
+    return run
+
+
+@case('car.drive.point')
+def car_drive_point(n):
+    car, points = Car(1e12, 0.7, Point(), 'Zpa'), _points(n)
+    car.refill(1e12)
+
+    def run():
+        for point in points:
+            car.drive(point)
+
+    return run
+
+
+@case('car.drive.xy')
+def car_drive_xy(n):
+    car = Car(1e12, 0.7, Point(), 'Zpa')
+    car.refill(1e12)
+    coordinates = [(i % 100, i % 37) for i in range(n)]
+
+    def run():
+        for x, y in coordinates:
+            car.drive(x, y)
+
+    return run
+
+
+@case('car.copy')
+def car_copy(n):
+    cars = [Car(50, 0.7, Point(i, 1), 'Zpa') for i in range(n)]
+
+    def run():
+        for car in cars:
+            copy.copy(car)
+
+    return run
+
+
+@case('unit.attack')
+def unit_attack(n):
+    units = [Unit('Zulu', 1e12, 30) for _ in range(n + 1)]
+    pairs = list(zip(units, units[1:]))
+
+    def run():
+        for unit, enemy in pairs:
+            unit.attack(enemy)
+
+    return run
+
+
+@case('unit.counter_attack')
+def unit_counter_attack(n):
+    units = [Unit('Zulu', 1e12, 30) for _ in range(n + 1)]
+    pairs = list(zip(units, units[1:]))
+
+    def run():
+        for unit, enemy in pairs:
+            unit.counter_attack(enemy)
+
+    return run
+
+
+@case('point.init')
+def point_init(n):
+    coordinates = [(i, i + 0.5) for i in range(n)]
+
+    def run():
+        for x, y in coordinates:
+            Point(x, y)
+
+    return run
+
+
+@case('point.interned')
+def point_interned(n):
+    coordinates = [(i % 50, i % 20) for i in range(n)]
+
+    def run():
+        for x, y in coordinates:
+            FrozenPoint.interned(x, y)
+
+    return run
+
+
+@case('unit.init')
+def unit_init(n):
+    def run():
+        for i in range(n):
+            Unit('Zulu', i, 30)
+
+    return run
+
+
+@case('car.init')
+def car_init(n):
+    location = Point()
+
+    def run():
+        for i in range(n):
+            Car(i, 0.7, location, 'Zpa')
+
+    return run
+
+
+@case('dispatch.nearest')
+def dispatch_nearest(n):
+    cars = [Car(50, 0.5, point, 'Zpa') for point in _points(2000)]
+    for car in cars:
+        car.refill(10)
+    dispatcher, pickups = Dispatcher(cars), _points(n)
+
+    def run():
+        for pickup in pickups:
+            dispatcher.nearest(pickup)
+
+    return run
+
+
+@case('events.schedule_run')
+def events_schedule_run(n):
+    times = [(i * 7919) % n for i in range(n)]
+
+    def run():
+        scheduler = Scheduler()
+        for time in times:
+            scheduler.schedule(time, int)
+        scheduler.run()
+
+    return run
+
+
+@case('metric.haversine.distances')
+def metric_haversine_distances(n):
+    prepared = HAVERSINE.prepare(PointArray.from_points(_points(n)))
+    origin = Point(12.5, 41.9)
+
+    def run():
+        HAVERSINE.distances(origin, prepared)
+
+    return run
+
+
+@case('car.compute_fuel_needed.cached')
+def car_compute_fuel_needed_cached(n):
+    car = Car(50, 0.7, Point(2, 41.9), 'Zpa', CachedMetric(HAVERSINE))
+    points = _points(n)
+
+    def run():
+        for point in points:
+            car.compute_fuel_needed(point)
+
+    return run
+
+
+@case('effects.tick')
+def effects_tick(n):
+    engine = EffectEngine(np.full(n, 1e12), np.full(n, 1e12))
+    engine.add(np.arange(n), -1, 10 ** 9)
+    engine.add(np.arange(0, n, 2), 2, 10 ** 9)
+
+    def run():
+        engine.tick()
+
+    return run
@@ -0,0 +1,45 @@
+import timeit
+
+from pack.car.car import Car
+from pack.instrument import instrument
+from pack.point.point import Point
+
+
+def run(count=100000, sample_every=100, repeat=5):
+    """
+    Measures cost of instrumentation on Car.drive: with instrumentation
+    disabled, enabled and enabled with sampled timing.
+
+    :param count: Number of drives per measurement
+    :type count: int
+    :param sample_every: Time one call of every that many
+    :type sample_every: int
+    :param repeat: Number of measurements, the best one is taken
+    :type repeat: int
+
+    :return: Case name to seconds per drive
+    :rtype: dict
+    """
+
+    points = [Point(i % 100, i % 37 + 0.5) for i in range(count)]
+    car = Car(1e12, 0.7, Point(), 'Zpa')
+    car.refill(1e12)
+
+    def drive():
+        for point in points:
+            car.drive(point)
+
+    def measure():
+        return min(timeit.repeat(drive, number=1, repeat=repeat)) / count
+
+    report = {'disabled': measure()}
+    for name, every in (('enabled', 0), ('sampled', sample_every)):
+        with instrument.instrumented(instrument.Registry(), every):
+            report[name] = measure()
+
+    return report
+
+
+if __name__ == '__main__':
+    for name, seconds in run().items():
+        print(f'{name:<10} {seconds * 1e9:10.0f} ns per drive')
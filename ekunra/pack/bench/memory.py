@@ -0,0 +1,85 @@
+import tracemalloc
+
+from pack.car.car import Car
+from pack.point.point import Point
+from pack.unit.unit import Unit
+
+
+def _dict_twin(cls):
+    """
+    Builds a copy of class keeping its attributes in per-instance __dict__
+    instead of __slots__, the layout classes had before slots.
+
+    :param cls: Class with __slots__
+    :type cls: type
+    :rtype: type
+    """
+
+    slots = set(getattr(cls, '__slots__', ()))
+    namespace = {name: value for name, value in vars(cls).items()
+                 if name not in slots and name not in ('__slots__',
+                                                       '__dict__',
+                                                       '__weakref__')}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def bytes_per_instance(factory, count=10000):
+    """
+    Measures memory allocated per object built by factory.
+
+    :param factory: Callable returning one new object
+    :type factory: callable
+    :param count: Number of objects to build
+    :type count: int
+
+    :return: Average number of bytes allocated per object
+    :rtype: float
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects = [factory() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in
+                    after.compare_to(before, 'filename'))
+    # The list holding objects is not a part of them.
+    allocated -= objects.__sizeof__()
+    return allocated / count
+
+
+def run(count=10000):
+    """
+    Measures bytes per instance of Point, Unit and Car with slots and with
+    the former __dict__ layout.
+
+    :param count: Number of objects to build per measurement
+    :type count: int
+
+    :return: Class name to (slots, dict) bytes per instance
+    :rtype: dict
+    """
+
+    location = Point(1, 2)
+    factories = {
+        Point: lambda cls: cls(1.5, 2.5),
+        Unit: lambda cls: cls('Zulu', 120, 30),
+        Car: lambda cls: cls(50, 0.7, location, 'Zpa'),
+    }
+
+    report = {}
+    for cls, factory in factories.items():
+        twin = _dict_twin(cls)
+        report[cls.__name__] = (
+            bytes_per_instance(lambda: factory(cls), count),
+            bytes_per_instance(lambda: factory(twin), count))
+
+    return report
+
+
+if __name__ == '__main__':
+    for name, (slots, dicts) in run().items():
+        print(f'{name:<8} slots: {slots:7.1f} B  dict: {dicts:7.1f} B')
@@ -0,0 +1,92 @@
+import json
+import platform
+import timeit
+
+from pack.bench import memory
+from pack.bench.hot_paths import CASES
+
+
+def measure(setup, n, repeat=5):
+    """
+    Times one benchmark case.
+
+    :param setup: Case returning callable performing n operations
+    :type setup: callable
+    :param n: Number of operations
+    :type n: int
+    :param repeat: Number of measurements, the best one is taken
+    :type repeat: int
+
+    :return: Nanoseconds per operation
+    :rtype: float
+    """
+
+    run = setup(n)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / n * 1e9
+
+
+def run_suite(scales=(1000, 10000, 100000), repeat=5, pattern=''):
+    """
+    Runs every registered case at every scale and measures memory
+    footprint of objects.
+
+    :param scales: Numbers of operations per case
+    :type scales: iterable of int
+    :param repeat: Number of measurements per case and scale
+    :type repeat: int
+    :param pattern: Only cases with the substring in name are run
+    :type pattern: str
+
+    :return: Machine-readable report
+    :rtype: dict
+    """
+
+    timings = {f'{name}@{n}': measure(setup, n, repeat)
+               for name, setup in CASES.items() if pattern in name
+               for n in scales}
+    footprint = {name: slots for name, (slots, _) in
+                 memory.run(min(scales)).items()}
+
+    return {'python': platform.python_version(),
+            'ns_per_op': timings,
+            'bytes_per_instance': footprint}
+
+
+def compare(report, baseline, threshold=0.1):
+    """
+    Finds metrics which got worse than baseline by more than threshold.
+
+    :param report: Fresh report
+    :type report: dict
+    :param baseline: Stored report
+    :type baseline: dict
+    :param threshold: Allowed relative growth of every metric
+    :type threshold: float
+
+    :return: (metric, baseline value, new value, relative change) of
+    every regression
+    :rtype: list
+    """
+
+    regressions = []
+    for section in ('ns_per_op', 'bytes_per_instance'):
+        stored = baseline.get(section, {})
+        for name, value in report.get(section, {}).items():
+            if name not in stored or not stored[name]:
+                continue
+
+            change = value / stored[name] - 1
+            if change > threshold:
+                regressions.append((name, stored[name], value, change))
+
+    return regressions
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(report, path):
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2, sort_keys=True)
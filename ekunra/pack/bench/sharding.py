@@ -0,0 +1,60 @@
+import multiprocessing
+from time import perf_counter
+
+import numpy as np
+
+from pack.car.fleet import CarFleet
+from pack.car.shard import ShardedFleet
+from pack.point.point_array import PointArray
+
+
+def _fleet(count, generator):
+    return CarFleet(np.full(count, 50.0), generator.uniform(0.1, 1, count),
+                    PointArray(generator.uniform(0, 1000, count),
+                               generator.uniform(0, 1000, count)),
+                    np.full(count, 50.0))
+
+
+def run(count=1000000, steps=10, max_shards=None):
+    """
+    Measures steps of ShardedFleet from one shard to one per CPU. Cars
+    shuttle between two random points each, refilling every step, so
+    some of them cross shards on every step.
+
+    :param count: Number of cars
+    :type count: int
+    :param steps: Number of steps measured per number of shards
+    :type steps: int
+    :param max_shards: Most shards, number of CPUs by default
+    :type max_shards: int
+
+    :return: Number of shards to seconds per step
+    :rtype: dict
+    """
+
+    generator = np.random.default_rng(0)
+    fleet = _fleet(count, generator)
+    targets = [PointArray(generator.uniform(0, 1000, count),
+                          generator.uniform(0, 1000, count))
+               for _ in range(2)]
+
+    report = {}
+    for shards in range(1, (max_shards or multiprocessing.cpu_count()) + 1):
+        with ShardedFleet(fleet, shards) as sharded:
+            seconds = 0.0
+            for step in range(steps):
+                sharded.set_destinations(targets[step % 2])
+                sharded.refill(10)
+                started = perf_counter()
+                sharded.step()
+                seconds += perf_counter() - started
+        report[shards] = seconds / steps
+
+    return report
+
+
+if __name__ == '__main__':
+    report = run()
+    for shards, seconds in report.items():
+        print(f'{shards:>3} shards {seconds * 1e3:10.3f} ms per step '
+              f'x{report[1] / seconds:.2f}')
@@ -0,0 +1,80 @@
+import timeit
+
+from pack.car.car import Car, OutOfFuel
+from pack.point.point import Point
+from pack.unit.unit import Unit, UnitIsDead
+
+
+def _drive_raising(car, destinations):
+    for destination in destinations:
+        try:
+            car.drive(destination)
+        except OutOfFuel:
+            car.refill(car.fuel_capacity - car.fuel_amount)
+
+
+def _drive_status(car, destinations):
+    for destination in destinations:
+        if car.try_drive(destination):
+            car.refill(car.fuel_capacity - car.fuel_amount)
+
+
+def _fight_raising(pairs):
+    for hp, dmg in pairs:
+        a, b = Unit('a', hp, dmg), Unit('b', hp, dmg)
+        try:
+            while True:
+                a.attack(b)
+                b.attack(a)
+        except UnitIsDead:
+            pass
+
+
+def _fight_status(pairs):
+    for hp, dmg in pairs:
+        a, b = Unit('a', hp, dmg), Unit('b', hp, dmg)
+        while not a.try_attack(b) and not b.try_attack(a):
+            pass
+
+
+def run(count=10000, repeat=5):
+    """
+    Measures throughput of raising hot loops against status returning
+    ones: a car driving back and forth running out of fuel every third
+    drive and short duels of units, so OutOfFuel and UnitIsDead are
+    frequent outcomes.
+
+    :param count: Number of drives and duels per measurement
+    :type count: int
+    :param repeat: Number of measurements, the best one is taken
+    :type repeat: int
+
+    :return: Case name to (raising, status) operations per second
+    :rtype: dict
+    """
+
+    destinations = [Point(3, 4), Point()] * (count // 2)
+    pairs = [(60 + n % 40, 30) for n in range(count)]
+
+    def drives(drive):
+        car = Car(5, 0.5, Point(), 'Zpa')
+        return lambda: drive(car, destinations)
+
+    def fights(fight):
+        return lambda: fight(pairs)
+
+    cases = {
+        'Car.drive': (drives(_drive_raising), drives(_drive_status)),
+        'Unit.attack': (fights(_fight_raising), fights(_fight_status)),
+    }
+
+    return {name: tuple(count / min(timeit.repeat(case, number=1,
+                                                  repeat=repeat))
+                        for case in pair)
+            for name, pair in cases.items()}
+
+
+if __name__ == '__main__':
+    for name, (raising, status) in run().items():
+        print(f'{name:<12} raising: {raising:10.0f} op/s  '
+              f'status: {status:10.0f} op/s  x{status / raising:.2f}')
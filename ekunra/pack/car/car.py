@@ -1,5 +1,11 @@
 import copy
-from pack.point.point import Point
+from bisect import bisect_left
+from enum import IntEnum
+from itertools import accumulate
+
+from pack.column import validate_column
+from pack.point.metric import PLANAR, Metric
+from pack.point.point import FrozenPoint, Point
 
 
 class Error(Exception):
@@ -36,9 +42,34 @@ class TooMuchFuel(Error):
                            f'fuel tank capacity.'
 
 
+class DriveStatus(IntEnum):
+    """Outcome of driving a car to a destination."""
+
+    MOVED = 0
+    EMPTY_TANK = 1
+    INSUFFICIENT_FUEL = 2
+    # Car left out of a batch drive by its mask.
+    SKIPPED = 3
+
+
+class RefillStatus(IntEnum):
+    """Outcome of refilling a car's fuel tank."""
+
+    REFILLED = 0
+    TOO_MUCH_FUEL = 1
+
+
 class Car:
     """Class representing car prototype and its behavior"""
 
+    __slots__ = ('_fuel_amount', '_fuel_capacity', '_fuel_consumption',
+                 '_location', '_model', '_metric')
+
+    # Whether drive(x, y) takes destination from FrozenPoint intern cache,
+    # sharing one immutable location between cars driven to the same
+    # coordinates, instead of building a new Point.
+    intern_coordinates = False
+
     def _validate_numeric(self, num):
         """
         Checks if number of correct Type.
@@ -74,8 +105,27 @@ class Car:
 
         return point
 
+    @staticmethod
+    def _validate_metric(metric):
+        """
+        Checks if distance metric of correct Type.
+
+        :param metric: Metric to validate
+        :type metric: Any
+        :raise TypeError: In case argument is neither Metric nor None
+
+        :return: Validated metric
+        :rtype: Metric or None
+        """
+
+        if metric is not None and not isinstance(metric, Metric):
+            raise TypeError
+
+        return metric
+
     def __init__(self, f_capacity: float = 50, f_consumption: float = 0.6,
-                 car_location: Point = Point(), car_model: str = 'Trash'):
+                 car_location: Point = None, car_model: str = 'Trash',
+                 metric: Metric = None):
         """
         Initializer
 
@@ -83,24 +133,87 @@ class Car:
         :type f_capacity: int
         :param f_consumption: Fuel consumption per unit of distance
         :type f_consumption: float
-        :param car_location: Car's location
+        :param car_location: Car's location, new Point(0, 0) by default
         :type car_location: Point
         :param car_model: Car's model name
         :type car_model: str
+        :param metric: Metric distances are measured with, planar by default
+        :type metric: Metric
         :raise TypeError: object instantiated with incorrect data
         """
 
+        if car_location is None:
+            car_location = Point()
+
         self._fuel_amount = 0
         self._fuel_capacity = self._validate_numeric(f_capacity)
         self._fuel_consumption = self._validate_numeric(f_consumption)
         self._location = self._validate_location_point(car_location)
         self._model = car_model
+        self._metric = self._validate_metric(metric)
+
+    @classmethod
+    def bulk(cls, f_capacities, f_consumptions, car_locations=None,
+             car_models=None, metric=None):
+        """
+        Bulk constructor validating whole columns of data at once.
+
+        :param f_capacities: The capacities of FuelTanks
+        :type f_capacities: sequence or numpy.ndarray of int or float
+        :param f_consumptions: Fuel consumptions per unit of distance
+        :type f_consumptions: sequence or numpy.ndarray of int or float
+        :param car_locations: Cars' locations, new origin Points by default
+        :type car_locations: sequence of Point
+        :param car_models: Cars' model names, 'Trash' by default
+        :type car_models: sequence of str
+        :param metric: Metric of all Cars, planar by default
+        :type metric: Metric
+        :raise TypeError: objects instantiated with incorrect data
+        :raise ValueError: columns are of different length
+
+        :return: New Cars
+        :rtype: list
+        """
+
+        metric = cls._validate_metric(metric)
+        capacities = validate_column(f_capacities)
+        consumptions = validate_column(f_consumptions)
+        size = len(capacities)
+
+        if car_locations is None:
+            car_locations = Point.from_arrays([0] * size, [0] * size)
+        car_locations = list(car_locations)
+        if not all(isinstance(point, Point) for point in car_locations):
+            raise TypeError
+
+        car_models = ['Trash'] * size if car_models is None \
+            else list(car_models)
+
+        if not size == len(consumptions) == len(car_locations) \
+                == len(car_models):
+            raise ValueError('Columns must be of equal length')
+
+        new = cls.__new__
+        cars = []
+        for capacity, consumption, location, model in zip(
+                capacities, consumptions, car_locations, car_models):
+            car = new(cls)
+            car._fuel_amount = 0
+            car._fuel_capacity = capacity
+            car._fuel_consumption = consumption
+            car._location = location
+            car._model = model
+            car._metric = metric
+            cars.append(car)
+
+        return cars
 
     def __copy__(self):
         car_copy = Car(self._fuel_capacity,
                        self._fuel_consumption,
                        copy.copy(self._location),
-                       self._model)
+                       self._model,
+                       self._metric)
         car_copy.fuel_amount = self.fuel_amount
         return car_copy
 
@@ -121,9 +234,65 @@ class Car:
         :rtype: int or float
         """
 
-        path_length = self._location.distance(destination)
+        path_length = self._location.distance(destination, self._metric)
         return path_length * self._fuel_consumption
 
+    def _parse_destination(self, args):
+        """
+        Checks if drive arguments of correct Type.
+
+        :param args: Coordinates as x & y or Point
+        :type args: 1 or 2 elements list
+        :raise TypeError: Inappropriate or more than 2 arguments
+        passed to function.
+
+        :return: Destination point
+        :rtype: Point
+        """
+
+        if len(args) > 2 or len(args) < 1:
+            raise TypeError('drive() takes from 1 to 2 arguments ')
+
+        if len(args) == 1 and isinstance(args[0], Point):
+            return args[0]
+
+        if len(args) == 2 and all(isinstance(_, int) for _ in args):
+            if self.intern_coordinates:
+                return FrozenPoint.interned(args[0], args[1])
+            return Point(args[0], args[1])
+
+        raise TypeError(f'drive() takes either two integer/float '
+                        f'numbers as some Point coordinates '
+                        f'either one Point class object')
+
+    def try_drive(self, *args):
+        """
+        Make Car to move from current position to received coordinates,
+        reporting the outcome instead of raising.
+
+        :param args: Coordinates as x & y or Point
+        :type args: 1 or 2 elements list
+        :raise TypeError: Inappropriate or more than 2 arguments
+        passed to function.
+
+        :return: MOVED, EMPTY_TANK or INSUFFICIENT_FUEL
+        :rtype: DriveStatus
+        """
+
+        destination = self._parse_destination(args)
+
+        if self._fuel_amount == 0:
+            return DriveStatus.EMPTY_TANK
+
+        fuel_needed = self.compute_fuel_needed(destination)
+
+        if fuel_needed > self._fuel_amount:
+            return DriveStatus.INSUFFICIENT_FUEL
+
+        self._fuel_amount -= fuel_needed
+        self._location = destination
+        return DriveStatus.MOVED
+
     def drive(self, *args):
         """
         Make Car to move from current position to received coordinates.
@@ -132,33 +301,82 @@ class Car:
         :type args: 1 or 2 elements list
         :raise TypeError: Inappropriate or more than 2 arguments
         passed to function.
+        :raise OutOfFuel: Fuel tank is empty
 
         :return: Nothing
         :rtype: None
         """
 
-        if len(args) > 2 or len(args) < 1:
-            raise TypeError('drive() takes from 1 to 2 arguments ')
+        if self.try_drive(*args) is DriveStatus.EMPTY_TANK:
+            raise OutOfFuel('Zero fuel amount in fuel tank')
 
-        if len(args) == 1 and isinstance(args[0], Point):
-            if self._fuel_amount == 0:
-                raise OutOfFuel('Zero fuel amount in fuel tank')
+    def _route_columns(self, waypoints):
+        """
+        Checks if route data of correct Type.
 
-            fuel_needed = self.compute_fuel_needed(args[0])
+        :param waypoints: Route waypoints
+        :type waypoints: sequence of Point or PointArray
+        :raise TypeError: In case waypoints are not Points
 
-            if fuel_needed > self._fuel_amount:
-                return
+        :return: Abscissas, ordinates and Points of waypoints, None instead
+        of Points for PointArray
+        :rtype: tuple
+        """
 
-            self._fuel_amount -= fuel_needed
-            self._location = args[0]
+        columns = getattr(waypoints, 'x', None), getattr(waypoints, 'y', None)
+        if all(hasattr(column, 'tolist') for column in columns):
+            return columns[0].tolist(), columns[1].tolist(), None
 
-        elif len(args) == 2 and all(isinstance(_, int) for _ in args):
-            self.drive(Point(args[0], args[1]))
+        points = list(waypoints)
+        if not all(isinstance(point, Point) for point in points):
+            raise TypeError
 
-        else:
-            raise TypeError(f'drive() takes either two integer/float '
-                            f'numbers as some Point coordinates '
-                            f'either one Point class object')
+        return [point.x for point in points], [point.y for point in points], \
+            points
+
+    def drive_route(self, waypoints):
+        """
+        Make Car to follow route through waypoints in one step. Car stops at
+        the furthest waypoint it has enough fuel to reach without skipping
+        any waypoint on the way, or at the one where its tank gets empty,
+        as driving to waypoints one by one would.
+
+        :param waypoints: Route waypoints
+        :type waypoints: sequence of Point or PointArray
+        :raise TypeError: In case waypoints are not Points
+        :raise OutOfFuel: Fuel tank is empty
+
+        :return: Number of waypoints reached
+        :rtype: int
+        """
+
+        xs, ys, points = self._route_columns(waypoints)
+
+        if not xs:
+            return 0
+        if self._fuel_amount == 0:
+            raise OutOfFuel('Zero fuel amount in fuel tank')
+
+        consumption = self._fuel_consumption
+        measure = (PLANAR if self._metric is None else self._metric).measure
+        starts_x = [self._location.x] + xs[:-1]
+        starts_y = [self._location.y] + ys[:-1]
+        fuel_needed = list(accumulate(
+            measure(x0, y0, x1, y1) * consumption
+            for x0, y0, x1, y1 in zip(starts_x, starts_y, xs, ys)))
+
+        # Tank emptied exactly at a waypoint takes car no further, even to
+        # waypoints at the same place.
+        reached = bisect_left(fuel_needed, self._fuel_amount)
+        if reached < len(fuel_needed) \
+                and fuel_needed[reached] == self._fuel_amount:
+            reached += 1
+        if reached:
+            self._fuel_amount -= fuel_needed[reached - 1]
+            self._location = points[reached - 1] if points is not None \
+                else Point(xs[reached - 1], ys[reached - 1])
+
+        return reached
 
     def refill(self, fuel_amount: int or float):
         """
@@ -195,6 +413,10 @@ class Car:
     def location(self):
         return self._location
 
+    @property
+    def metric(self):
+        return self._metric
+
     @property
     def model(self):
         return self._model
@@ -0,0 +1,248 @@
+from math import inf
+
+from pack.car.car import Car
+from pack.point.grid_index import GridIndex
+from pack.point.metric import require_planar
+from pack.point.point import Point
+
+
+# Max ranges are divisions while reachability is checked with the product
+# compute_fuel_needed() uses, the slack keeps rounding from pruning a car
+# the exact check accepts.
+_RANGE_SLACK = 1 + 1e-9
+
+
+class Dispatcher:
+    """Class keeping cars in a grid index of their locations which finds the
+    nearest cars having enough fuel to reach pickup points.
+
+    The index measures planar distances, so cars of other metrics are not
+    accepted."""
+
+    def _validate_car(self, car):
+        """
+        Checks if car of correct Type.
+
+        :param car: Car to validate
+        :type car: Any
+        :raise TypeError: In case argument is not Car class object
+        :raise ValueError: In case car metric is not planar
+
+        :return: Validated car
+        :rtype: Car
+        """
+
+        if not isinstance(car, Car):
+            raise TypeError
+        require_planar(car.metric, 'Dispatcher')
+
+        return car
+
+    def __init__(self, cars=(), cell_size=None):
+        """
+        Initializer
+
+        :param cars: Cars to dispatch, keyed by position unless a mapping
+        :type cars: iterable of Car or dict
+        :param cell_size: Cell side of the grid index, chosen from cars
+        density by default
+        :type cell_size: int or float
+        :raise TypeError: In case cars are not Cars
+        :raise ValueError: In case some car metric is not planar
+        """
+
+        if not isinstance(cars, dict):
+            cars = dict(enumerate(cars))
+
+        self._cars = {}
+        self._fuel = {}
+        self._max_range = 0
+        for key, car in cars.items():
+            self._cars[key] = self._validate_car(car)
+            self._update_fuel(key, car)
+
+        self._index = GridIndex.from_points(
+            (car.location for car in self._cars.values()), list(self._cars),
+            cell_size)
+
+    def __len__(self):
+        return len(self._cars)
+
+    def __contains__(self, key):
+        return key in self._cars
+
+    def __getitem__(self, key):
+        return self._cars[key]
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)})>'
+
+    def _update_fuel(self, key, car):
+        fuel, consumption = car.fuel_amount, car.fuel_consumption
+        self._fuel[key] = fuel, consumption
+
+        if not fuel:
+            max_range = 0
+        else:
+            max_range = fuel / consumption if consumption else inf
+        self._max_range = max(self._max_range, max_range)
+
+    def add(self, key, car):
+        """
+        Adds car under the key, replacing previous car of the key.
+
+        :param key: Hashable key of car
+        :param car: Car to dispatch
+        :type car: Car
+        :raise TypeError: In case car is not Car class object
+        :raise ValueError: In case car metric is not planar
+        """
+
+        self._cars[key] = self._validate_car(car)
+        self.update(key)
+
+    def remove(self, key):
+        """
+        Stops dispatching car of the key.
+
+        :param key: Key of car
+        :raise KeyError: In case key is not dispatched
+        """
+
+        del self._cars[key]
+        del self._fuel[key]
+        self._index.remove(key)
+
+    def update(self, key):
+        """
+        Brings index up to date with car's location and fuel. Needed only
+        after the car was driven or refilled bypassing the dispatcher.
+
+        :param key: Key of car
+        :raise KeyError: In case key is not dispatched
+        """
+
+        car = self._cars[key]
+        self._index.insert(key, car.location)
+        self._update_fuel(key, car)
+
+    def drive(self, key, *args):
+        """
+        Drives car of the key with Car.drive and updates index.
+
+        :param key: Key of car
+        :param args: Coordinates as x & y or Point
+        :type args: 1 or 2 elements list
+        :raise KeyError: In case key is not dispatched
+        :raise TypeError: Inappropriate or more than 2 arguments
+        passed to function.
+        :raise OutOfFuel: Fuel tank is empty
+        """
+
+        try:
+            self._cars[key].drive(*args)
+        finally:
+            self.update(key)
+
+    def try_drive(self, key, *args):
+        """
+        Drives car of the key with Car.try_drive and updates index.
+
+        :return: Outcome of the drive
+        :rtype: DriveStatus
+        """
+
+        status = self._cars[key].try_drive(*args)
+        self.update(key)
+        return status
+
+    def refill(self, key, fuel_amount):
+        """
+        Refills car of the key with Car.refill and updates index.
+
+        :param key: Key of car
+        :param fuel_amount: Quantity of fuel to be added
+        :type fuel_amount: int or float
+        :raise KeyError: In case key is not dispatched
+        :raise TooMuchFuel: Fuel tank can't take that much fuel
+        """
+
+        try:
+            self._cars[key].refill(fuel_amount)
+        finally:
+            self.update(key)
+
+    def _reachable(self, taken=()):
+        """Returns index filter accepting cars able to drive distance"""
+        fuel = self._fuel
+
+        def accept(key, distance):
+            amount, consumption = fuel[key]
+            # Empty tank moves nowhere, as Car.try_drive has it.
+            return amount > 0 and distance * consumption <= amount \
+                and key not in taken
+
+        return accept
+
+    def nearest(self, pickup: Point, k: int = 1):
+        """
+        Finds k nearest cars able to reach pickup point, that is with fuel
+        in tank and compute_fuel_needed(pickup) not above fuel_amount.
+
+        Index rings are searched outwards from the pickup point, cars
+        further than their max range are skipped and the search stops
+        past the largest max range of all cars.
+
+        :param pickup: Pickup point
+        :type pickup: Point
+        :param k: Number of cars to find
+        :type k: int
+        :raise TypeError: In case pickup is not Point class object
+
+        :return: (key, distance) pairs ordered by distance
+        :rtype: list
+        """
+
+        return self._index.nearest(pickup, k,
+                                   self._max_range * _RANGE_SLACK,
+                                   self._reachable())
+
+    def assign(self, pickups):
+        """
+        Assigns one car per pickup point, in order of pickups, each time
+        the nearest able to reach it among cars not assigned yet.
+
+        Cars are not driven, that is up to the caller.
+
+        :param pickups: Pickup points
+        :type pickups: iterable of Point or PointArray
+        :raise TypeError: In case pickups are not Points
+
+        :return: Key of car per pickup, None when no car can reach it
+        :rtype: list
+        """
+
+        # Driving only lowers ranges, so the bound is only tightened here
+        # instead of after every drive.
+        self._max_range = max((amount / consumption if consumption else inf
+                               for amount, consumption
+                               in self._fuel.values()), default=0)
+
+        taken = set()
+        accept = self._reachable(taken)
+        assigned = []
+        for pickup in pickups:
+            if len(taken) == len(self._cars):
+                assigned.append(None)
+                continue
+
+            found = self._index.nearest(pickup, 1,
+                                        self._max_range * _RANGE_SLACK,
+                                        accept)
+            if found:
+                taken.add(found[0][0])
+                assigned.append(found[0][0])
+            else:
+                assigned.append(None)
+
+        return assigned
@@ -0,0 +1,328 @@
+import heapq
+from itertools import count
+
+from pack.car.car import Car
+from pack.point.point import Point
+
+
+class Event:
+    """Class representing a callback scheduled at a moment of simulated
+    time"""
+
+    __slots__ = ('time', 'callback', 'args', 'cancelled', '_seq')
+
+    def __init__(self, time, callback, args, seq):
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._seq = seq
+
+    def __repr__(self):
+        state = ' cancelled' if self.cancelled else ''
+        return f'<{self.__class__.__name__} [time:{self.time}{state}]>'
+
+
+class Trip:
+    """Class representing a car moving from origin to destination with
+    constant speed and fuel consumption"""
+
+    __slots__ = ('car', 'origin', 'destination', 'start', 'arrival',
+                 'fuel_needed', 'event')
+
+    def __init__(self, car, destination, start, speed):
+        self.car = car
+        self.origin = car.location
+        self.destination = destination
+        self.start = start
+
+        distance = self.origin.distance(destination, car.metric)
+        self.arrival = start + distance / speed
+        self.fuel_needed = distance * car.fuel_consumption
+        self.event = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [{self.origin} -> ' \
+               f'{self.destination}, arrival:{self.arrival}]>'
+
+    def _progress(self, time):
+        if time >= self.arrival:
+            return 1.0
+        return max(time - self.start, 0) / (self.arrival - self.start)
+
+    def location(self, time):
+        """Returns Point the car passes at the moment"""
+        progress = self._progress(time)
+        if progress == 1.0:
+            return self.destination
+
+        origin, destination = self.origin, self.destination
+        return Point(origin.x + (destination.x - origin.x) * progress,
+                     origin.y + (destination.y - origin.y) * progress)
+
+    def fuel_amount(self, time):
+        """Returns fuel left in tank at the moment"""
+        return self.car.fuel_amount - self.fuel_needed * self._progress(time)
+
+
+class Scheduler:
+    """Class representing discrete event simulation of cars moving over
+    time.
+
+    Events run in order of their time, events of the same time in order
+    they were scheduled. Cars on a trip keep their state from the start
+    of the trip, location and fuel in between are interpolated on query
+    or when the trip is stopped, and Car.drive is applied on arrival."""
+
+    fields_types = [int, float]
+
+    def _validate(self, value):
+        """
+        Data type validator.
+
+        :param value: Value to validate
+        :type value: int or float
+        :raise TypeError: If value type is unsupported
+        :rtype: int or float
+        :return: Validated value
+        """
+
+        if type(value) not in self.fields_types:
+            raise TypeError
+
+        return value
+
+    def __init__(self, start=0):
+        """
+        Initializer
+
+        :param start: Initial moment of simulated time
+        :type start: int or float
+        :raise TypeError: If start is not a number
+        """
+
+        self._now = self._validate(start)
+        self._queue = []
+        self._seq = count()
+        self._pending = 0
+        self._trips = {}
+
+    def __len__(self):
+        return self._pending
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [now:{self._now}, ' \
+               f'events:{self._pending}, trips:{len(self._trips)}]>'
+
+    def _push(self, event, time):
+        if self._validate(time) < self._now:
+            raise ValueError('Event can not be scheduled in the past')
+
+        event.time = time
+        event._seq = next(self._seq)
+        heapq.heappush(self._queue, (time, event._seq, event))
+
+    def schedule(self, time, callback, *args):
+        """
+        Schedules callback(*args) at the moment.
+
+        :param time: Moment of simulated time
+        :type time: int or float
+        :param callback: Function to call
+        :type callback: callable
+        :raise TypeError: If time is not a number
+        :raise ValueError: If time is in the past
+
+        :return: Handle of the event
+        :rtype: Event
+        """
+
+        event = Event(time, callback, args, None)
+        self._push(event, time)
+        self._pending += 1
+        return event
+
+    def schedule_in(self, delay, callback, *args):
+        """Schedules callback(*args) delay after the current moment"""
+        return self.schedule(self._now + self._validate(delay), callback,
+                             *args)
+
+    def cancel(self, event):
+        """
+        Cancels pending event. Its queue entry is dropped when popped.
+
+        :param event: Event to cancel
+        :type event: Event
+        """
+
+        if not event.cancelled and event._seq is not None:
+            event.cancelled = True
+            self._pending -= 1
+            self._drop_stale()
+
+    def reschedule(self, event, time):
+        """
+        Moves pending event to another moment. Its old queue entry is
+        dropped when popped.
+
+        :param event: Event to move
+        :type event: Event
+        :param time: New moment of simulated time
+        :type time: int or float
+        :raise ValueError: If event is not pending or time is in the past
+        """
+
+        if event.cancelled or event._seq is None:
+            raise ValueError('Only pending events can be rescheduled')
+
+        self._push(event, time)
+        self._drop_stale()
+
+    def _drop_stale(self):
+        """Drops lazily deleted queue entries once they prevail"""
+        queue = self._queue
+        if len(queue) > 2 * self._pending + 64:
+            # Sliced in place, so a running loop keeps the same list.
+            queue[:] = [entry for entry in queue
+                        if not entry[2].cancelled
+                        and entry[1] == entry[2]._seq]
+            heapq.heapify(queue)
+
+    def step(self):
+        """
+        Runs the next pending event.
+
+        :return: Whether an event was run
+        :rtype: bool
+        """
+
+        queue = self._queue
+        while queue:
+            time, seq, event = heapq.heappop(queue)
+            if event.cancelled or seq != event._seq:
+                continue
+
+            self._now = time
+            event._seq = None
+            self._pending -= 1
+            event.callback(*event.args)
+            return True
+
+        return False
+
+    def run(self, until=None):
+        """
+        Runs pending events in order of time, including events scheduled
+        by running ones.
+
+        :param until: Moment to stop at, all events by default
+        :type until: int or float
+
+        :return: Number of events run
+        :rtype: int
+        """
+
+        queue, pop = self._queue, heapq.heappop
+        done = 0
+        while queue and (until is None or queue[0][0] <= until):
+            time, seq, event = pop(queue)
+            if event.cancelled or seq != event._seq:
+                continue
+
+            self._now = time
+            event._seq = None
+            self._pending -= 1
+            event.callback(*event.args)
+            done += 1
+
+        if until is not None and until > self._now:
+            self._now = until
+
+        return done
+
+    def _validate_trip(self, car, destination, speed):
+        if not isinstance(car, Car) or not isinstance(destination, Point):
+            raise TypeError
+        if not self._validate(speed) > 0:
+            raise ValueError('Speed must be positive')
+
+    def drive(self, car, destination, speed=1, on_arrival=None):
+        """
+        Starts trip of a car to destination, stopping its current trip
+        first. Car.drive is applied when the car arrives.
+
+        :param car: Car to drive
+        :type car: Car
+        :param destination: Destination point
+        :type destination: Point
+        :param speed: Distance covered per unit of time
+        :type speed: int or float
+        :param on_arrival: Called with the car after it arrives
+        :type on_arrival: callable
+        :raise TypeError: In case of incorrect arguments Type
+        :raise ValueError: In case speed is not positive
+        :raise OutOfFuel: Fuel tank is empty
+
+        :return: Started trip, None if fuel is not enough for it
+        :rtype: Trip or None
+        """
+
+        self._validate_trip(car, destination, speed)
+        self.stop(car)
+
+        trip = Trip(car, destination, self._now, speed)
+        if car.fuel_amount == 0:
+            car.drive(destination)
+        if trip.fuel_needed > car.fuel_amount:
+            return None
+
+        trip.event = self.schedule(trip.arrival, self._arrive, trip,
+                                   on_arrival)
+        self._trips[car] = trip
+        return trip
+
+    def _arrive(self, trip, on_arrival):
+        del self._trips[trip.car]
+        trip.car.drive(trip.destination)
+        if on_arrival is not None:
+            on_arrival(trip.car)
+
+    def stop(self, car):
+        """
+        Stops trip of a car where the car is at the moment.
+
+        :param car: Car to stop
+        :type car: Car
+
+        :return: Stopped trip, None if the car was not on a trip
+        :rtype: Trip or None
+        """
+
+        trip = self._trips.pop(car, None)
+        if trip is None:
+            return None
+
+        self.cancel(trip.event)
+        car.fuel_amount = trip.fuel_amount(self._now)
+        car.location = trip.location(self._now)
+
+        return trip
+
+    def trip(self, car):
+        """Returns current trip of a car, None if it is not on a trip"""
+        return self._trips.get(car)
+
+    def location(self, car):
+        """Returns Point where a car is at the moment"""
+        trip = self._trips.get(car)
+        return car.location if trip is None else trip.location(self._now)
+
+    def fuel_amount(self, car):
+        """Returns fuel left in car's tank at the moment"""
+        trip = self._trips.get(car)
+        return car.fuel_amount if trip is None \
+            else trip.fuel_amount(self._now)
+
+    @property
+    def now(self):
+        return self._now
@@ -0,0 +1,246 @@
+import numpy as np
+
+from pack.car.car import Car, DriveStatus, RefillStatus
+from pack.point.metric import require_planar
+from pack.point.point import Point
+from pack.point.point_array import PointArray, hypot
+
+
+def drive_arrays(x, y, fuel, consumption, dest_x, dest_y, where=None):
+    """
+    Applies Car.drive rules to columns of car state in place.
+
+    Cars with empty tank and cars lacking fuel for the trip stay where
+    they are, the rest move to destination and burn the fuel needed.
+
+    :param x: Abscissas of cars' locations, updated in place
+    :type x: numpy.ndarray
+    :param y: Ordinates of cars' locations, updated in place
+    :type y: numpy.ndarray
+    :param fuel: Fuel amounts, updated in place
+    :type fuel: numpy.ndarray
+    :param consumption: Fuel consumption per unit of distance
+    :type consumption: numpy.ndarray
+    :param dest_x: Abscissas of destinations
+    :type dest_x: numpy.ndarray or float
+    :param dest_y: Ordinates of destinations
+    :type dest_y: numpy.ndarray or float
+    :param where: Mask of cars to drive, all cars by default
+    :type where: numpy.ndarray
+
+    :return: DriveStatus code of every car, SKIPPED for masked out ones
+    :rtype: numpy.ndarray
+    """
+
+    fuel_needed = hypot(x - dest_x, y - dest_y) * consumption
+    empty = fuel == 0
+    short = ~empty & (fuel_needed > fuel)
+    moved = ~(empty | short)
+    if where is not None:
+        moved &= where
+        empty &= where
+        short &= where
+
+    np.subtract(fuel, fuel_needed, out=fuel, where=moved)
+    np.copyto(x, dest_x, where=moved)
+    np.copyto(y, dest_y, where=moved)
+
+    status = np.full(len(fuel), DriveStatus.MOVED, dtype=np.int8)
+    status[empty] = DriveStatus.EMPTY_TANK
+    status[short] = DriveStatus.INSUFFICIENT_FUEL
+    if where is not None:
+        status[~where] = DriveStatus.SKIPPED
+    return status
+
+
+class CarFleet:
+    """Class representing many cars kept as columns of their state"""
+
+    dtype = np.float64
+
+    def _validate_numeric(self, values, size=None):
+        """
+        Checks if column of numbers of correct Type.
+
+        :param values: Numbers to validate, single number is broadcast
+        :type values: Any
+        :param size: Expected column length
+        :type size: int
+        :raise TypeError: In case values are not int or float numbers
+        :raise ValueError: In case column is of wrong length
+
+        :return: Validated float64 column
+        :rtype: numpy.ndarray
+        """
+
+        column = np.asarray(values)
+
+        if column.dtype.kind not in 'iuf' or column.ndim > 1:
+            raise TypeError
+
+        size = len(self) if size is None else size
+        column = np.array(np.broadcast_to(column, (size,)), dtype=self.dtype)
+        return column
+
+    def _validate_destinations(self, destinations):
+        """
+        Checks if destinations data of correct Type.
+
+        :param destinations: Single Point for all cars or one per car
+        :type destinations: Point or PointArray
+        :raise TypeError: In case argument is neither Point nor PointArray
+        :raise ValueError: In case PointArray is of wrong length
+
+        :return: Destination coordinates
+        :rtype: tuple
+        """
+
+        if isinstance(destinations, Point):
+            return float(destinations.x), float(destinations.y)
+
+        if not isinstance(destinations, PointArray):
+            raise TypeError
+        if len(destinations) != len(self):
+            raise ValueError('One destination per car expected')
+
+        return destinations.x, destinations.y
+
+    def __init__(self, capacities, consumptions, locations=None,
+                 fuel_amounts=0, models=None):
+        """
+        Initializer
+
+        :param capacities: Capacities of FuelTanks
+        :type capacities: sequence or numpy.ndarray
+        :param consumptions: Fuel consumption per unit of distance
+        :type consumptions: sequence or numpy.ndarray
+        :param locations: Cars' locations, origin by default
+        :type locations: PointArray
+        :param fuel_amounts: Fuel in tanks, empty tanks by default
+        :type fuel_amounts: sequence or numpy.ndarray
+        :param models: Cars' model names
+        :type models: sequence of str
+        :raise TypeError: object instantiated with incorrect data
+        """
+
+        size = len(capacities)
+
+        self._fuel_capacity = self._validate_numeric(capacities, size)
+        self._fuel_consumption = self._validate_numeric(consumptions, size)
+        self._fuel_amount = self._validate_numeric(fuel_amounts, size)
+
+        if locations is None:
+            locations = PointArray(np.zeros(size), np.zeros(size))
+        if not isinstance(locations, PointArray):
+            raise TypeError
+        if len(locations) != size:
+            raise ValueError('One location per car expected')
+
+        self._x = locations.x.copy()
+        self._y = locations.y.copy()
+        self._models = ['Trash'] * size if models is None else list(models)
+
+    @classmethod
+    def from_cars(cls, cars):
+        """
+        Builds fleet from Car objects.
+
+        :param cars: Cars to be stored
+        :type cars: iterable of Car
+        :raise TypeError: If any item is not a Car
+        :raise ValueError: If metric of any car is not planar, as columns
+        are driven with planar distances
+        :rtype: CarFleet
+        """
+
+        cars = list(cars)
+
+        if not all(isinstance(car, Car) for car in cars):
+            raise TypeError
+        for car in cars:
+            require_planar(car.metric, 'CarFleet')
+
+        return cls([car.fuel_capacity for car in cars],
+                   [car.fuel_consumption for car in cars],
+                   PointArray.from_points(car.location for car in cars),
+                   [car.fuel_amount for car in cars],
+                   [car.model for car in cars])
+
+    def to_cars(self):
+        """Returns list of Cars with the same state"""
+        cars = Car.bulk(self._fuel_capacity, self._fuel_consumption,
+                        Point.from_arrays(self._x, self._y), self._models)
+        for car, fuel in zip(cars, self._fuel_amount.tolist()):
+            car.fuel_amount = fuel
+
+        return cars
+
+    def __len__(self):
+        return len(self._fuel_amount)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)})>'
+
+    def drive_all(self, destinations, where=None):
+        """
+        Make every car move to its destination, following Car.drive rules.
+
+        :param destinations: Single Point for all cars or one per car
+        :type destinations: Point or PointArray
+        :param where: Mask of cars to drive, all cars by default
+        :type where: numpy.ndarray
+        :raise TypeError: Inappropriate destinations passed to function.
+
+        :return: DriveStatus code of every car, SKIPPED for masked out ones
+        :rtype: numpy.ndarray
+        """
+
+        dest_x, dest_y = self._validate_destinations(destinations)
+        return drive_arrays(self._x, self._y, self._fuel_amount,
+                            self._fuel_consumption, dest_x, dest_y, where)
+
+    def refill_all(self, amounts):
+        """
+        Refill every car's fuel tank, following Car.refill rules.
+
+        Cars which can't take the whole amount are left untouched.
+
+        :param amounts: Quantity of fuel to be added, one or per car
+        :type amounts: int, float, sequence or numpy.ndarray
+        :raise TypeError: In case amounts are not int or float numbers
+
+        :return: RefillStatus code of every car
+        :rtype: numpy.ndarray
+        """
+
+        amounts = self._validate_numeric(amounts)
+        overload = amounts > self._fuel_capacity - self._fuel_amount
+
+        np.add(self._fuel_amount, amounts, out=self._fuel_amount,
+               where=~overload)
+        np.minimum(self._fuel_amount, self._fuel_capacity,
+                   out=self._fuel_amount)
+
+        status = np.full(len(self), RefillStatus.REFILLED, dtype=np.int8)
+        status[overload] = RefillStatus.TOO_MUCH_FUEL
+        return status
+
+    @property
+    def fuel_amount(self):
+        return self._fuel_amount
+
+    @property
+    def fuel_capacity(self):
+        return self._fuel_capacity
+
+    @property
+    def fuel_consumption(self):
+        return self._fuel_consumption
+
+    @property
+    def location(self):
+        return PointArray._wrap(self._x, self._y)
+
+    @property
+    def models(self):
+        return self._models
@@ -0,0 +1,261 @@
+import csv
+import json
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+
+from pack.car.car import OutOfFuel
+from pack.point.point_array import PointArray
+
+
+Chunk = namedtuple('Chunk', ['ids', 'x', 'y', 'rejects'])
+Chunk.__doc__ = """Parsed block of telemetry fixes.
+
+Attributes:
+    ids -- car id of every valid fix
+    x -- abscissas of valid fixes
+    y -- ordinates of valid fixes
+    rejects -- number of rows which failed parsing or validation
+"""
+
+# Coordinates must be of these types, as Point requires.
+_FIELDS_TYPES = (int, float)
+# Car ids of JSON telemetry must be of these types.
+_KEY_TYPES = (str, int)
+
+
+@contextmanager
+def _opened(source):
+    """Opens path for reading, passes file objects through untouched"""
+    if hasattr(source, 'read'):
+        yield source
+        return
+
+    with open(source, newline='') as file:
+        yield file
+
+
+def _number(text):
+    """Parses int or float, raises ValueError for anything else"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _chunk(ids, xs, ys, rejects):
+    return Chunk(ids, np.array(xs, dtype=np.float64),
+                 np.array(ys, dtype=np.float64), rejects)
+
+
+def read_csv(source, chunk_size=65536, columns=('car_id', 'x', 'y'),
+             header=True):
+    """
+    Reads CSV telemetry lazily, chunk_size rows at a time.
+
+    Rows of wrong length and coordinates which are neither int nor float
+    are counted as rejects instead of being parsed.
+
+    :param source: Path or text file object
+    :type source: str or file
+    :param chunk_size: Number of rows per chunk
+    :type chunk_size: int
+    :param columns: Names of car id, abscissa and ordinate columns
+    :type columns: tuple
+    :param header: Whether the first row names columns, otherwise they
+    are the first three
+    :type header: bool
+    :raise ValueError: In case header lacks some of columns
+
+    :return: Parsed chunks
+    :rtype: generator of Chunk
+    """
+
+    with _opened(source) as file:
+        rows = csv.reader(file)
+        fields = (0, 1, 2)
+        if header:
+            names = next(rows, [])
+            if not set(columns) <= set(names):
+                raise ValueError(f'Columns {columns} expected in header')
+            fields = tuple(names.index(name) for name in columns)
+
+        width = max(fields) + 1
+        key_field, x_field, y_field = fields
+        while True:
+            block = list(islice(rows, chunk_size))
+            if not block:
+                return
+
+            ids, xs, ys, rejects = [], [], [], 0
+            for row in block:
+                if len(row) < width:
+                    rejects += 1
+                    continue
+                try:
+                    x, y = _number(row[x_field]), _number(row[y_field])
+                except ValueError:
+                    rejects += 1
+                    continue
+                ids.append(row[key_field])
+                xs.append(x)
+                ys.append(y)
+
+            yield _chunk(ids, xs, ys, rejects)
+
+
+def read_ndjson(source, chunk_size=65536, fields=('car_id', 'x', 'y')):
+    """
+    Reads newline delimited JSON telemetry lazily, chunk_size lines at a
+    time. Blank lines are skipped.
+
+    Lines which are not JSON objects, lack some of fields, have car id
+    which is neither str nor int or coordinates which are neither int nor
+    float are counted as rejects.
+
+    :param source: Path or text file object
+    :type source: str or file
+    :param chunk_size: Number of lines per chunk
+    :type chunk_size: int
+    :param fields: Names of car id, abscissa and ordinate fields
+    :type fields: tuple
+
+    :return: Parsed chunks
+    :rtype: generator of Chunk
+    """
+
+    key_field, x_field, y_field = fields
+    with _opened(source) as file:
+        while True:
+            block = list(islice(file, chunk_size))
+            if not block:
+                return
+
+            ids, xs, ys, rejects = [], [], [], 0
+            for line in block:
+                if not line.strip():
+                    continue
+                try:
+                    fix = json.loads(line)
+                    key, x, y = fix[key_field], fix[x_field], fix[y_field]
+                except (ValueError, KeyError, TypeError):
+                    rejects += 1
+                    continue
+                if type(key) not in _KEY_TYPES \
+                        or type(x) not in _FIELDS_TYPES \
+                        or type(y) not in _FIELDS_TYPES:
+                    rejects += 1
+                    continue
+                ids.append(key)
+                xs.append(x)
+                ys.append(y)
+
+            yield _chunk(ids, xs, ys, rejects)
+
+
+class IngestStats:
+    """Class representing counters of an ingestion run"""
+
+    def __init__(self):
+        self.rows = 0
+        self.applied = 0
+        self.rejects = 0
+        self.unknown = 0
+        self.out_of_fuel = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [rows:{self.rows}, ' \
+               f'rejects:{self.rejects}, out of fuel:{self.out_of_fuel}, ' \
+               f'rows/sec:{self.rows_per_second:.0f}]>'
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def drive_fixes(car, xs, ys, window=256):
+    """
+    Drives a car through fixes in order with Car.drive_route, skipping
+    fixes it has not enough fuel to reach, like a Car.drive per fix would.
+
+    :param car: Car to drive
+    :type car: Car
+    :param xs: Abscissas of fixes
+    :type xs: numpy.ndarray
+    :param ys: Ordinates of fixes
+    :type ys: numpy.ndarray
+    :param window: Most fixes passed to one drive_route call, bounds the
+    work redone after every skipped fix
+    :type window: int
+
+    :return: Number of fixes skipped for lack of fuel
+    :rtype: int
+    """
+
+    start, skipped = 0, 0
+    while start < len(xs):
+        stop = start + window
+        try:
+            reached = car.drive_route(PointArray._wrap(xs[start:stop],
+                                                       ys[start:stop]))
+        except OutOfFuel:
+            return skipped + len(xs) - start
+
+        start += reached
+        if start < min(stop, len(xs)):
+            skipped += 1
+            start += 1
+
+    return skipped
+
+
+def ingest(cars, chunks, stats=None):
+    """
+    Applies telemetry fixes to cars chunk by chunk, so memory use does not
+    depend on the number of fixes.
+
+    Fixes of every chunk are grouped by car id as is, so that int 1 and
+    str '1' are different cars, keeping their order, and each group is
+    driven with drive_fixes().
+
+    :param cars: Cars by id, ids as they come in telemetry
+    :type cars: dict
+    :param chunks: Parsed telemetry, from read_csv() or read_ndjson()
+    :type chunks: iterable of Chunk
+    :param stats: Counters to add to, new ones by default
+    :type stats: IngestStats
+
+    :return: Counters of rows, rejects, fixes of unknown cars and fixes
+    skipped for lack of fuel
+    :rtype: IngestStats
+    """
+
+    stats = IngestStats() if stats is None else stats
+    started = perf_counter()
+
+    for chunk in chunks:
+        stats.rows += len(chunk.ids) + chunk.rejects
+        stats.rejects += chunk.rejects
+        if not chunk.ids:
+            continue
+
+        groups = {}
+        for index, key in enumerate(chunk.ids):
+            groups.setdefault(key, []).append(index)
+
+        for key, group in groups.items():
+            car = cars.get(key)
+            if car is None:
+                stats.unknown += len(group)
+                continue
+
+            skipped = drive_fixes(car, chunk.x[group], chunk.y[group])
+            stats.out_of_fuel += skipped
+            stats.applied += len(group) - skipped
+
+    stats.seconds += perf_counter() - started
+    return stats
@@ -0,0 +1,286 @@
+import heapq
+from collections import namedtuple
+from math import inf, nextafter
+
+from pack.car.car import Car
+from pack.point.grid_index import GridIndex
+from pack.point.metric import require_planar
+from pack.point.point import Point
+
+
+class Error(Exception):
+    """Base class for exceptions in this module."""
+    pass
+
+
+class Unreachable(Error):
+    """Exception raised in case destination can't be reached with refuels
+    at available stations.
+
+    Attributes:
+        message -- explanation or specific details of the error
+    """
+
+    def __init__(self, message=None):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = 'Destination is unreachable.'
+
+
+RoutePlan = namedtuple('RoutePlan', ['stops', 'refills', 'distance'])
+RoutePlan.__doc__ = """Route of a car through refuel stations.
+
+Attributes:
+    stops -- Points to drive to one after another, destination is the last
+    refills -- fuel to refill before driving to every stop
+    distance -- total path length
+"""
+
+_START, _GOAL = -1, -2
+
+
+def _validate_car(car):
+    """
+    Checks if car of correct Type.
+
+    :param car: Car to validate
+    :type car: Any
+    :raise TypeError: In case argument is not Car class object
+    :raise ValueError: In case car metric is not planar, as distances
+    between stations are
+
+    :return: Validated car
+    :rtype: Car
+    """
+
+    if not isinstance(car, Car):
+        raise TypeError
+    require_planar(car.metric, 'Route planning')
+
+    return car
+
+
+def _validate_point(point):
+    """
+    Checks if point of correct Type.
+
+    :param point: Point to validate
+    :type point: Any
+    :raise TypeError: In case argument is not Point class object
+
+    :return: Validated point
+    :rtype: Point
+    """
+
+    if not isinstance(point, Point):
+        raise TypeError
+
+    return point
+
+
+def refill_needed(fuel, fuel_needed, capacity):
+    """
+    Computes refill letting a car with fuel in tank drive a leg needing
+    fuel_needed, rounded up so that fuel + refill >= fuel_needed holds in
+    float arithmetic and capped by free tank space.
+
+    :param fuel: Fuel in tank
+    :type fuel: int or float
+    :param fuel_needed: Fuel needed for the leg
+    :type fuel_needed: int or float
+    :param capacity: Fuel tank capacity
+    :type capacity: int or float
+
+    :return: Fuel to refill, 0 if there is enough fuel
+    :rtype: int or float
+    """
+
+    if fuel_needed <= fuel and fuel > 0:
+        return 0
+
+    refill = max(fuel_needed - fuel, 0)
+    while fuel + refill < fuel_needed or fuel + refill == 0:
+        refill = nextafter(refill, inf)
+
+    return min(refill, capacity - fuel)
+
+
+class RoutePlanner:
+    """Class planning cheapest routes of cars through refuel stations"""
+
+    def __init__(self, stations, cell_size=None):
+        """
+        Initializer
+
+        :param stations: Refuel stations
+        :type stations: iterable of Point
+        :param cell_size: Cell side of stations grid index
+        :type cell_size: int or float
+        :raise TypeError: In case stations are not Points
+        """
+
+        self._stations = list(stations)
+        self._index = GridIndex.from_points(self._stations,
+                                            cell_size=cell_size)
+
+    def __len__(self):
+        return len(self._stations)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)})>'
+
+    def _search(self, origin, fuel, capacity, consumption, destination,
+                reserve=0):
+        """
+        Finds the shortest path from origin to destination with A* over
+        stations reachable from each other with a full tank, arriving at
+        destination with at least reserve fuel left.
+
+        :return: Nodes of the path without origin and path length
+        :rtype: tuple
+        :raise Unreachable: In case there is no path
+        """
+
+        stations = self._stations
+
+        def point(node):
+            if node == _START:
+                return origin
+            if node == _GOAL:
+                return destination
+            return stations[node]
+
+        def neighbours(node, tank):
+            location = point(node)
+            distance = location.distance(destination)
+            if tank - distance * consumption >= reserve:
+                yield _GOAL, distance
+            if not consumption > 0:
+                return
+            for station, distance in self._index.within(
+                    location, float(tank / consumption)):
+                if station != node and distance * consumption <= tank:
+                    yield station, distance
+
+        graph = {}
+        best = {_START: 0}
+        parents = {}
+        queue = [(origin.distance(destination), 0, _START)]
+
+        while queue:
+            _, length, node = heapq.heappop(queue)
+            if node == _GOAL:
+                break
+            if length > best[node]:
+                continue
+
+            if node not in graph:
+                tank = fuel if node == _START else capacity
+                graph[node] = list(neighbours(node, tank)) \
+                    if tank > 0 else []
+
+            for neighbour, distance in graph[node]:
+                candidate = length + distance
+                if candidate < best.get(neighbour, inf):
+                    best[neighbour] = candidate
+                    parents[neighbour] = node
+                    estimate = point(neighbour).distance(destination)
+                    heapq.heappush(queue, (candidate + estimate, candidate,
+                                           neighbour))
+        else:
+            raise Unreachable()
+
+        path = [_GOAL]
+        while path[-1] != _START:
+            path.append(parents[path[-1]])
+
+        return path[-2::-1], best[_GOAL]
+
+    def nearest_fuel(self, car, point):
+        """
+        Computes fuel a car needs to get from point to the nearest station.
+
+        :param car: Car to compute fuel for
+        :type car: Car
+        :param point: Point to start from
+        :type point: Point
+        :raise TypeError: In case of incorrect arguments Type
+        :raise ValueError: In case car metric is not planar
+
+        :return: Fuel needed, inf if there are no stations
+        :rtype: float
+        """
+
+        car = _validate_car(car)
+        nearest = self._index.nearest(_validate_point(point))
+        if not nearest:
+            return inf
+
+        return nearest[0][1] * car.fuel_consumption
+
+    def plan(self, car, destination, reserve=0):
+        """
+        Plans the shortest route of a car to destination, refueling at
+        stations whenever fuel in tank is not enough for the next leg.
+
+        :param car: Car to plan the route for
+        :type car: Car
+        :param destination: Destination point
+        :type destination: Point
+        :param reserve: Fuel to have left on arrival at destination
+        :type reserve: int or float
+        :raise TypeError: In case of incorrect arguments Type
+        :raise ValueError: In case reserve is negative or car metric is not
+        planar
+        :raise Unreachable: In case destination can't be reached
+
+        :return: Stops with refills before every leg
+        :rtype: RoutePlan
+        """
+
+        car = _validate_car(car)
+        destination = _validate_point(destination)
+        if not reserve >= 0:
+            raise ValueError('Reserve must not be negative')
+
+        if car.location == destination and car.fuel_amount >= reserve:
+            return RoutePlan([], [], 0)
+
+        nodes, distance = self._search(car.location, car.fuel_amount,
+                                       car.fuel_capacity,
+                                       car.fuel_consumption, destination,
+                                       reserve)
+
+        stops = [destination if node == _GOAL else self._stations[node]
+                 for node in nodes]
+        refills = []
+        location, fuel = car.location, car.fuel_amount
+        for leg, stop in enumerate(stops):
+            fuel_needed = location.distance(stop) * car.fuel_consumption
+            if leg == len(stops) - 1:
+                fuel_needed += reserve
+            refill = refill_needed(fuel, fuel_needed, car.fuel_capacity) \
+                if leg else 0
+            refills.append(refill)
+            fuel = fuel + refill - fuel_needed
+            location = stop
+
+        return RoutePlan(stops, refills, distance)
+
+
+def execute(car, plan):
+    """
+    Drives a car along a planned route.
+
+    :param car: Car to drive
+    :type car: Car
+    :param plan: Planned route
+    :type plan: RoutePlan
+    :raise OutOfFuel, TooMuchFuel: Plan doesn't fit car's state
+    """
+
+    for refill, stop in zip(plan.refills, plan.stops):
+        if refill:
+            car.refill(refill)
+        car.drive(stop)
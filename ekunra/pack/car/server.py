@@ -0,0 +1,246 @@
+import asyncio
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+
+from pack.car.car import Car, RefillStatus, TooMuchFuel
+
+
+def _drive(car, *args):
+    """Drives car, reporting outcome as status instead of raising"""
+    return car.try_drive(*args)
+
+
+def _drive_route(car, waypoints):
+    """Drives car along route, returns number of waypoints reached"""
+    return car.drive_route(waypoints)
+
+
+def _refill(car, fuel_amount):
+    """Refills car, reporting overload as status instead of raising"""
+    try:
+        car.refill(fuel_amount)
+    except TooMuchFuel:
+        return RefillStatus.TOO_MUCH_FUEL
+
+    return RefillStatus.REFILLED
+
+
+# Commands clients may send, applied as action(car, *args). Methods are
+# looked up on every call, so patches of Car, such as instrumentation,
+# apply to commands too.
+ACTIONS = {
+    'drive': _drive,
+    'refill': _refill,
+    'drive_route': _drive_route,
+}
+
+
+def _apply(action, car, args):
+    """
+    Applies action to car.
+
+    Errors are returned rather than raised out of the shard task, so their
+    traceback starts here and doesn't hold the suspended frame of the task,
+    which clearing it, as unittest does, would close.
+
+    :return: Result of the action and error it raised, one of them None
+    :rtype: tuple
+    """
+
+    try:
+        return action(car, *args), None
+    except Exception as error:
+        return None, error
+
+
+class FleetServer:
+    """Class applying commands of concurrent clients to cars.
+
+    Cars are sharded by key, every shard has a bounded queue drained by
+    its own task, so commands to one car are applied in order they were
+    submitted while shards make progress independently. Submitting waits
+    while the shard queue is full."""
+
+    def __init__(self, cars, shards=4, queue_size=1024, batch_size=64,
+                 latency_window=100000):
+        """
+        Initializer
+
+        :param cars: Cars to serve, keyed by position unless a mapping
+        :type cars: iterable of Car or dict
+        :param shards: Number of shards
+        :type shards: int
+        :param queue_size: Capacity of every shard queue
+        :type queue_size: int
+        :param batch_size: Most commands applied per shard in one go
+        :type batch_size: int
+        :param latency_window: Number of latest commands latency
+        percentiles are computed over
+        :type latency_window: int
+        :raise TypeError: In case cars are not Cars
+        """
+
+        if not isinstance(cars, dict):
+            cars = dict(enumerate(cars))
+        if not all(isinstance(car, Car) for car in cars.values()):
+            raise TypeError
+
+        self._cars = cars
+        self._shards = shards
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._latencies = deque(maxlen=latency_window)
+        self._queues = []
+        self._workers = []
+        self._processed = 0
+
+    def __len__(self):
+        return len(self._cars)
+
+    def __getitem__(self, key):
+        return self._cars[key]
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)}, ' \
+               f'shards={self._shards})>'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """Starts shard tasks in the running event loop"""
+        if self._workers:
+            raise RuntimeError('Server is already running')
+
+        self._queues = [asyncio.Queue(self._queue_size)
+                        for _ in range(self._shards)]
+        self._workers = [asyncio.create_task(self._work(queue))
+                         for queue in self._queues]
+
+    async def stop(self):
+        """Applies commands already submitted and stops shard tasks"""
+        queues, workers = self._queues, self._workers
+        self._queues, self._workers = [], []
+
+        for queue in queues:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+
+    def shard(self, key):
+        """Returns number of the shard serving car of the key"""
+        return hash(key) % self._shards
+
+    async def submit(self, key, action, *args):
+        """
+        Applies command to car of the key once its shard gets to it.
+
+        :param key: Key of car
+        :param action: Name of action, one of ACTIONS
+        :type action: str
+        :param args: Arguments of the action
+        :raise KeyError: In case key is not served
+        :raise ValueError: In case action is unknown
+        :raise RuntimeError: In case server is not running
+
+        :return: Result of the action, or raises what it raised
+        :rtype: Any
+        """
+
+        car = self._cars[key]
+        if action not in ACTIONS:
+            raise ValueError(f'Unknown action {action!r}')
+        if not self._queues:
+            raise RuntimeError('Server is not running')
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[self.shard(key)].put(
+            (car, ACTIONS[action], args, future, perf_counter()))
+        return await future
+
+    async def _work(self, queue):
+        latencies = self._latencies
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for item in batch:
+                if item is None:
+                    return
+
+                car, action, args, future, submitted = item
+                if future.cancelled():
+                    continue
+                result, error = _apply(action, car, args)
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+                latencies.append(perf_counter() - submitted)
+                self._processed += 1
+
+            # Lets clients and other shards run between batches.
+            await asyncio.sleep(0)
+
+    def latency(self, percentiles=(50, 90, 99)):
+        """
+        Computes percentiles of latest commands latency, from submission
+        to result, including waiting for a place in the queue.
+
+        :param percentiles: Percentiles to compute
+        :type percentiles: sequence of int or float
+
+        :return: Seconds per percentile, empty if nothing was applied
+        :rtype: dict
+        """
+
+        if not self._latencies:
+            return {}
+
+        values = np.percentile(np.fromiter(self._latencies, dtype=float),
+                               percentiles)
+        return dict(zip(percentiles, values.tolist()))
+
+    @property
+    def processed(self):
+        return self._processed
+
+    @property
+    def running(self):
+        return bool(self._workers)
+
+
+class FleetClient:
+    """Class sending commands to an in-process FleetServer"""
+
+    def __init__(self, server):
+        """
+        Initializer
+
+        :param server: Server to send commands to
+        :type server: FleetServer
+        :raise TypeError: In case server is not FleetServer
+        """
+
+        if not isinstance(server, FleetServer):
+            raise TypeError
+
+        self._server = server
+
+    async def drive(self, key, *args):
+        """Drives car of the key, returns DriveStatus"""
+        return await self._server.submit(key, 'drive', *args)
+
+    async def refill(self, key, fuel_amount):
+        """Refills car of the key, returns RefillStatus"""
+        return await self._server.submit(key, 'refill', fuel_amount)
+
+    async def drive_route(self, key, waypoints):
+        """Drives car of the key along route, returns waypoints reached"""
+        return await self._server.submit(key, 'drive_route', waypoints)
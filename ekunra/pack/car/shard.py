@@ -0,0 +1,466 @@
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from pack.car.car import DriveStatus
+from pack.car.fleet import CarFleet, drive_arrays
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+class Error(Exception):
+    """Base class for exceptions in this module."""
+    pass
+
+
+class ShardOverflow(Error):
+    """Exception raised in case cars handed off to a shard do not fit in
+    its capacity.
+
+    Attributes:
+        message -- explanation or specific details of the error
+    """
+
+    def __init__(self, message=None):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = 'Shard capacity is exceeded.'
+
+
+class WorkerFailed(Error):
+    """Exception raised in case a shard worker process failed.
+
+    Attributes:
+        message -- explanation or specific details of the error
+    """
+
+    def __init__(self, message=None):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = 'Shard worker failed.'
+
+
+# Rows of shard blocks, one column per car.
+ID, X, Y, FUEL, CAPACITY, CONSUMPTION, DEST_X, DEST_Y, REFILL = range(9)
+ROWS = 9
+
+# Fields of every shard in the control block. Counts of one step.
+(COUNT, OUTBOX, MOVED, EMPTY_TANK, INSUFFICIENT_FUEL, REFILLED,
+ TOO_MUCH_FUEL, HANDED_OFF, FAILURE) = range(9)
+FIELDS = 9
+
+# Values of FAILURE field.
+OVERFLOW, CRASHED = 1, 2
+
+STATS = {'moved': MOVED, 'empty_tank': EMPTY_TANK,
+         'insufficient_fuel': INSUFFICIENT_FUEL, 'refilled': REFILLED,
+         'too_much_fuel': TOO_MUCH_FUEL, 'handed_off': HANDED_OFF}
+
+
+def _views(control, blocks, shards, capacity):
+    """Returns control array and (cars, outbox) arrays of every shard"""
+    control = np.ndarray((shards + 1, FIELDS), dtype=np.int64,
+                         buffer=control.buf)
+    views = [np.ndarray((2, ROWS, capacity), dtype=np.float64,
+                        buffer=block.buf) for block in blocks]
+    return control, views
+
+
+def _apply(state, counts):
+    """Refills and drives cars of shard in place, following Car rules"""
+    amounts = state[REFILL]
+    wanted = amounts > 0
+    overload = wanted & (amounts > state[CAPACITY] - state[FUEL])
+    refilled = wanted & ~overload
+
+    np.add(state[FUEL], amounts, out=state[FUEL], where=refilled)
+    np.minimum(state[FUEL], state[CAPACITY], out=state[FUEL])
+    amounts[:] = 0
+
+    status = drive_arrays(state[X], state[Y], state[FUEL],
+                          state[CONSUMPTION], state[DEST_X], state[DEST_Y])
+    moved, empty, short = np.bincount(status, minlength=3)[
+        [DriveStatus.MOVED, DriveStatus.EMPTY_TANK,
+         DriveStatus.INSUFFICIENT_FUEL]]
+
+    counts[MOVED] = moved
+    counts[EMPTY_TANK] = empty
+    counts[INSUFFICIENT_FUEL] = short
+    counts[REFILLED] = np.count_nonzero(refilled)
+    counts[TOO_MUCH_FUEL] = np.count_nonzero(overload)
+
+
+def _post(shard, edges, cars, outbox, counts):
+    """Moves cars which left region of the shard to its outbox"""
+    count = counts[COUNT]
+    state = cars[:, :count]
+    leaving = np.searchsorted(edges, state[X], side='right') != shard
+
+    left = np.count_nonzero(leaving)
+    outbox[:, :left] = state[:, leaving]
+
+    # Cars staying beyond the new count fill the holes of leaving ones.
+    kept = count - left
+    holes = np.flatnonzero(leaving[:kept])
+    cars[:, holes] = state[:, kept + np.flatnonzero(~leaving[kept:])]
+    counts[COUNT] = kept
+    counts[OUTBOX] = left
+
+
+def _collect(shard, edges, control, views, capacity):
+    """
+    Takes cars which entered region of the shard from outboxes of others.
+
+    :return: Whether they all fit in capacity
+    :rtype: bool
+    """
+
+    cars, counts = views[shard][0], control[shard]
+    for other, (_, outbox) in enumerate(views):
+        if other == shard or not control[other, OUTBOX]:
+            continue
+
+        posted = outbox[:, :control[other, OUTBOX]]
+        entering = np.searchsorted(edges, posted[X], side='right') == shard
+        entered = np.count_nonzero(entering)
+        if not entered:
+            continue
+
+        count = counts[COUNT]
+        if count + entered > capacity:
+            return False
+        cars[:, count:count + entered] = posted[:, entering]
+        counts[COUNT] = count + entered
+        counts[HANDED_OFF] += entered
+
+    return True
+
+
+def _work(shard, edges, control_name, block_names, capacity, barrier):
+    """
+    Step loop of shard worker process.
+
+    Every step is three barrier phases: the parent lets workers go, every
+    worker applies refills and drives to its cars and posts the ones
+    which left its region to its outbox, then takes the ones entering
+    its region from outboxes of others. The parent only touches blocks
+    between steps.
+    """
+
+    # Workers share resource tracker of the parent, which unlinks blocks.
+    # Failing to attach aborts the barrier, so the parent doesn't wait for
+    # a worker which never comes.
+    blocks = []
+    try:
+        for name in [control_name] + list(block_names):
+            blocks.append(SharedMemory(name))
+    except BaseException:
+        barrier.abort()
+        for block in blocks:
+            block.close()
+        raise
+
+    control_block, blocks = blocks[0], blocks[1:]
+    control, views = _views(control_block, blocks, len(blocks), capacity)
+    counts, stop = control[shard], control[-1]
+    cars, outbox = views[shard]
+
+    try:
+        while True:
+            barrier.wait()
+            if stop[0]:
+                return
+
+            counts[HANDED_OFF] = 0
+            _apply(cars[:, :counts[COUNT]], counts)
+            _post(shard, edges, cars, outbox, counts)
+            barrier.wait()
+
+            if not _collect(shard, edges, control, views, capacity):
+                counts[FAILURE] = OVERFLOW
+                barrier.abort()
+                return
+            barrier.wait()
+    except BrokenBarrierError:
+        return
+    except BaseException:
+        counts[FAILURE] = CRASHED
+        barrier.abort()
+        raise
+    finally:
+        del control, views, counts, stop, cars, outbox
+        control_block.close()
+        for block in blocks:
+            block.close()
+
+
+class ShardedFleet:
+    """Class simulating a fleet with one worker process per spatial shard.
+
+    Cars are partitioned by abscissa into strips, state of every strip is
+    kept in a shared memory block its worker updates in place, so nothing
+    is pickled per step. Cars driving out of a strip are handed off to
+    the shard of their new location through outboxes in shared memory.
+    Car ids are their positions in the fleet it was built from. Distances
+    are planar, as CarFleet.from_cars ensures for its cars."""
+
+    def __init__(self, fleet, shards=None, edges=None, capacity=None,
+                 context=None):
+        """
+        Initializer
+
+        :param fleet: Cars to simulate, copied into shared memory
+        :type fleet: CarFleet
+        :param shards: Number of shards, number of CPUs by default
+        :type shards: int
+        :param edges: Ascending abscissas between strips of shards,
+        quantiles of cars' abscissas by default
+        :type edges: sequence of int or float
+        :param capacity: Most cars one shard holds, all cars by default,
+        which can never overflow
+        :type capacity: int
+        :param context: Multiprocessing context, default one by default
+        :raise TypeError: In case fleet is not CarFleet
+        :raise ValueError: In case edges do not match shards or cars do not
+        fit in capacity
+        """
+
+        if not isinstance(fleet, CarFleet):
+            raise TypeError
+
+        size = len(fleet)
+        shards = shards or multiprocessing.cpu_count()
+        x = fleet.location.x
+        if edges is None:
+            edges = np.quantile(x, np.linspace(0, 1, shards + 1)[1:-1]) \
+                if size else np.zeros(shards - 1)
+        edges = np.asarray(edges, dtype=np.float64)
+        if len(edges) != shards - 1 or np.any(np.diff(edges) < 0):
+            raise ValueError('Edges must be shards - 1 ascending abscissas')
+
+        capacity = max(size, 1) if capacity is None else capacity
+        owners = np.searchsorted(edges, x, side='right')
+        if size and np.bincount(owners).max() > capacity:
+            raise ValueError('Cars do not fit in shards capacity')
+
+        self._size = size
+        self._shards = shards
+        self._edges = edges
+        self._capacity = capacity
+        self._models = fleet.models
+        self._context = context or multiprocessing.get_context()
+        self._processes = []
+        self._barrier = None
+
+        self._control_block = SharedMemory(
+            create=True, size=(shards + 1) * FIELDS * 8)
+        self._blocks = [SharedMemory(create=True,
+                                     size=2 * ROWS * capacity * 8)
+                        for _ in range(shards)]
+        self._control, self._views = _views(self._control_block,
+                                            self._blocks, shards, capacity)
+        self._control[:] = 0
+
+        columns = np.zeros((ROWS, size))
+        columns[ID] = np.arange(size)
+        columns[X], columns[Y] = x, fleet.location.y
+        columns[FUEL] = fleet.fuel_amount
+        columns[CAPACITY] = fleet.fuel_capacity
+        columns[CONSUMPTION] = fleet.fuel_consumption
+        columns[DEST_X], columns[DEST_Y] = columns[X], columns[Y]
+        for shard, (cars, _) in enumerate(self._views):
+            mine = owners == shard
+            count = np.count_nonzero(mine)
+            cars[:, :count] = columns[:, mine]
+            self._control[shard, COUNT] = count
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({self._size}, ' \
+               f'shards={self._shards})>'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_open(self):
+        if self._control_block is None:
+            raise RuntimeError('Fleet is closed')
+
+    def _states(self):
+        """Yields views of cars of every shard"""
+        self._check_open()
+        for shard, (cars, _) in enumerate(self._views):
+            yield cars[:, :self._control[shard, COUNT]]
+
+    def start(self):
+        """Starts one worker process per shard"""
+        self._check_open()
+        if self._processes:
+            raise RuntimeError('Fleet is already running')
+
+        # Failures of a previous run must not be blamed on this one.
+        self._control[:-1, FAILURE] = 0
+        self._control[-1, 0] = 0
+        self._barrier = self._context.Barrier(self._shards + 1)
+        names = [block.name for block in self._blocks]
+        self._processes = [
+            self._context.Process(
+                target=_work, daemon=True,
+                args=(shard, self._edges, self._control_block.name, names,
+                      self._capacity, self._barrier))
+            for shard in range(self._shards)]
+        for process in self._processes:
+            process.start()
+
+    def stop(self):
+        """Stops worker processes between steps"""
+        if not self._processes:
+            return
+
+        self._control[-1, 0] = 1
+        try:
+            self._barrier.wait()
+        except BrokenBarrierError:
+            pass
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def close(self):
+        """Stops worker processes and frees shared memory, once"""
+        self.stop()
+        if self._control_block is None:
+            return
+
+        self._control = self._views = None
+        for block in [self._control_block] + self._blocks:
+            block.close()
+            block.unlink()
+        self._control_block = None
+        self._blocks = []
+
+    def step(self, count=1):
+        """
+        Makes every car refill its pending amount and drive towards its
+        destination, count times, following Car rules.
+
+        :param count: Number of steps
+        :type count: int
+        :raise RuntimeError: In case fleet is not running
+        :raise ShardOverflow: In case handed off cars exceed capacity of
+        a shard, fleet is stopped and its state is not consistent
+        :raise WorkerFailed: In case some worker process failed
+
+        :return: Numbers of cars moved, with empty tank, with insufficient
+        fuel, refilled, overloaded and handed off over the steps
+        :rtype: dict
+        """
+
+        if not self._processes:
+            raise RuntimeError('Fleet is not running')
+
+        totals = dict.fromkeys(STATS, 0)
+        for _ in range(count):
+            try:
+                for _phase in range(3):
+                    self._barrier.wait()
+            except BrokenBarrierError:
+                self._fail()
+            for name, field in STATS.items():
+                totals[name] += int(self._control[:-1, field].sum())
+
+        return totals
+
+    def _fail(self):
+        failures = self._control[:-1, FAILURE].tolist()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+        if OVERFLOW in failures:
+            raise ShardOverflow()
+        raise WorkerFailed()
+
+    def _per_car(self, values):
+        """Returns column of values in id order, broadcasting one value"""
+        column = np.asarray(values)
+        if column.dtype.kind not in 'iuf' or column.ndim > 1:
+            raise TypeError
+        return np.array(np.broadcast_to(column, (self._size,)),
+                        dtype=np.float64)
+
+    def set_destinations(self, destinations):
+        """
+        Sets destinations cars drive towards on every step.
+
+        :param destinations: Single Point for all cars or one per car in
+        id order
+        :type destinations: Point or PointArray
+        :raise TypeError: In case argument is neither Point nor PointArray
+        :raise ValueError: In case PointArray is of wrong length
+        """
+
+        if isinstance(destinations, Point):
+            xs, ys = destinations.x, destinations.y
+        elif isinstance(destinations, PointArray):
+            if len(destinations) != self._size:
+                raise ValueError('One destination per car expected')
+            xs, ys = destinations.x, destinations.y
+        else:
+            raise TypeError
+
+        xs, ys = self._per_car(xs), self._per_car(ys)
+        for state in self._states():
+            ids = state[ID].astype(np.intp)
+            state[DEST_X], state[DEST_Y] = xs[ids], ys[ids]
+
+    def refill(self, amounts):
+        """
+        Schedules refills applied at the start of the next step. Cars
+        which can't take the whole amount are left untouched.
+
+        :param amounts: Quantity of fuel, one or per car in id order
+        :type amounts: int, float, sequence or numpy.ndarray
+        :raise TypeError: In case amounts are not int or float numbers
+        """
+
+        amounts = self._per_car(amounts)
+        for state in self._states():
+            state[REFILL] = amounts[state[ID].astype(np.intp)]
+
+    def to_fleet(self):
+        """Returns CarFleet with current state of cars in id order"""
+        columns = np.concatenate(list(self._states()), axis=1)
+        columns = columns[:, np.argsort(columns[ID])]
+        return CarFleet(columns[CAPACITY], columns[CONSUMPTION],
+                        PointArray(columns[X], columns[Y]), columns[FUEL],
+                        self._models)
+
+    def shard_sizes(self):
+        """
+        Returns number of cars in every shard.
+
+        :raise RuntimeError: In case fleet is closed
+        :rtype: list
+        """
+
+        self._check_open()
+        return self._control[:-1, COUNT].tolist()
+
+    @property
+    def edges(self):
+        return self._edges
+
+    @property
+    def running(self):
+        return bool(self._processes)
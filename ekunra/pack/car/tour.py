@@ -0,0 +1,235 @@
+import copy
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from pack.car.car import Car, DriveStatus
+from pack.car.planner import RoutePlanner
+from pack.point.metric import require_planar
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+Tour = namedtuple('Tour', ['order', 'stops', 'refills', 'distance'])
+Tour.__doc__ = """Delivery tour of a car.
+
+Attributes:
+    order -- indices of drop-off points in visiting order
+    stops -- Points to drive to one after another, refuel stations included
+    refills -- fuel to refill before driving to every stop
+    distance -- total path length
+"""
+
+# Improvements smaller than this are rounding noise.
+_EPSILON = 1e-9
+
+
+def _nearest_neighbour(distances, size):
+    """
+    Builds open path from node 0 always going to the closest unvisited
+    node.
+
+    :return: Path of node indices
+    :rtype: numpy.ndarray
+    """
+
+    path = [0]
+    unvisited = np.ones(size, dtype=bool)
+    unvisited[0] = False
+    for _ in range(size - 1):
+        row = np.where(unvisited, distances[path[-1], :size], np.inf)
+        path.append(int(np.argmin(row)))
+        unvisited[path[-1]] = False
+
+    return np.array(path)
+
+
+def _two_opt(distances, path, deadline):
+    """
+    Reverses path segments while it makes path shorter.
+
+    Path starts at node 0 and ends at the dummy node which is at zero
+    distance from every node, so both of them never move.
+
+    :return: Whether path was improved
+    :rtype: bool
+    """
+
+    improved = False
+    for i in range(1, len(path) - 2):
+        if time.perf_counter() > deadline:
+            break
+
+        a, b = path[i - 1], path[i]
+        c, d = path[i + 1:-1], path[i + 2:]
+        delta = distances[a, c] + distances[b, d] \
+            - distances[a, b] - distances[c, d]
+
+        best = int(np.argmin(delta))
+        if delta[best] < -_EPSILON:
+            j = i + 1 + best
+            path[i:j + 1] = path[i:j + 1][::-1].copy()
+            improved = True
+
+    return improved
+
+
+def _or_opt(distances, path, deadline):
+    """
+    Moves segments of one to three nodes to the cheapest other place of
+    path, reversed or not, while it makes path shorter.
+
+    :return: Whether path was improved
+    :rtype: bool
+    """
+
+    improved = False
+    for length in (1, 2, 3):
+        i = 1
+        while i + length < len(path):
+            if time.perf_counter() > deadline:
+                return improved
+
+            segment = path[i:i + length]
+            first, last = segment[0], segment[-1]
+            before, after = path[i - 1], path[i + length]
+            gain = distances[before, first] + distances[last, after] \
+                - distances[before, after]
+
+            rest = np.concatenate((path[:i], path[i + length:]))
+            u, v = rest[:-1], rest[1:]
+            forward = distances[u, first] + distances[last, v] \
+                - distances[u, v]
+            backward = distances[u, last] + distances[first, v] \
+                - distances[u, v]
+            forward[i - 1] = backward[i - 1] = np.inf
+
+            k = int(np.argmin(np.minimum(forward, backward)))
+            cost = min(forward[k], backward[k])
+            if cost - gain < -_EPSILON:
+                if backward[k] < forward[k]:
+                    segment = segment[::-1]
+                path[:] = np.concatenate((rest[:k + 1], segment,
+                                          rest[k + 1:]))
+                improved = True
+            else:
+                i += 1
+
+    return improved
+
+
+def order_drops(origin, drops, time_budget=0.05):
+    """
+    Orders drop-off points into a short open path from origin with
+    nearest neighbour construction improved by 2-opt and Or-opt moves
+    until no move helps or time budget runs out.
+
+    :param origin: Start point
+    :type origin: Point
+    :param drops: Drop-off points
+    :type drops: sequence of Point or PointArray
+    :param time_budget: Seconds allowed for improvement
+    :type time_budget: float
+    :raise TypeError: In case points are not Points
+
+    :return: Indices of drops in visiting order
+    :rtype: list
+    """
+
+    deadline = time.perf_counter() + time_budget
+    if not isinstance(drops, PointArray):
+        drops = PointArray.from_points(drops)
+    if not isinstance(origin, Point):
+        raise TypeError
+
+    nodes = PointArray(np.concatenate(([origin.x], drops.x)),
+                       np.concatenate(([origin.y], drops.y)))
+    size = len(nodes)
+
+    # The dummy last node makes an open path look like a closed one.
+    distances = np.zeros((size + 1, size + 1))
+    distances[:size, :size] = nodes.pairwise_distance()
+
+    path = np.append(_nearest_neighbour(distances, size), size)
+    while time.perf_counter() < deadline:
+        improved = _two_opt(distances, path, deadline)
+        improved = _or_opt(distances, path, deadline) or improved
+        if not improved:
+            break
+
+    return [int(node) - 1 for node in path[1:-1]]
+
+
+def plan_tour(car, drops, stations=(), time_budget=0.05):
+    """
+    Plans delivery tour of a car through drop-off points, inserting
+    refuel stops whenever fuel in tank is not enough for the next drop.
+
+    Every drop is left with fuel to reach the station nearest to it, or
+    to finish the rest of the tour without refuels, so the car is never
+    stranded at a drop with a tank too low to reach any station.
+
+    :param car: Car to plan the tour for
+    :type car: Car
+    :param drops: Drop-off points
+    :type drops: sequence of Point
+    :param stations: Refuel stations, or planner built over them
+    :type stations: iterable of Point or RoutePlanner
+    :param time_budget: Seconds allowed for ordering improvement
+    :type time_budget: float
+    :raise TypeError: In case of incorrect arguments Type
+    :raise ValueError: In case car metric is not planar
+    :raise Unreachable: In case some drop can't be reached
+
+    :return: Visiting order and stops with refills before every leg
+    :rtype: Tour
+    """
+
+    if not isinstance(car, Car):
+        raise TypeError
+    require_planar(car.metric, 'Tour planning')
+
+    drops = list(drops)
+    order = order_drops(car.location, drops, time_budget)
+    planner = stations if isinstance(stations, RoutePlanner) \
+        else RoutePlanner(stations)
+
+    # Fuel needed for the rest of the tour from every drop, driven direct.
+    ordered = [drops[index] for index in order]
+    remaining = [0] * len(ordered)
+    for position in range(len(ordered) - 2, -1, -1):
+        remaining[position] = remaining[position + 1] + car.fuel_consumption \
+            * ordered[position].distance(ordered[position + 1])
+
+    # The tour is driven by a copy of the car, so every planned leg is
+    # known to work with Car.drive and Car.refill.
+    driver = copy.copy(car)
+    stops, refills, distance = [], [], 0
+    for drop, rest in zip(ordered, remaining):
+        reserve = min(rest, planner.nearest_fuel(car, drop))
+        start = driver.location
+        probe = copy.copy(driver)
+        if probe.try_drive(drop) is DriveStatus.MOVED \
+                and probe.fuel_amount >= reserve:
+            driver = probe
+            stops.append(drop)
+            refills.append(0)
+            distance += start.distance(drop)
+            continue
+
+        # Route planner refills just enough for every leg, while filling
+        # up at the last station of a detour saves detours to next drops.
+        plan = planner.plan(driver, drop, reserve)
+        for leg, stop in enumerate(plan.stops):
+            refill = plan.refills[leg]
+            if leg and leg == len(plan.stops) - 1:
+                refill = driver.fuel_capacity - driver.fuel_amount
+            if refill:
+                driver.refill(refill)
+            driver.drive(stop)
+            refills.append(refill)
+        stops.extend(plan.stops)
+        distance += plan.distance
+
+    return Tour(order, stops, refills, distance)
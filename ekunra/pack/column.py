@@ -0,0 +1,30 @@
+def validate_column(values, types_allowed=(int, float)) -> list:
+    """
+    Checks if whole column of numbers of correct Type, for bulk
+    constructors of Point, Unit and Car.
+
+    NumPy arrays are checked once by dtype, other sequences by the set
+    of their items' types.
+
+    :param values: Numbers to validate
+    :type values: sequence or numpy.ndarray
+    :param types_allowed: Types items may be of
+    :type types_allowed: iterable of type
+    :raise TypeError: In case any value is not of allowed types, or array
+    is not of int or float dtype
+
+    :return: Validated numbers
+    :rtype: list
+    """
+
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None:
+        if dtype.kind not in 'iuf':
+            raise TypeError
+        return values.tolist()
+
+    values = list(values)
+    if not set(map(type, values)) <= set(types_allowed):
+        raise TypeError
+
+    return values
@@ -0,0 +1,397 @@
+from bisect import bisect_left
+from functools import wraps
+from math import inf
+from time import perf_counter
+
+from pack.car.car import Car, DriveStatus, Error as CarError
+from pack.point.point import Point
+from pack.unit.unit import AttackStatus, Error as UnitError, Unit
+
+
+# Fuel burned by one drive or route.
+FUEL_BUCKETS = (0.1, 0.5, 1, 5, 10, 25, 50, 100, inf)
+# Duration of one sampled call.
+SECONDS_BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 1e-4,
+                   1e-3, inf)
+
+
+def _series(name, labels):
+    """Returns Prometheus series name of metric with labels"""
+    if not labels:
+        return name
+    pairs = ','.join(f'{key}="{value}"' for key, value in labels)
+    return f'{name}{{{pairs}}}'
+
+
+class Counter:
+    """Class representing monotonically increasing count"""
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Histogram:
+    """Class representing distribution of observed values over buckets of
+    upper bounds, the last of which must be inf"""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds):
+        """
+        Initializer
+
+        :param bounds: Ascending upper bounds of buckets ending with inf
+        :type bounds: sequence of int or float
+        :raise ValueError: In case bounds are not ascending or do not end
+        with inf
+        """
+
+        bounds = tuple(bounds)
+        if not bounds or bounds[-1] != inf \
+                or list(bounds) != sorted(set(bounds)):
+            raise ValueError('Bounds must be ascending and end with inf')
+
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Returns number of observations not above every bound"""
+        total, counts = 0, {}
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            counts[bound] = total
+
+        return counts
+
+
+class Registry:
+    """Class keeping counters and histograms by name and labels, exporting
+    them as a dict or in Prometheus text format"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._help = {}
+
+    def __len__(self):
+        return len(self._metrics)
+
+    def _get(self, kind, name, help_, labels, build):
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        metric = self._metrics.get(key)
+        if metric is None:
+            known = self._help.get(name)
+            if known is not None and known[0] is not kind:
+                raise ValueError(f'Metric {name} is not a {kind.__name__}')
+            self._help.setdefault(name, (kind, help_))
+            metric = self._metrics[key] = build()
+
+        return metric
+
+    def counter(self, name, help_='', labels=None):
+        """
+        Returns counter of name and labels, created on first request.
+
+        :param name: Name of metric
+        :type name: str
+        :param help_: Description of metric
+        :type help_: str
+        :param labels: Label names to values
+        :type labels: dict
+        :raise ValueError: In case name is taken by histogram
+        :rtype: Counter
+        """
+
+        return self._get(Counter, name, help_, labels, Counter)
+
+    def histogram(self, name, bounds, help_='', labels=None):
+        """
+        Returns histogram of name and labels, created on first request.
+
+        :param name: Name of metric
+        :type name: str
+        :param bounds: Ascending upper bounds of buckets ending with inf
+        :type bounds: sequence of int or float
+        :param help_: Description of metric
+        :type help_: str
+        :param labels: Label names to values
+        :type labels: dict
+        :raise ValueError: In case name is taken by counter
+        :rtype: Histogram
+        """
+
+        return self._get(Histogram, name, help_, labels,
+                         lambda: Histogram(bounds))
+
+    def reset(self):
+        """Forgets all metrics"""
+        self._metrics.clear()
+        self._help.clear()
+
+    def snapshot(self):
+        """
+        Returns current values by series name: numbers for counters, dicts
+        of cumulative bucket counts, sum and count for histograms.
+
+        :rtype: dict
+        """
+
+        values = {}
+        for (name, labels), metric in sorted(self._metrics.items(),
+                                             key=lambda item: item[0]):
+            series = _series(name, labels)
+            if isinstance(metric, Counter):
+                values[series] = metric.value
+            else:
+                values[series] = {'buckets': metric.cumulative(),
+                                  'sum': metric.sum, 'count': metric.count}
+
+        return values
+
+    def to_prometheus(self):
+        """
+        Returns metrics in Prometheus text exposition format.
+
+        :rtype: str
+        """
+
+        lines = []
+        for name, (kind, help_) in sorted(self._help.items()):
+            lines.append(f'# HELP {name} {help_}')
+            lines.append(f'# TYPE {name} '
+                         f'{"counter" if kind is Counter else "histogram"}')
+            series = sorted((labels, metric) for (name_, labels), metric
+                            in self._metrics.items() if name_ == name)
+            for labels, metric in series:
+                if kind is Counter:
+                    lines.append(f'{_series(name, labels)} {metric.value}')
+                    continue
+                for bound, count in metric.cumulative().items():
+                    le = '+Inf' if bound == inf else repr(float(bound))
+                    bucket = _series(f'{name}_bucket', labels + (('le', le),))
+                    lines.append(f'{bucket} {count}')
+                lines.append(f'{_series(name + "_sum", labels)} {metric.sum}')
+                lines.append(f'{_series(name + "_count", labels)} '
+                             f'{metric.count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """
+        Writes metrics to text file for node exporter textfile collector.
+
+        :param path: Path of file
+        :type path: str
+        """
+
+        with open(path, 'w') as file:
+            file.write(self.to_prometheus())
+
+
+REGISTRY = Registry()
+
+# Originals of patched methods by class and name, while enabled.
+_originals = {}
+
+
+def _errors_counted(func, registry, name):
+    """Wraps func counting errors of the library it raises"""
+    errors = {}
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (CarError, UnitError) as error:
+            kind = type(error).__name__
+            counter = errors.get(kind)
+            if counter is None:
+                counter = errors[kind] = registry.counter(
+                    'ekunra_errors_total', 'Errors raised by the library',
+                    {'error': kind, 'method': name})
+            counter.inc()
+            raise
+
+    return wrapper
+
+
+def _sampled(func, registry, name, every):
+    """Wraps func timing every other call of every"""
+    histogram = registry.histogram(
+        'ekunra_call_seconds', SECONDS_BUCKETS,
+        'Duration of sampled calls', {'method': name})
+    countdown = [every]
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        countdown[0] -= 1
+        if countdown[0]:
+            return func(*args, **kwargs)
+
+        countdown[0] = every
+        started = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.observe(perf_counter() - started)
+
+    return wrapper
+
+
+def _try_drive(func, registry, name):
+    statuses = [registry.counter('ekunra_car_drives_total',
+                                 'Drives by outcome',
+                                 {'status': status.name.lower()})
+                for status in DriveStatus]
+    burned = registry.histogram('ekunra_car_fuel_burned', FUEL_BUCKETS,
+                                'Fuel burned per drive or route')
+    moved = DriveStatus.MOVED
+
+    @wraps(func)
+    def try_drive(car, *args):
+        fuel = car._fuel_amount
+        status = func(car, *args)
+        statuses[status].inc()
+        if status is moved:
+            burned.observe(fuel - car._fuel_amount)
+        return status
+
+    return try_drive
+
+
+def _drive_route(func, registry, name):
+    waypoints = registry.counter('ekunra_car_waypoints_reached_total',
+                                 'Waypoints reached along routes')
+    burned = registry.histogram('ekunra_car_fuel_burned', FUEL_BUCKETS,
+                                'Fuel burned per drive or route')
+
+    @wraps(func)
+    def drive_route(car, route):
+        fuel = car._fuel_amount
+        reached = func(car, route)
+        if reached:
+            waypoints.inc(reached)
+            burned.observe(fuel - car._fuel_amount)
+        return reached
+
+    return _errors_counted(drive_route, registry, name)
+
+
+def _refill(func, registry, name):
+    refilled = registry.counter('ekunra_car_fuel_refilled_total',
+                                'Fuel put into tanks')
+
+    @wraps(func)
+    def refill(car, fuel_amount):
+        fuel = car._fuel_amount
+        func(car, fuel_amount)
+        refilled.inc(car._fuel_amount - fuel)
+
+    return _errors_counted(refill, registry, name)
+
+
+def _try_attack(func, registry, name):
+    statuses = [registry.counter('ekunra_unit_attacks_total',
+                                 'Attacks by outcome',
+                                 {'status': status.name.lower()})
+                for status in AttackStatus]
+
+    @wraps(func)
+    def try_attack(unit, enemy):
+        status = func(unit, enemy)
+        statuses[status].inc()
+        return status
+
+    return try_attack
+
+
+def _calls_counted(func, registry, name):
+    """Wraps func counting its calls"""
+    calls = registry.counter('ekunra_calls_total', 'Calls of method',
+                             {'method': name})
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        calls.value += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+# Methods patched while enabled, with wrappers recording their metrics.
+HOOKS = [
+    (Car, 'try_drive', _try_drive),
+    (Car, 'drive', _errors_counted),
+    (Car, 'drive_route', _drive_route),
+    (Car, 'refill', _refill),
+    (Unit, 'try_attack', _try_attack),
+    (Unit, 'attack', _errors_counted),
+    (Unit, 'counter_attack', _errors_counted),
+    (Unit, 'add_health_points', _errors_counted),
+    (Point, 'distance', _calls_counted),
+]
+
+
+def enable(registry=REGISTRY, sample_every=0):
+    """
+    Patches methods of Car, Unit and Point to record metrics. Until then
+    they are not touched, so instrumentation costs nothing while disabled.
+
+    :param registry: Registry to record to
+    :type registry: Registry
+    :param sample_every: Time one call of every that many per method,
+    no timing if 0
+    :type sample_every: int
+    :raise RuntimeError: In case instrumentation is already enabled
+    """
+
+    if _originals:
+        raise RuntimeError('Instrumentation is already enabled')
+
+    for cls, name, hook in HOOKS:
+        func = cls.__dict__[name]
+        method = f'{cls.__name__}.{name}'
+        wrapper = hook(func, registry, method)
+        if sample_every:
+            wrapper = _sampled(wrapper, registry, method, sample_every)
+        _originals[cls, name] = func
+        setattr(cls, name, wrapper)
+
+
+def disable():
+    """Restores original methods, recorded metrics are kept"""
+    for (cls, name), func in _originals.items():
+        setattr(cls, name, func)
+
+    _originals.clear()
+
+
+def enabled():
+    """Returns whether instrumentation is enabled"""
+    return bool(_originals)
+
+
+class instrumented:
+    """Context manager enabling instrumentation for its block"""
+
+    def __init__(self, registry=REGISTRY, sample_every=0):
+        self._registry = registry
+        self._sample_every = sample_every
+
+    def __enter__(self):
+        enable(self._registry, self._sample_every)
+        return self._registry
+
+    def __exit__(self, *exc_info):
+        disable()
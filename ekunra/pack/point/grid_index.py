@@ -0,0 +1,391 @@
+__author__ = 'ekunra'
+
+import heapq
+from math import floor, hypot, inf, sqrt
+
+from pack.point.point import Point
+
+
+class GridIndex(object):
+    """A GridIndex class is a uniform grid hash over keyed points which
+    answers nearest-neighbour, radius and bounding box queries by visiting
+    only the grid cells around the query instead of every point."""
+
+    fields_types = [int, float]
+
+    def _validate(self, value: int or float) -> int or float:
+        """
+        Data type validator.
+
+        :param value: Value to validate
+        :type value: int or float
+        :raise TypeError: If value type is unsupported
+        :rtype: int or float
+        :return: Validated value
+        """
+
+        if type(value) not in self.fields_types:
+            raise TypeError
+
+        return value
+
+    def _validate_point(self, point):
+        """
+        Checks if point data of correct Type.
+
+        :param point: point data to validate
+        :type point: Any
+        :raise TypeError: In case argument is not Point class object
+
+        :return: Validated point
+        :rtype: Point
+        """
+
+        if not isinstance(point, Point):
+            raise TypeError
+
+        return point
+
+    def __init__(self, cell_size: int or float = 1.0):
+        """
+        The initializer
+
+        :param cell_size: Side length of one square grid cell
+        :type cell_size: int or float
+        :raise TypeError: If cell size is not a number
+        :raise ValueError: If cell size is not positive
+        """
+
+        self._cell_size = self._validate(cell_size)
+
+        if not cell_size > 0:
+            raise ValueError('Cell size must be positive')
+
+        self._coords = {}
+        self._cells = {}
+        self._bounds = None
+
+    @classmethod
+    def from_arrays(cls, xs, ys, keys=None, cell_size=None):
+        """
+        Builds index in bulk from coordinate columns.
+
+        :param xs: The abscissas
+        :type xs: sequence or numpy.ndarray of int or float
+        :param ys: The ordinates
+        :type ys: sequence or numpy.ndarray of int or float
+        :param keys: Keys of points, positions in columns by default
+        :type keys: sequence
+        :param cell_size: Cell side, chosen from points density by default
+        :type cell_size: int or float
+        :raise TypeError: If coordinates are not int or float numbers
+        :raise ValueError: If columns are of different length
+        :rtype: GridIndex
+        """
+
+        xs = xs.tolist() if hasattr(xs, 'tolist') else list(xs)
+        ys = ys.tolist() if hasattr(ys, 'tolist') else list(ys)
+        keys = range(len(xs)) if keys is None else list(keys)
+
+        if not len(xs) == len(ys) == len(keys):
+            raise ValueError('Keys and coordinates must be of equal length')
+        if not {type(value) for value in xs + ys} <= set(cls.fields_types):
+            raise TypeError
+
+        if cell_size is None:
+            cell_size = cls._density_cell_size(xs, ys)
+
+        index = cls(cell_size)
+        for key, x, y in zip(keys, xs, ys):
+            index._insert(key, x, y)
+
+        return index
+
+    @classmethod
+    def from_points(cls, points, keys=None, cell_size=None):
+        """
+        Builds index in bulk from Points.
+
+        :param points: Points to be indexed
+        :type points: iterable of Point
+        :param keys: Keys of points, positions in points by default
+        :type keys: sequence
+        :param cell_size: Cell side, chosen from points density by default
+        :type cell_size: int or float
+        :raise TypeError: If any item is not a Point
+        :rtype: GridIndex
+        """
+
+        points = list(points)
+
+        if not all(isinstance(point, Point) for point in points):
+            raise TypeError
+
+        return cls.from_arrays([point.x for point in points],
+                               [point.y for point in points],
+                               keys, cell_size)
+
+    @staticmethod
+    def _density_cell_size(xs, ys):
+        """Returns cell side holding about two points for spread of points"""
+        if not xs:
+            return 1.0
+
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        if not width * height > 0:
+            return float(2 * max(width, height) / len(xs) or 1.0)
+
+        return sqrt(2 * width * height / len(xs))
+
+    def _cell(self, x, y):
+        return floor(x / self._cell_size), floor(y / self._cell_size)
+
+    def _insert(self, key, x, y):
+        if key in self._coords:
+            self._remove(key)
+
+        cell = self._cell(x, y)
+        self._coords[key] = (x, y, cell)
+        self._cells.setdefault(cell, {})[key] = (x, y)
+
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            bounds = self._bounds
+            bounds[0] = min(bounds[0], cell[0])
+            bounds[1] = max(bounds[1], cell[0])
+            bounds[2] = min(bounds[2], cell[1])
+            bounds[3] = max(bounds[3], cell[1])
+
+    def _remove(self, key):
+        _, _, cell = self._coords.pop(key)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def __len__(self):
+        return len(self._coords)
+
+    def __contains__(self, key):
+        return key in self._coords
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)}, ' \
+               f'cell_size={self._cell_size})>'
+
+    def insert(self, key, point: Point):
+        """
+        Adds point under the key, replacing previous point of the key.
+
+        :param key: Hashable key of point
+        :param point: Point to be indexed
+        :type point: Point
+        :raise TypeError: In case point is not Point class object
+        """
+
+        point = self._validate_point(point)
+        self._insert(key, point.x, point.y)
+
+    def move(self, key, point: Point):
+        """
+        Moves already indexed key to new point.
+
+        :param key: Key of indexed point
+        :param point: New location
+        :type point: Point
+        :raise KeyError: In case key is not indexed
+        :raise TypeError: In case point is not Point class object
+        """
+
+        if key not in self._coords:
+            raise KeyError(key)
+
+        self.insert(key, point)
+
+    def remove(self, key):
+        """
+        Removes key from index.
+
+        :param key: Key of indexed point
+        :raise KeyError: In case key is not indexed
+        """
+
+        self._remove(key)
+
+    def location(self, key):
+        """Returns Point of indexed key"""
+        x, y, _ = self._coords[key]
+        return Point(x, y)
+
+    def _ring(self, ci, cj, r):
+        """Yields cells on Chebyshev distance r from cell (ci, cj)"""
+        if r == 0:
+            yield ci, cj
+            return
+
+        for i in range(ci - r, ci + r + 1):
+            yield i, cj - r
+            yield i, cj + r
+        for j in range(cj - r + 1, cj + r):
+            yield ci - r, j
+            yield ci + r, j
+
+    def nearest(self, target: Point, k: int = 1, max_distance=None,
+                accept=None):
+        """
+        Finds k nearest indexed points.
+
+        :param target: Query point
+        :type target: Point
+        :param k: Number of neighbours to find
+        :type k: int
+        :param max_distance: Points further than that are skipped
+        :type max_distance: int or float
+        :param accept: Called as accept(key, distance), points it returns
+        false for are skipped
+        :type accept: callable
+        :raise TypeError: In case of incorrect arguments Type
+
+        :return: (key, distance) pairs ordered by distance
+        :rtype: list
+        """
+
+        target = self._validate_point(target)
+        max_distance = inf if max_distance is None \
+            else self._validate(max_distance)
+        return self._nearest(target.x, target.y, k, max_distance, accept)
+
+    def _nearest(self, x, y, k, max_distance=inf, accept=None):
+        if k < 1 or not self._coords:
+            return []
+
+        ci, cj = self._cell(x, y)
+        i_min, i_max, j_min, j_max = self._bounds
+        r_max = max(ci - i_min, i_max - ci, cj - j_min, j_max - cj)
+        cells = self._cells
+        best = []
+        order = 0
+
+        def scan(bucket):
+            nonlocal order
+            for key, (px, py) in bucket.items():
+                order += 1
+                d = hypot(px - x, py - y)
+                if d > max_distance or len(best) == k and d >= -best[0][0]:
+                    continue
+                if accept is not None and not accept(key, d):
+                    continue
+
+                if len(best) < k:
+                    heapq.heappush(best, (-d, order, key))
+                else:
+                    heapq.heapreplace(best, (-d, order, key))
+
+        r = 0
+        while r <= r_max:
+            if 8 * r > len(cells):
+                # The ring is wider than the occupied grid, scan whatever
+                # is left instead of walking empty cells.
+                for (i, j), bucket in cells.items():
+                    if max(abs(i - ci), abs(j - cj)) >= r:
+                        scan(bucket)
+                break
+
+            for cell in self._ring(ci, cj, r):
+                bucket = cells.get(cell)
+                if bucket:
+                    scan(bucket)
+
+            # Points in further rings are at least r cells away.
+            if len(best) == k and -best[0][0] <= r * self._cell_size \
+                    or r * self._cell_size > max_distance:
+                break
+            r += 1
+
+        return [(key, -d) for d, _, key in sorted(best, reverse=True)]
+
+    def _cells_range(self, x_min, y_min, x_max, y_max):
+        """Yields occupied cells which intersect the bounding box"""
+        if self._bounds is None:
+            return
+
+        # Clamped to cells ever occupied, so that infinite boxes are fine.
+        bound_i_min, bound_i_max, bound_j_min, bound_j_max = self._bounds
+        size = self._cell_size
+        i_min, j_min = self._cell(max(x_min, bound_i_min * size),
+                                  max(y_min, bound_j_min * size))
+        i_max, j_max = self._cell(min(x_max, (bound_i_max + 1) * size),
+                                  min(y_max, (bound_j_max + 1) * size))
+
+        if (i_max - i_min + 1) * (j_max - j_min + 1) > len(self._cells):
+            for (i, j), bucket in self._cells.items():
+                if i_min <= i <= i_max and j_min <= j <= j_max:
+                    yield bucket
+            return
+
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                bucket = self._cells.get((i, j))
+                if bucket:
+                    yield bucket
+
+    def within(self, target: Point, radius: int or float):
+        """
+        Finds indexed points not further than radius from target.
+
+        :param target: Query point
+        :type target: Point
+        :param radius: Search radius
+        :type radius: int or float
+        :raise TypeError: In case of incorrect arguments Type
+        :raise ValueError: In case radius is negative or NaN
+
+        :return: (key, distance) pairs ordered by distance
+        :rtype: list
+        """
+
+        target = self._validate_point(target)
+        if not self._validate(radius) >= 0:
+            raise ValueError('Radius must not be negative')
+
+        return self._within(target.x, target.y, radius)
+
+    def _within(self, x, y, radius):
+        found = []
+        for bucket in self._cells_range(x - radius, y - radius,
+                                        x + radius, y + radius):
+            for key, (px, py) in bucket.items():
+                d = hypot(px - x, py - y)
+                if d <= radius:
+                    found.append((d, key))
+
+        found.sort(key=lambda item: item[0])
+        return [(key, d) for d, key in found]
+
+    def in_box(self, lower: Point, upper: Point):
+        """
+        Finds indexed points inside of bounding box, borders included.
+
+        :param lower: Corner with the lowest coordinates
+        :type lower: Point
+        :param upper: Corner with the highest coordinates
+        :type upper: Point
+        :raise TypeError: In case corners are not Point class objects
+
+        :return: Keys of found points
+        :rtype: list
+        """
+
+        lower = self._validate_point(lower)
+        upper = self._validate_point(upper)
+        x_min, y_min, x_max, y_max = lower.x, lower.y, upper.x, upper.y
+
+        return [key
+                for bucket in self._cells_range(x_min, y_min, x_max, y_max)
+                for key, (x, y) in bucket.items()
+                if x_min <= x <= x_max and y_min <= y <= y_max]
+
+    @property
+    def cell_size(self) -> int or float:
+        return self._cell_size
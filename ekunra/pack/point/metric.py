@@ -0,0 +1,356 @@
+__author__ = 'ekunra'
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from math import asin, cos, hypot, pi, radians, sin, sqrt
+
+import numpy as np
+
+from pack.point.point import Point
+from pack.point.point_array import PointArray, hypot as array_hypot
+
+
+# Mean Earth radius in kilometres.
+EARTH_RADIUS = 6371.0088
+
+
+class Prepared(object):
+    """Points converted once to the terms their metric computes distances
+    from, such as latitudes in radians and their cosines, to be reused by
+    any number of distance queries."""
+
+    __slots__ = ('_metric', '_terms')
+
+    def __init__(self, metric, terms):
+        """
+        The initializer
+
+        :param metric: Metric the terms are computed for
+        :type metric: Metric
+        :param terms: Equal length float64 columns
+        :type terms: tuple of numpy.ndarray
+        """
+
+        self._metric = metric
+        self._terms = terms
+
+    def __len__(self):
+        return len(self._terms[0])
+
+    def __getitem__(self, item):
+        """Returns Prepared of a slice of points, sharing the columns"""
+        if not isinstance(item, slice):
+            raise TypeError
+        return Prepared(self._metric,
+                        tuple(term[item] for term in self._terms))
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)} points, ' \
+               f'{self._metric!r})>'
+
+    @property
+    def metric(self):
+        return self._metric
+
+    @property
+    def terms(self):
+        return self._terms
+
+
+class Metric(ABC):
+    """Base class of distance metrics between Points.
+
+    Scalar distances are computed with math functions for single Points,
+    batch ones with NumPy over columns of terms, which subclasses compute
+    once per point in prepare()."""
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}>'
+
+    @abstractmethod
+    def measure(self, x0, y0, x1, y1):
+        """Returns distance between two coordinate pairs"""
+
+    @abstractmethod
+    def _terms(self, xs, ys):
+        """Returns per-point terms of float64 coordinate columns"""
+
+    @abstractmethod
+    def _between(self, first, second):
+        """Returns distances between broadcast columns of terms"""
+
+    def distance(self, first, second):
+        """
+        Returns a distance between two Points.
+
+        :param first: The first Point
+        :type first: Point
+        :param second: The second Point
+        :type second: Point
+        :rtype: float
+        """
+
+        return self.measure(first.x, first.y, second.x, second.y)
+
+    def prepare(self, points):
+        """
+        Computes terms of points to reuse them in batch queries.
+
+        :param points: Points to prepare
+        :type points: Prepared, PointArray or sequence of Point
+        :raise TypeError: In case points are not Points
+        :raise ValueError: In case points are prepared for other metric
+        :rtype: Prepared
+        """
+
+        if isinstance(points, Prepared):
+            self._prepared(points)
+            return points
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+
+        return Prepared(self, self._terms(points.x, points.y))
+
+    def _prepared(self, points):
+        """Returns terms of points, preparing them unless already done"""
+        if isinstance(points, Point):
+            return self._terms(np.array([points.x], dtype=np.float64),
+                               np.array([points.y], dtype=np.float64))
+        if not isinstance(points, Prepared):
+            return self.prepare(points).terms
+        if points.metric is not self:
+            raise ValueError('Points are prepared for other metric')
+
+        return points.terms
+
+    def distances(self, origin, points):
+        """
+        Returns distances from one Point to many, as array operations.
+
+        :param origin: Point to measure distances from
+        :type origin: Point
+        :param points: Points to measure distances to
+        :type points: Prepared, PointArray or sequence of Point
+        :raise ValueError: In case points are prepared for other metric
+        :rtype: numpy.ndarray
+        """
+
+        return self._between(self._prepared(origin), self._prepared(points))
+
+    def paired(self, points, other):
+        """
+        Returns distances between points and other ones of the same
+        position, or a single Point broadcast over all points.
+
+        :param points: Points to measure distances from
+        :type points: Prepared, PointArray or sequence of Point
+        :param other: Points to measure distances to
+        :type other: Point, Prepared, PointArray or sequence of Point
+        :raise ValueError: In case points are prepared for other metric
+        :rtype: numpy.ndarray
+        """
+
+        return self._between(self._prepared(points), self._prepared(other))
+
+    def pairwise(self, points, other=None):
+        """
+        Returns matrix of distances from every point to every other one.
+        Slices of Prepared points bound the size of matrices for big sets.
+
+        :param points: Points of the rows
+        :type points: Prepared, PointArray or sequence of Point
+        :param other: Points of the columns, the same points by default
+        :type other: Prepared, PointArray or sequence of Point
+        :raise ValueError: In case points are prepared for other metric
+        :rtype: numpy.ndarray
+        """
+
+        rows = self._prepared(points)
+        columns = rows if other is None else self._prepared(other)
+        return self._between(tuple(term[:, None] for term in rows),
+                             tuple(term[None, :] for term in columns))
+
+
+class PlanarMetric(Metric):
+    """Euclidean distance on the coordinate plane"""
+
+    def measure(self, x0, y0, x1, y1):
+        return hypot(x0 - x1, y0 - y1)
+
+    def _terms(self, xs, ys):
+        return xs, ys
+
+    def _between(self, first, second):
+        return array_hypot(first[0] - second[0], first[1] - second[1])
+
+
+class SphericalMetric(Metric):
+    """Base class of metrics between Points of longitude x and latitude y
+    in degrees, on a sphere of the radius."""
+
+    def __init__(self, radius: float = EARTH_RADIUS):
+        """
+        The initializer
+
+        :param radius: Radius of the sphere, which sets units of distances
+        :type radius: int or float
+        """
+
+        self._radius = radius
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({self._radius})>'
+
+    @property
+    def radius(self):
+        return self._radius
+
+
+class HaversineMetric(SphericalMetric):
+    """Great-circle distance on a sphere"""
+
+    def measure(self, x0, y0, x1, y1):
+        lat0, lat1 = radians(y0), radians(y1)
+        h = sin((lat1 - lat0) / 2) ** 2 \
+            + cos(lat0) * cos(lat1) * sin(radians(x1 - x0) / 2) ** 2
+        return 2 * self._radius * asin(sqrt(min(h, 1.0)))
+
+    def _terms(self, xs, ys):
+        lats = np.radians(ys)
+        return np.radians(xs), lats, np.cos(lats)
+
+    def _between(self, first, second):
+        lon0, lat0, cos0 = first
+        lon1, lat1, cos1 = second
+        h = np.sin((lat1 - lat0) / 2) ** 2 \
+            + cos0 * cos1 * np.sin((lon1 - lon0) / 2) ** 2
+        return 2 * self._radius * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+class EquirectangularMetric(SphericalMetric):
+    """Equirectangular approximation of great-circle distance, precise
+    for short distances away from the poles and cheaper than haversine.
+    Longitude difference is taken the short way, across the antimeridian
+    if need be."""
+
+    def measure(self, x0, y0, x1, y1):
+        lat0, lat1 = radians(y0), radians(y1)
+        d_lon = radians((x1 - x0 + 180) % 360 - 180)
+        return self._radius * hypot(d_lon * cos((lat0 + lat1) / 2),
+                                    lat1 - lat0)
+
+    def _terms(self, xs, ys):
+        return np.radians(xs), np.radians(ys)
+
+    def _between(self, first, second):
+        lon0, lat0 = first
+        lon1, lat1 = second
+        d_lon = np.remainder(lon1 - lon0 + pi, 2 * pi) - pi
+        return self._radius * np.hypot(d_lon * np.cos((lat0 + lat1) / 2),
+                                       lat1 - lat0)
+
+
+PLANAR = PlanarMetric()
+HAVERSINE = HaversineMetric()
+EQUIRECTANGULAR = EquirectangularMetric()
+
+
+class CachedMetric(Metric):
+    """Metric memoizing scalar distances of other one in a bounded LRU
+    cache, for distances between the same places asked for repeatedly.
+
+    Entries are keyed on coordinate values, in either order of the pair,
+    so mutating a Point can not make them stale. Batch queries are not
+    cached.
+
+    Lookup costs more than planar distance itself, so do not wrap PLANAR
+    outside of tests: every distance gets about twice as slow, hit or not.
+    The cache pays off for geodesic metrics, such as HAVERSINE."""
+
+    def __init__(self, metric: Metric = PLANAR, maxsize: int = 65536):
+        """
+        The initializer
+
+        :param metric: Metric to memoize distances of, planar by default,
+        which is slower cached than not
+        :type metric: Metric
+        :param maxsize: Most distances kept, least recently used are
+        evicted first
+        :type maxsize: int
+        :raise TypeError: In case metric is not Metric
+        """
+
+        if not isinstance(metric, Metric):
+            raise TypeError
+
+        self._metric = metric
+        self._cached = lru_cache(maxsize)(metric.measure)
+
+    def __repr__(self):
+        info = self._cached.cache_info()
+        return f'<{self.__class__.__name__}({self._metric!r}) ' \
+               f'[hits:{info.hits}, misses:{info.misses}, ' \
+               f'size:{info.currsize}/{info.maxsize}]>'
+
+    def measure(self, x0, y0, x1, y1):
+        if x1 < x0 or x1 == x0 and y1 < y0:
+            return self._cached(x1, y1, x0, y0)
+        return self._cached(x0, y0, x1, y1)
+
+    def _terms(self, xs, ys):
+        return self._metric._terms(xs, ys)
+
+    def _between(self, first, second):
+        return self._metric._between(first, second)
+
+    def cache_info(self):
+        """Returns hits, misses, maxsize and currsize of the cache"""
+        return self._cached.cache_info()
+
+    def cache_clear(self):
+        """Empties the cache and resets its counters"""
+        self._cached.cache_clear()
+
+    @property
+    def metric(self):
+        return self._metric
+
+    @property
+    def hits(self):
+        return self._cached.cache_info().hits
+
+    @property
+    def misses(self):
+        return self._cached.cache_info().misses
+
+
+def is_planar(metric):
+    """
+    Checks if metric measures planar distances, which NumPy columns and
+    grid indices of Points assume.
+
+    :param metric: Metric, None standing for planar distance
+    :type metric: Metric or None
+    :rtype: bool
+    """
+
+    if isinstance(metric, CachedMetric):
+        metric = metric.metric
+
+    return metric is None or type(metric) is PlanarMetric
+
+
+def require_planar(metric, user):
+    """
+    Checks if metric of a car measures planar distances.
+
+    :param metric: Metric of the car, None standing for planar distance
+    :type metric: Metric or None
+    :param user: What needs planar distances, named in error message
+    :type user: str
+    :raise ValueError: In case metric is not planar
+    """
+
+    if not is_planar(metric):
+        raise ValueError(f'{user} supports cars of planar metric only, '
+                         f'not {metric!r}')
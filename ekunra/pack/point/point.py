@@ -1,12 +1,17 @@
 __author__ = 'ekunra'
 
+from functools import lru_cache
 from math import hypot
 
+from pack.column import validate_column
+
 
 class Point(object):
     """A Point class represents a point on the coordinate plane with
     two coordinates (x, y) stored in one object."""
 
+    __slots__ = ('_x', '_y')
+
     fields_types = [int, float]
 
     def _validate(self, value: int or float) -> int or float:
@@ -39,6 +44,37 @@ class Point(object):
         self._x = self._validate(x)
         self._y = self._validate(y)
 
+    @classmethod
+    def from_arrays(cls, xs, ys) -> list:
+        """
+        Bulk constructor validating whole columns of coordinates at once.
+
+        :param xs: The abscissas
+        :type xs: sequence or numpy.ndarray of int or float
+        :param ys: The ordinates
+        :type ys: sequence or numpy.ndarray of int or float
+        :raise TypeError: If coordinates don't pass validation
+        :raise ValueError: If columns are of different length
+        :rtype: list
+        :return: New Points
+        """
+
+        xs = validate_column(xs, cls.fields_types)
+        ys = validate_column(ys, cls.fields_types)
+
+        if len(xs) != len(ys):
+            raise ValueError('Columns must be of equal length')
+
+        new = cls.__new__
+        points = []
+        for x, y in zip(xs, ys):
+            point = new(cls)
+            point._x = x
+            point._y = y
+            points.append(point)
+
+        return points
+
     def __str__(self):
         return f'({self.x}, {self.y})'
 
@@ -52,9 +88,13 @@ class Point(object):
         return not self == other
 
     def __add__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
         return self.__class__(self._x + other.x, self._y + other.y)
 
     def __sub__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
         return self.__class__(self._x - other.x, self._y - other.y)
 
     def __radd__(self, other):
@@ -79,9 +119,20 @@ class Point(object):
     def __copy__(self):
         return self.__class__(self.x, self.y)
 
-    def distance(self, other):
-        """Returns a distance between two Points"""
-        return hypot(self._x - other.x, self._y - other.y)
+    def distance(self, other, metric=None):
+        """
+        Returns a distance between two Points.
+
+        :param other: The other Point
+        :type other: Point
+        :param metric: Metric to measure with, planar distance by default
+        :type metric: pack.point.metric.Metric
+        :rtype: float
+        """
+
+        if metric is None:
+            return hypot(self._x - other.x, self._y - other.y)
+        return metric.distance(self, other)
 
     @property
     def x(self) -> int or float:
@@ -100,5 +151,71 @@ class Point(object):
         self._y = self._validate(value)
 
 
+def _build(cls, x, y):
+    return cls(x, y)
+
+
+class FrozenPoint(Point):
+    """A FrozenPoint class is an immutable and hashable Point, safe to share
+    between objects and to use as a dict key. Arithmetic, in-place one
+    included, returns new FrozenPoints.
+
+    Hot coordinates, such as depots and stations, are cheaper to get with
+    FrozenPoint.interned(), which returns the same object for the same
+    coordinates while they stay in a bounded LRU cache."""
+
+    __slots__ = ()
+
+    intern_size = 4096
+
+    # Typed, so that Points of int and float coordinates stay distinct.
+    _interned = staticmethod(lru_cache(intern_size, typed=True)(_build))
+
+    @classmethod
+    def interned(cls, x: int or float = 0, y: int or float = 0):
+        """
+        Returns FrozenPoint of coordinates from intern cache, building it
+        on the first request.
+
+        :param x: The abscissa
+        :type x: int or float
+        :param y: The ordinate
+        :type y: int or float
+        :raise TypeError: If params don't pass validation
+        :rtype: FrozenPoint
+        """
+
+        return cls._interned(cls, x, y)
+
+    @classmethod
+    def set_intern_size(cls, maxsize: int):
+        """Replaces intern cache with an empty one of maxsize points"""
+        cls.intern_size = maxsize
+        cls._interned = staticmethod(lru_cache(maxsize, typed=True)(_build))
+
+    @classmethod
+    def intern_info(cls):
+        """Returns hits, misses, maxsize and size of intern cache"""
+        return cls._interned.cache_info()
+
+    def __hash__(self):
+        return hash((self._x, self._y))
+
+    def __iadd__(self, other):
+        return self + other
+
+    def __isub__(self, other):
+        return self - other
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    x = property(Point.x.fget)
+    y = property(Point.y.fget)
+
+
 if __name__ == '__main__':
     p1 = Point(3, 42)
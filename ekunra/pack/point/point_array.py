@@ -0,0 +1,286 @@
+__author__ = 'ekunra'
+
+import sys
+from math import hypot as _math_hypot
+
+import numpy as np
+
+from pack.point.point import Point
+
+# Veltkamp split factor, 2 ** 27 + 1.
+_SPLIT = 134217729.0
+_DBL_MIN = np.finfo(np.float64).tiny
+
+
+def _split(x):
+    """Splits floats into halves of 26 bits, whose squares are exact"""
+    t = x * _SPLIT
+    hi = t - (t - x)
+    return hi, x - hi
+
+
+def _fast_sum(total, x):
+    """Returns sum of total and smaller x with its rounding error"""
+    new = total + x
+    return new, (total - new) + x
+
+
+def _norm(dx, dy):
+    """Vector norm computed step by step as CPython 3.10+ math.hypot does"""
+    scale = np.ldexp(1.0, -np.frexp(np.maximum(dx, dy))[1])
+    csum, frac1, frac2, frac3 = 1.0, 0.0, 0.0, 0.0
+    for d in (dx, dy):
+        hi, lo = _split(d * scale)
+        csum, error = _fast_sum(csum, hi * hi)
+        frac1 = frac1 + error
+        csum, error = _fast_sum(csum, 2.0 * hi * lo)
+        frac2 = frac2 + error
+        frac3 = frac3 + lo * lo
+
+    h = np.sqrt(csum - 1.0 + (frac1 + frac2 + frac3))
+    hi, lo = _split(h)
+    csum, error = _fast_sum(csum, -hi * hi)
+    frac1 = frac1 + error
+    csum, error = _fast_sum(csum, -2.0 * hi * lo)
+    frac2 = frac2 + error
+    csum, error = _fast_sum(csum, -lo * lo)
+    frac3 = frac3 + error
+
+    x = csum - 1.0 + (frac1 + frac2 + frac3)
+    return (h + x / (2.0 * h)) / scale
+
+
+def hypot(dx, dy) -> np.ndarray:
+    """
+    Elementwise Euclidean norm rounded exactly as math.hypot rounds it,
+    unlike numpy.hypot, which differs from it by an ulp now and then. So
+    distances between PointArrays are the same as Point.distance ones.
+    Before Python 3.10 math.hypot is called for every element.
+
+    :param dx: Differences of abscissas
+    :type dx: numpy.ndarray or float
+    :param dy: Differences of ordinates
+    :type dy: numpy.ndarray or float
+    :rtype: numpy.ndarray
+    """
+
+    dx, dy = np.broadcast_arrays(np.abs(np.asarray(dx, dtype=np.float64)),
+                                 np.abs(np.asarray(dy, dtype=np.float64)))
+    exact = np.vectorize(_math_hypot, otypes=[np.float64])
+    if sys.version_info < (3, 10):
+        return exact(dx, dy)
+
+    big = np.maximum(dx, dy)
+    with np.errstate(all='ignore'):
+        norm = np.asarray(_norm(dx, dy))
+
+        # Zeros, infinities and subnormals take other ways in math.hypot.
+        odd = (big < _DBL_MIN) | np.isinf(dx) | np.isinf(dy)
+        if odd.any():
+            norm[odd] = exact(dx[odd], dy[odd])
+
+    return norm[()]
+
+
+class PointArray(object):
+    """A PointArray class represents many points on the coordinate plane
+    stored as two contiguous float64 columns (x, y) instead of one Point
+    object per coordinate pair."""
+
+    dtype = np.float64
+
+    def _validate(self, values) -> np.ndarray:
+        """
+        Column validator.
+
+        :param values: Coordinates to validate
+        :type values: sequence or numpy.ndarray of int or float
+        :raise TypeError: If values are not int or float numbers
+        :rtype: numpy.ndarray
+        :return: Validated one-dimensional float64 column
+        """
+
+        column = np.asarray(values)
+
+        if column.size and column.dtype.kind not in 'iuf':
+            raise TypeError
+        if column.ndim != 1:
+            raise ValueError('PointArray columns must be one-dimensional')
+
+        return np.ascontiguousarray(column, dtype=self.dtype)
+
+    def __init__(self, xs=(), ys=()):
+        """
+        The initializer
+
+        :param xs: The abscissas
+        :type xs: sequence or numpy.ndarray of int or float
+        :param ys: The ordinates
+        :type ys: sequence or numpy.ndarray of int or float
+        :raise TypeError: If params don't pass validation
+        :raise ValueError: If columns are of different length
+        """
+
+        self._x = self._validate(xs)
+        self._y = self._validate(ys)
+
+        if len(self._x) != len(self._y):
+            raise ValueError('PointArray columns must be of equal length')
+
+    @classmethod
+    def _wrap(cls, xs, ys):
+        """Builds PointArray around ready float64 columns without copying"""
+        points = cls.__new__(cls)
+        points._x = xs
+        points._y = ys
+        return points
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Builds PointArray from iterable of Points.
+
+        :param points: Points to be stored
+        :type points: iterable of Point
+        :raise TypeError: If any item is not a Point
+        :rtype: PointArray
+        """
+
+        points = list(points)
+
+        if not all(isinstance(point, Point) for point in points):
+            raise TypeError
+
+        xs = np.fromiter((point.x for point in points), cls.dtype,
+                         len(points))
+        ys = np.fromiter((point.y for point in points), cls.dtype,
+                         len(points))
+        return cls._wrap(xs, ys)
+
+    def to_points(self):
+        """Returns list of Points with the same coordinates"""
+        return list(self)
+
+    def __len__(self):
+        return len(self._x)
+
+    def __iter__(self):
+        for x, y in zip(self._x.tolist(), self._y.tolist()):
+            yield Point(x, y)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return Point(float(self._x[item]), float(self._y[item]))
+
+        return self._wrap(self._x[item], self._y[item])
+
+    def __str__(self):
+        return '[' + ', '.join(f'({x}, {y})' for x, y in
+                               zip(self._x.tolist(), self._y.tolist())) + ']'
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)})>'
+
+    def __eq__(self, other):
+        return isinstance(other, PointArray) \
+               and np.array_equal(self._x, other.x) \
+               and np.array_equal(self._y, other.y)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def _columns(self, other):
+        """Returns coordinates of Point or PointArray"""
+        if isinstance(other, (Point, PointArray)):
+            return other.x, other.y
+
+        raise TypeError
+
+    def __add__(self, other):
+        x, y = self._columns(other)
+        return self._wrap(self._x + x, self._y + y)
+
+    def __sub__(self, other):
+        x, y = self._columns(other)
+        return self._wrap(self._x - x, self._y - y)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __rsub__(self, other):
+        x, y = self._columns(other)
+        return self._wrap(x - self._x, y - self._y)
+
+    def __iadd__(self, other):
+        x, y = self._columns(other)
+        self._x += x
+        self._y += y
+        return self
+
+    def __isub__(self, other):
+        x, y = self._columns(other)
+        self._x -= x
+        self._y -= y
+        return self
+
+    def __mul__(self, factor):
+        factor = np.asarray(factor, dtype=self.dtype)
+        return self._wrap(self._x * factor, self._y * factor)
+
+    def __rmul__(self, factor):
+        return self * factor
+
+    def __copy__(self):
+        return self._wrap(self._x.copy(), self._y.copy())
+
+    def as_bool(self):
+        """Returns boolean mask of points which are truthy as Point is"""
+        return (self._x != 0) | (self._y != 0)
+
+    def distance(self, other, metric=None):
+        """
+        Returns distances to other points.
+
+        :param other: Single Point broadcast over all points or
+        PointArray of the same length for elementwise distances
+        :type other: Point or PointArray
+        :param metric: Metric to measure with, planar distance by default
+        :type metric: pack.point.metric.Metric
+        :rtype: numpy.ndarray
+        """
+
+        if metric is not None:
+            return metric.paired(self, other)
+
+        x, y = self._columns(other)
+        return hypot(self._x - x, self._y - y)
+
+    def pairwise_distance(self, other=None, metric=None):
+        """
+        Returns matrix of distances from every point to every other one.
+
+        :param other: Points to measure distances to, the same points by
+        default, single Point makes a matrix of one column
+        :type other: Point or PointArray
+        :param metric: Metric to measure with, planar distance by default
+        :type metric: pack.point.metric.Metric
+        :rtype: numpy.ndarray
+        """
+
+        if metric is not None:
+            return metric.pairwise(self, other)
+
+        x, y = (self._x, self._y) if other is None else self._columns(other)
+        x, y = np.atleast_1d(x, y)
+        return hypot(self._x[:, None] - x[None, :],
+                     self._y[:, None] - y[None, :])
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y
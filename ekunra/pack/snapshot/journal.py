@@ -0,0 +1,247 @@
+import copyreg
+
+from pack.point.point import FrozenPoint, Point
+
+
+class Error(Exception):
+    """Base class for exceptions in this module."""
+    pass
+
+
+class NoCheckpoint(Error):
+    """Exception raised in case there is no checkpoint to roll back to.
+
+    Attributes:
+        message -- explanation or specific details of the error
+    """
+
+    def __init__(self, message=None):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = 'No checkpoint to roll back to.'
+
+
+# Old value of a slot which was not set.
+_MISSING = object()
+
+# Methods building new objects of the class of their operand, whose results
+# must not come out journaled.
+_DERIVING = ('__copy__', '__deepcopy__', '__add__', '__sub__')
+
+
+def _newobj(cls, *args):
+    """Same as copyreg.__newobj__, rebuilds tracked objects untracked"""
+    return cls.__new__(cls, *args)
+
+
+def _unjournaled(method, cls):
+    """Wraps method, so that new objects it returns are of class cls"""
+
+    def wrapper(obj, *args):
+        result = method(obj, *args)
+        if result is not obj and isinstance(result, cls) \
+                and type(result) is type(obj):
+            result.__class__ = cls
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class Journal:
+    """Class recording changes of tracked Cars, Units or other objects with
+    __slots__, so that they can be rolled back to a checkpoint.
+
+    Tracked objects get their class swapped for a subclass of it with the
+    same layout, which logs old value of a slot before every assignment
+    while there is a checkpoint. Checkpoint and rollback cost depends on
+    number of changes only, not on number of objects. Copies, pickles and
+    results of arithmetic of tracked objects are of their original class and
+    are not tracked.
+
+    Mutable Points held in slots of tracked objects, such as Car location,
+    are tracked along with them from the moment they are held, so that
+    in-place changes of them, like car.location += Point(1, 1), are rolled
+    back too. Points tracked by other journal are left to it."""
+
+    def __init__(self, items=()):
+        """
+        Initializer
+
+        :param items: Objects to track
+        :type items: iterable
+        :raise TypeError: In case some object has no __slots__
+        """
+
+        self._log = []
+        self._marks = []
+        self._classes = {}
+        self._items = []
+        self.track(items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __len__(self):
+        return len(self._log)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [objects:{len(self._items)}, ' \
+               f'checkpoints:{len(self._marks)}, changes:{len(self._log)}]>'
+
+    def _own(self, value):
+        """Tracks value if it is a mutable Point not tracked elsewhere"""
+        if isinstance(value, Point) and not isinstance(value, FrozenPoint) \
+                and getattr(type(value), '_journal', None) is None:
+            self._track(value)
+
+    def _journaled(self, cls):
+        """Returns subclass of cls logging assignments to its slots"""
+        journaled = self._classes.get(cls)
+        if journaled is not None:
+            return journaled
+
+        slots = frozenset(name for klass in cls.__mro__
+                          for name in getattr(klass, '__slots__', ()))
+        log, marks, setattr_ = self._log, self._marks, cls.__setattr__
+        own = self._own
+
+        def __setattr__(obj, name, value):
+            if name in slots:
+                if marks:
+                    log.append((obj, name, getattr(obj, name, _MISSING)))
+                own(value)
+            setattr_(obj, name, value)
+
+        reduce_ex = cls.__reduce_ex__
+
+        def __reduce_ex__(obj, protocol):
+            reduced = reduce_ex(obj, protocol)
+            if isinstance(reduced, tuple) and reduced[1][:1] == (journaled,):
+                # Pickle insists __newobj__ gets class of the object itself.
+                func = reduced[0]
+                if func is copyreg.__newobj__:
+                    func = _newobj
+                reduced = (func, (cls,) + reduced[1][1:]) + reduced[2:]
+            return reduced
+
+        namespace = {
+            '__slots__': (),
+            '__setattr__': __setattr__,
+            '__reduce_ex__': __reduce_ex__,
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '_journal': self,
+            '_slots': slots,
+        }
+        for name in _DERIVING:
+            if hasattr(cls, name):
+                namespace[name] = _unjournaled(getattr(cls, name), cls)
+
+        journaled = type(cls.__name__, (cls,), namespace)
+        self._classes[cls] = journaled
+        return journaled
+
+    def track(self, items):
+        """
+        Starts tracking objects.
+
+        :param items: Objects to track
+        :type items: iterable
+        :raise TypeError: In case some object has no __slots__
+        :raise ValueError: In case some object is tracked by other journal
+        """
+
+        for item in items:
+            cls = type(item)
+            journal = getattr(cls, '_journal', None)
+            if journal is self:
+                continue
+            if journal is not None:
+                raise ValueError('Object is tracked by other journal')
+            if hasattr(item, '__dict__'):
+                raise TypeError
+
+            self._track(item)
+
+    def _track(self, item):
+        """Swaps class of item for journaled one, with Points it holds"""
+        item.__class__ = journaled = self._journaled(type(item))
+        self._items.append(item)
+        for name in journaled._slots:
+            self._own(getattr(item, name, None))
+
+    def release(self):
+        """Stops tracking all objects and forgets changes"""
+        for item in self._items:
+            item.__class__ = item.__class__.__base__
+
+        self._items.clear()
+        self._log.clear()
+        self._marks.clear()
+
+    def checkpoint(self):
+        """
+        Marks current state of tracked objects.
+
+        :return: Checkpoint to roll back to
+        :rtype: int
+        """
+
+        self._marks.append(len(self._log))
+        return self._marks[-1]
+
+    def _mark(self, mark):
+        if not self._marks:
+            raise NoCheckpoint()
+        return self._marks[-1] if mark is None else mark
+
+    def rollback(self, mark=None):
+        """
+        Restores tracked objects to checkpoint, undoing changes made since
+        in reverse order. The checkpoint stays, later ones are dropped.
+
+        :param mark: Checkpoint, the latest one by default
+        :type mark: int
+        :raise NoCheckpoint: In case there is no checkpoint
+        """
+
+        mark = self._mark(mark)
+        log = self._log
+        while len(log) > mark:
+            obj, name, value = log.pop()
+            if value is _MISSING:
+                object.__delattr__(obj, name)
+            else:
+                object.__setattr__(obj, name, value)
+
+        while self._marks and self._marks[-1] > mark:
+            self._marks.pop()
+
+    def commit(self, mark=None):
+        """
+        Keeps changes made since checkpoint and drops it with later ones.
+        Changes are forgotten once no checkpoint is left.
+
+        :param mark: Checkpoint, the latest one by default
+        :type mark: int
+        :raise NoCheckpoint: In case there is no checkpoint
+        """
+
+        if mark is None:
+            self._mark(mark)
+            self._marks.pop()
+        else:
+            while self._marks and self._marks[-1] >= mark:
+                self._marks.pop()
+
+        if not self._marks:
+            self._log.clear()
+
+    @property
+    def checkpoints(self):
+        return tuple(self._marks)
@@ -0,0 +1,380 @@
+import mmap
+
+import numpy as np
+
+from pack.car.car import Car
+from pack.point.metric import EARTH_RADIUS, EQUIRECTANGULAR, HAVERSINE, \
+    PLANAR, CachedMetric, EquirectangularMetric, HaversineMetric, \
+    PlanarMetric
+from pack.point.point import Point
+from pack.unit.unit import Unit
+
+
+class Error(Exception):
+    """Base class for exceptions in this module."""
+    pass
+
+
+class SnapshotError(Error):
+    """Exception raised in case file is not a snapshot of supported
+    version.
+
+    Attributes:
+        message -- explanation or specific details of the error
+    """
+
+    def __init__(self, message=None):
+        if message is not None:
+            self.message = message
+        else:
+            self.message = 'File is not a snapshot of supported version.'
+
+
+MAGIC = b'EKUNSNAP'
+VERSION = 2
+
+CARS, UNITS = 0, 1
+
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('version', '<u2'),
+                         ('kind', '<u2'), ('reserved', '<u4'),
+                         ('count', '<u8'), ('strings_count', '<u8'),
+                         ('strings_offset', '<u8'), ('blob_size', '<u8')])
+
+# Fixed-width records. Strings are indices into the string table, flags
+# has a bit set for every numeric field which was an int. Car metric is
+# stored as its text in the string table, empty for no metric.
+CAR_DTYPE = np.dtype([('fuel_amount', '<f8'), ('fuel_capacity', '<f8'),
+                      ('fuel_consumption', '<f8'), ('x', '<f8'),
+                      ('y', '<f8'), ('model', '<u4'), ('metric', '<u4'),
+                      ('flags', '<u4')])
+UNIT_DTYPE = np.dtype([('hp', '<f8'), ('hp_limit', '<f8'),
+                       ('damage', '<f8'), ('name', '<u4'),
+                       ('flags', '<u4')])
+
+_DTYPES = {CARS: CAR_DTYPE, UNITS: UNIT_DTYPE}
+
+# Metrics which can be saved by name, spherical ones with their radius.
+_METRICS = {'planar': PlanarMetric, 'haversine': HaversineMetric,
+            'equirectangular': EquirectangularMetric}
+_SHARED = {'planar': PLANAR, 'haversine': HAVERSINE,
+           'equirectangular': EQUIRECTANGULAR}
+
+# Size of unbounded metric cache.
+_UNBOUNDED = 'unbounded'
+
+# Ints stored in float64 fields come back as they were up to this size.
+MAX_INT = 2 ** 53
+
+
+def _metric_text(metric):
+    """
+    Returns text of Car metric to store in string table.
+
+    :raise TypeError: In case metric is of unknown class
+    :rtype: str
+    """
+
+    if metric is None:
+        return ''
+    if type(metric) is CachedMetric:
+        maxsize = metric.cache_info().maxsize
+        return f'cached {_UNBOUNDED if maxsize is None else maxsize} ' \
+               f'{_metric_text(metric.metric)}'
+
+    for name, cls in _METRICS.items():
+        if type(metric) is cls:
+            if cls is PlanarMetric:
+                return name
+            return f'{name} {metric.radius!r}'
+
+    raise TypeError(f'Metric {metric!r} can not be saved')
+
+
+def _load_metric(text):
+    """
+    Builds metric of text from string table, shared metric instances are
+    returned as they are.
+
+    :raise SnapshotError: In case text is not of a known metric
+    :rtype: Metric or None
+    """
+
+    if not text:
+        return None
+
+    name, _, rest = text.partition(' ')
+    if name == 'cached':
+        maxsize, _, text = rest.partition(' ')
+        maxsize = None if maxsize == _UNBOUNDED else int(maxsize)
+        return CachedMetric(_load_metric(text), maxsize)
+    if name not in _METRICS:
+        raise SnapshotError(f'Unknown metric {text!r}.')
+    if not rest:
+        return _SHARED[name]
+
+    radius = float(rest)
+    if radius == EARTH_RADIUS:
+        return _SHARED[name]
+    return _METRICS[name](radius)
+
+
+def _flags(*values):
+    """
+    Returns bit mask of values which are ints.
+
+    :raise ValueError: In case some int is beyond MAX_INT
+    :rtype: int
+    """
+
+    flags = 0
+    for bit, value in enumerate(values):
+        if type(value) is int:
+            if not -MAX_INT <= value <= MAX_INT:
+                raise ValueError(f'Int {value} is too big to be saved')
+            flags |= 1 << bit
+
+    return flags
+
+
+def _strings_table(strings):
+    """
+    Deduplicates strings.
+
+    :return: Index of every string in table and the table
+    :rtype: tuple
+    """
+
+    table = {}
+    indices = [table.setdefault(string, len(table)) for string in strings]
+    return indices, list(table)
+
+
+def _car_rows(cars, strings):
+    models, metrics = strings[:len(cars)], strings[len(cars):]
+    for car, model, metric in zip(cars, models, metrics):
+        location = car.location
+        values = (car.fuel_amount, car.fuel_capacity, car.fuel_consumption,
+                  location.x, location.y)
+        yield values + (model, metric, _flags(*values))
+
+
+def _unit_rows(units, names):
+    for unit, name in zip(units, names):
+        values = (unit.hp, unit.hp_limit, unit.damage)
+        yield values + (name, _flags(*values))
+
+
+def _records(items):
+    """
+    Packs Cars or Units into records.
+
+    :raise TypeError: In case items are neither all Cars nor all Units,
+    some Car model is not str or Car metric can not be saved
+    :raise ValueError: In case some int number is beyond MAX_INT
+    :return: Kind of snapshot, records and string table
+    :rtype: tuple
+    """
+
+    if all(isinstance(item, Car) for item in items):
+        kind, rows = CARS, _car_rows
+        labels = [car.model for car in items]
+        for model in labels:
+            if not isinstance(model, str):
+                raise TypeError(f'Car model must be str to be saved, '
+                                f'not {type(model).__name__}')
+        labels += [_metric_text(car.metric) for car in items]
+    elif all(isinstance(item, Unit) for item in items):
+        kind, rows = UNITS, _unit_rows
+        labels = [unit.name for unit in items]
+    else:
+        raise TypeError
+
+    indices, strings = _strings_table(labels)
+    records = np.fromiter(rows(items, indices), dtype=_DTYPES[kind],
+                          count=len(items))
+    return kind, records, strings
+
+
+def save(path, items):
+    """
+    Writes Cars or Units to snapshot file with a single write.
+
+    The file is a header, fixed-width records and a table of model or
+    name strings, and of Car metrics, which are stored once however many
+    records share them.
+
+    :param path: Path of snapshot file
+    :type path: str
+    :param items: Cars or Units, all of the same class
+    :type items: iterable of Car or iterable of Unit
+    :raise TypeError: In case items are neither all Cars nor all Units,
+    some Car model is not str or Car metric is not one of PlanarMetric,
+    HaversineMetric, EquirectangularMetric or CachedMetric of them
+    :raise ValueError: In case some int number is beyond MAX_INT, so that
+    it would not be stored exactly
+
+    :return: Number of bytes written
+    :rtype: int
+    """
+
+    kind, records, strings = _records(list(items))
+
+    encoded = [string.encode() for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+    np.cumsum([len(string) for string in encoded], out=offsets[1:])
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header[0] = (MAGIC, VERSION, kind, 0, len(records), len(strings),
+                 HEADER_DTYPE.itemsize + records.nbytes, offsets[-1])
+
+    data = b''.join([header.tobytes(), records.tobytes(), offsets.tobytes()]
+                    + encoded)
+    with open(path, 'wb') as file:
+        file.write(data)
+
+    return len(data)
+
+
+class Snapshot:
+    """Class representing snapshot file mapped to memory.
+
+    Records are NumPy views of the mapping, nothing is copied until a Car
+    or Unit is requested, which is then built from its record only."""
+
+    def __init__(self, path):
+        """
+        Initializer
+
+        :param path: Path of snapshot file
+        :type path: str
+        :raise SnapshotError: In case file is not a snapshot of supported
+        version
+        """
+
+        with open(path, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError('Snapshot file is empty.')
+
+        try:
+            self._map()
+            damaged = False
+        except (ValueError, KeyError, SnapshotError):
+            damaged = True
+
+        # Closed out of except clause, where traceback still holds views.
+        if damaged:
+            self.close()
+            raise SnapshotError()
+
+    def _map(self):
+        buffer = self._mmap
+        header = np.frombuffer(buffer, HEADER_DTYPE, count=1)[0]
+        if header['magic'] != MAGIC or header['version'] != VERSION:
+            raise SnapshotError()
+
+        self._kind = int(header['kind'])
+        count = int(header['count'])
+        strings_count = int(header['strings_count'])
+        strings_offset = int(header['strings_offset'])
+
+        self._records = np.frombuffer(buffer, _DTYPES[self._kind], count,
+                                      HEADER_DTYPE.itemsize)
+        self._offsets = np.frombuffer(buffer, '<u8', strings_count + 1,
+                                      strings_offset)
+        self._blob = strings_offset + self._offsets.nbytes
+        if self._blob + int(header['blob_size']) > len(buffer):
+            raise SnapshotError()
+
+        self._strings = {}
+        self._metrics = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the file. Records views taken from the snapshot must be
+        released before that.
+        """
+
+        self._records = self._offsets = None
+        self._mmap.close()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}({len(self)} ' \
+               f'{"cars" if self._kind == CARS else "units"})>'
+
+    def string(self, index):
+        """Returns string of the table, decoding it on first access"""
+        string = self._strings.get(index)
+        if string is None:
+            start, stop = self._offsets[index:index + 2].tolist()
+            string = self._mmap[self._blob + start:self._blob + stop].decode()
+            self._strings[index] = string
+
+        return string
+
+    def _metric(self, index):
+        """Returns metric of the table, building it on first access, so
+        that cars which shared a metric share it again"""
+        if index not in self._metrics:
+            self._metrics[index] = _load_metric(self.string(index))
+
+        return self._metrics[index]
+
+    def _values(self, record, count):
+        """Returns count numeric fields of record and its string indices"""
+        values = record.tolist()
+        flags = values[-1]
+        numbers = [int(value) if flags >> bit & 1 else value
+                   for bit, value in enumerate(values[:count])]
+        return numbers, values[count:-1]
+
+    def _car(self, record):
+        (fuel, capacity, consumption, x, y), (model, metric) = \
+            self._values(record, 5)
+        car = Car(capacity, consumption, Point(x, y), self.string(model),
+                  self._metric(metric))
+        car.fuel_amount = fuel
+        return car
+
+    def _unit(self, record):
+        (hp, hp_limit, damage), (name,) = self._values(record, 3)
+        name = self.string(name)
+        unit = Unit(name, hp_limit, damage)
+        unit._health_points = hp
+        return unit
+
+    def __getitem__(self, index):
+        """Returns Car or Unit of record, list of them for a slice"""
+        build = self._car if self._kind == CARS else self._unit
+        if isinstance(index, slice):
+            return [build(record) for record in self._records[index]]
+
+        return build(self._records[index])
+
+    def __iter__(self):
+        build = self._car if self._kind == CARS else self._unit
+        for record in self._records:
+            yield build(record)
+
+    def column(self, name):
+        """Returns read-only view of one field of all records"""
+        return self._records[name]
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def records(self):
+        return self._records
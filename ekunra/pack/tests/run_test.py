@@ -1,8 +1,27 @@
 import unittest
 
+from pack.tests.test_arena import TestArena
+from pack.tests.test_bench import TestBench
 from pack.tests.test_car import TestCar
+from pack.tests.test_dispatch import TestDispatcher
+from pack.tests.test_duel import TestDuel
+from pack.tests.test_effects import TestEffectEngine
+from pack.tests.test_events import TestScheduler
+from pack.tests.test_fleet import TestCarFleet
+from pack.tests.test_server import TestFleetServer
+from pack.tests.test_shard import TestShardedFleet
+from pack.tests.test_simulation import TestSimulation
+from pack.tests.test_snapshot import TestSnapshot
+from pack.tests.test_tour import TestTour
 from pack.tests.test_unit import TestUnit
+from pack.tests.test_grid_index import TestGridIndex
+from pack.tests.test_journal import TestJournal
+from pack.tests.test_metric import TestCachedMetric, TestMetric
+from pack.tests.test_planner import TestPlanner
+from pack.tests.test_ingest import TestIngest
+from pack.tests.test_instrument import TestInstrument
 from pack.tests.test_point import TestPoint
+from pack.tests.test_point_array import TestPointArray
 
 
 if __name__ == '__main__':
@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+
+from pack.unit.arena import Arena, focus_strongest, focus_weakest, \
+    random_target, spread
+from pack.unit.unit import Unit
+
+
+class TestArena(unittest.TestCase):
+
+    def test_init(self):
+        arena = Arena([Unit('Zulu', 120, 30), Unit('Drozd')],
+                      [Unit('Grach', 100, 30)])
+
+        self.assertEqual(arena.hp[0].tolist(), [120, 100])
+        self.assertEqual(arena.hp_limit[1].tolist(), [100])
+        self.assertEqual(arena.damage[0].tolist(), [30, 20.5])
+        self.assertEqual(repr(arena), '<Arena [2/2 vs 1/1, rounds:0]>')
+        self.assertEqual([repr(unit) for unit in arena.to_units(0)],
+                         ['<Unit [name:Zulu, hp:120.0/120.0, damage:30.0]>',
+                          '<Unit [name:Drozd, hp:100.0/100.0, '
+                          'damage:20.5]>'])
+
+        with self.assertRaises(TypeError):
+            _ = Arena([Unit('Zulu'), 'Drozd'], [])
+        with self.assertRaises(TypeError):
+            _ = Arena.from_arrays(['100'], 10, [100], 10)
+        with self.assertRaises(ValueError):
+            arena.alive(2)
+
+    def test_attack_matches_unit(self):
+        u = Unit('Drozd', hp=100, dmg=30)
+        v = Unit('Grach', hp=100, dmg=30)
+        arena = Arena([u], [v])
+
+        for _ in range(3):
+            u.attack(v)
+            arena.attack(0)
+
+            self.assertEqual(arena.hp[0].tolist(), [u.hp])
+            self.assertEqual(arena.hp[1].tolist(), [v.hp])
+
+        self.assertEqual(arena.attack(0), 1)
+        self.assertEqual(arena.hp[1].tolist(), [0])
+        self.assertEqual(arena.hp[0].tolist(), [55])
+        self.assertEqual(arena.winner, 0)
+
+    def test_volley(self):
+        arena = Arena.from_arrays([100, 100, 0], 30, [50, 100], 20)
+        killed = arena.attack(0)
+
+        # Two alive attackers spread over two enemies, dead one is idle.
+        self.assertEqual(killed, 0)
+        self.assertEqual(arena.hp[1].tolist(), [20, 70])
+        self.assertEqual(arena.hp[0].tolist(), [90, 90, 0])
+
+        arena.set_policy(0, focus_weakest)
+        killed = arena.attack(0)
+
+        self.assertEqual(killed, 1)
+        self.assertEqual(arena.hp[1].tolist(), [0, 70])
+        self.assertEqual(arena.hp[0].tolist(), [90, 90, 0])
+
+    def test_policies(self):
+        attackers = np.array([0, 1, 2])
+        targets = np.array([1, 3])
+        enemy_hp = np.array([0, 5, 0, 9])
+        rng = np.random.default_rng(1)
+
+        self.assertEqual(spread(attackers, targets, enemy_hp, rng).tolist(),
+                         [1, 3, 1])
+        self.assertEqual(
+            focus_weakest(attackers, targets, enemy_hp, rng).tolist(),
+            [1, 1, 1])
+        self.assertEqual(
+            focus_strongest(attackers, targets, enemy_hp, rng).tolist(),
+            [3, 3, 3])
+        self.assertTrue(set(random_target(attackers, targets, enemy_hp,
+                                          rng).tolist()) <= {1, 3})
+
+    def test_heal(self):
+        arena = Arena.from_arrays([100, 100, 100], 10, [10], 0)
+        arena.hp[0][:] = [50, 95, 0]
+        arena.heal(0, 10)
+
+        self.assertEqual(arena.hp[0].tolist(), [60, 100, 0])
+
+        arena.heal(0, [5, 5, 5], where=np.array([False, True, True]))
+
+        self.assertEqual(arena.hp[0].tolist(), [60, 100, 0])
+
+        arena.heal(0, 5, where=np.array([1, 0, 0]))
+
+        self.assertEqual(arena.hp[0].tolist(), [65, 100, 0])
+
+        with self.assertRaises(TypeError):
+            arena.heal(0, 'mnogo')
+
+    def test_run(self):
+        arena = Arena.from_arrays(np.full(300, 100), 25,
+                                  np.full(200, 120), 30,
+                                  policy=random_target, seed=3)
+
+        winner = arena.run()
+
+        self.assertIsNotNone(winner)
+        self.assertFalse(arena.alive(1 - winner).any())
+        self.assertTrue(arena.rounds > 0)
+
+        arena = Arena.from_arrays([100], 1, [100], 1)
+
+        self.assertIsNone(arena.run(max_rounds=5))
+        self.assertEqual(arena.rounds, 5)
+
+    def test_run_stalled(self):
+        arena = Arena.from_arrays([10], [0], [10], [0])
+
+        self.assertIsNone(arena.run())
+        self.assertEqual(arena.rounds, 1)
+
+        arena = Arena.from_arrays([10, 10], [0, 5], [10], [0])
+
+        self.assertEqual(arena.run(), 0)
@@ -0,0 +1,45 @@
+import unittest
+
+from pack.bench import checkpoint, instrumentation, sharding
+from pack.bench.hot_paths import CASES
+from pack.bench.runner import compare, run_suite
+from pack.instrument import instrument
+
+
+class TestBench(unittest.TestCase):
+
+    def test_run_suite(self):
+        report = run_suite(scales=(10,), repeat=1, pattern='point.')
+
+        self.assertEqual(sorted(report['ns_per_op']),
+                         sorted(f'{name}@10' for name in CASES
+                                if 'point.' in name))
+        self.assertEqual(sorted(report['bytes_per_instance']),
+                         ['Car', 'Point', 'Unit'])
+
+    def test_compare(self):
+        baseline = {'ns_per_op': {'a@10': 100, 'b@10': 100},
+                    'bytes_per_instance': {'Point': 48}}
+        report = {'ns_per_op': {'a@10': 105, 'b@10': 130, 'c@10': 1},
+                  'bytes_per_instance': {'Point': 96}}
+
+        self.assertEqual([name for name, *_ in
+                          compare(report, baseline, 0.1)],
+                         ['b@10', 'Point'])
+        self.assertEqual(compare(report, baseline, 1.5), [])
+
+    def test_checkpoint(self):
+        report = checkpoint.run(count=100, changes=10, repeat=1)
+
+        self.assertEqual(sorted(report), ['Journal', 'copy.copy'])
+
+    def test_instrumentation(self):
+        report = instrumentation.run(count=100, sample_every=10, repeat=1)
+
+        self.assertEqual(sorted(report), ['disabled', 'enabled', 'sampled'])
+        self.assertFalse(instrument.enabled())
+
+    def test_sharding(self):
+        report = sharding.run(count=1000, steps=2, max_shards=2)
+
+        self.assertEqual(sorted(report), [1, 2])
@@ -1,8 +1,9 @@
 import copy
 import unittest
 
-from pack.car.car import Car, OutOfFuel, TooMuchFuel
-from pack.point.point import Point
+from pack.car.car import Car, DriveStatus, OutOfFuel, TooMuchFuel
+from pack.point.point import FrozenPoint, Point
+from pack.point.point_array import PointArray
 
 
 class TestCar(unittest.TestCase):
@@ -35,6 +36,56 @@ class TestCar(unittest.TestCase):
         self.assertEqual(repr(car_copy.location), '<Point(2, 21.11)>')
         self.assertEqual(car_copy.model, 'Zpa')
 
+    def test_default_location(self):
+        a, b = Car(), Car()
+        a.location += Point(1, 1)
+
+        self.assertIsNot(a.location, b.location)
+        self.assertEqual(b.location, Point())
+
+    def test_drive_interned(self):
+        a, b = Car(50, 1), Car(50, 1)
+        a.refill(50)
+        b.refill(50)
+        a.drive(3, 4)
+
+        self.assertIs(type(a.location), Point)
+
+        Car.intern_coordinates = True
+        self.addCleanup(setattr, Car, 'intern_coordinates', False)
+        a.drive(3, 4)
+        b.drive(3, 4)
+
+        self.assertIs(a.location, b.location)
+        self.assertIsInstance(a.location, FrozenPoint)
+        self.assertIs(copy.copy(a).location, a.location)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.car, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.car.color = 'red'
+
+    def test_bulk(self):
+        cars = Car.bulk([50, 40.5], [0.7, 1], [Point(2, 21.11), Point()],
+                        ['Zpa', 'Lada'])
+
+        self.assertEqual([str(car) for car in cars],
+                         ['Car Zpa [fuel:50/0, location:(2, 21.11)]',
+                          'Car Lada [fuel:40.5/0, location:(0, 0)]'])
+
+        cars = Car.bulk([50, 50], [0.6, 0.6])
+
+        self.assertEqual(cars[0].location, Point())
+        self.assertEqual(cars[0].model, 'Trash')
+        self.assertFalse(cars[0].location is cars[1].location)
+
+        with self.assertRaises(TypeError):
+            Car.bulk(['50'], [0.7])
+        with self.assertRaises(TypeError):
+            Car.bulk([50], [0.7], [(1, 2)])
+        with self.assertRaises(ValueError):
+            Car.bulk([50, 50], [0.7])
+
     def test_representation(self):
         self.assertEqual(str(self.car),
                          'Car Zpa [fuel:50/0, location:(2, 21.11)]')
@@ -81,3 +132,85 @@ class TestCar(unittest.TestCase):
             car_.drive()
         with self.assertRaises(TypeError):
             car_.drive('coordinates')
+
+    def test_car_try_drive(self):
+        car_ = Car(50, 0.7, Point(2, 21.11), 'Zpa')
+        destination = Point(22, 21.11)
+
+        self.assertEqual(car_.try_drive(destination), DriveStatus.EMPTY_TANK)
+
+        car_.refill(10)
+
+        self.assertEqual(car_.try_drive(destination),
+                         DriveStatus.INSUFFICIENT_FUEL)
+        self.assertEqual(repr(car_.location), '<Point(2, 21.11)>')
+        self.assertEqual(car_.fuel_amount, 10)
+
+        car_.refill(15)
+
+        self.assertEqual(car_.try_drive(destination), DriveStatus.MOVED)
+        self.assertEqual(repr(car_.location), '<Point(22, 21.11)>')
+        self.assertEqual(car_.fuel_amount, 11.0)
+        self.assertEqual(car_.try_drive(22, 11), DriveStatus.MOVED)
+        self.assertEqual(repr(car_.location), '<Point(22, 11)>')
+
+        with self.assertRaises(TypeError):
+            car_.try_drive(4, 5, 6)
+        with self.assertRaises(TypeError):
+            car_.try_drive('coordinates')
+
+    def test_car_drive_route(self):
+        route = [Point(5, 21.11), Point(5, 25.11), Point(10, 25.11),
+                 Point(10, 50)]
+        car_ = Car(50, 0.5, Point(2, 21.11), 'Zpa')
+
+        with self.assertRaises(OutOfFuel):
+            car_.drive_route(route)
+
+        car_.refill(7)
+
+        self.assertEqual(car_.drive_route(route), 3)
+        self.assertIs(car_.location, route[2])
+        self.assertEqual(car_.fuel_amount, 1)
+        self.assertEqual(car_.drive_route([]), 0)
+
+        car_.refill(49)
+
+        self.assertEqual(car_.drive_route(PointArray([10, 0], [50, 0])), 2)
+        self.assertEqual(repr(car_.location), '<Point(0.0, 0.0)>')
+
+        with self.assertRaises(TypeError):
+            car_.drive_route([Point(), (1, 2)])
+
+    def test_car_drive_route_empty_tank(self):
+        route = [Point(3, 4), Point(3, 4), Point(6, 8)]
+        car_ = Car(50, 1, Point(0, 0), 'Zpa')
+        car_.refill(5)
+        stepwise = copy.copy(car_)
+
+        self.assertEqual(car_.drive_route(route), 1)
+        self.assertEqual(car_.fuel_amount, 0)
+
+        stepwise.drive(route[0])
+        with self.assertRaises(OutOfFuel):
+            stepwise.drive(route[1])
+
+        car_ = Car(50, 0, Point(0, 0), 'Zpa')
+        car_.refill(1)
+
+        self.assertEqual(car_.drive_route(route), 3)
+
+    def test_car_drive_route_matches_drive(self):
+        route = [Point(i % 7, i % 5 + 0.25) for i in range(40)]
+        car_ = Car(50, 0.7, Point(2, 21.11), 'Zpa')
+        car_.refill(30)
+        stepwise = copy.copy(car_)
+
+        reached = car_.drive_route(route)
+        for point in route[:reached]:
+            stepwise.drive(point)
+
+        self.assertEqual(car_.location, stepwise.location)
+        self.assertAlmostEqual(car_.fuel_amount, stepwise.fuel_amount)
+        self.assertTrue(stepwise.compute_fuel_needed(route[reached])
+                        > stepwise.fuel_amount)
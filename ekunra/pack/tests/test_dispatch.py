@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from pack.car.car import Car, DriveStatus, OutOfFuel
+from pack.car.dispatch import Dispatcher
+from pack.point.point import Point
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(14)
+        self.cars = []
+        for _ in range(300):
+            car = Car(50, rnd.choice([0.5, 1, 2]),
+                      Point(rnd.uniform(-100, 100), rnd.uniform(-100, 100)),
+                      'Zpa')
+            car.refill(rnd.choice([0, 5, 20, 50]))
+            self.cars.append(car)
+        self.dispatcher = Dispatcher(self.cars)
+
+    def brute_force(self, pickup, excluded=()):
+        return sorted((car.location.distance(pickup), key)
+                      for key, car in enumerate(self.cars)
+                      if key not in excluded and car.fuel_amount
+                      and car.compute_fuel_needed(pickup) <= car.fuel_amount)
+
+    def test_nearest(self):
+        for pickup in [Point(), Point(90, -90), Point(500, 500)]:
+            expected = [(key, d) for d, key in self.brute_force(pickup)[:5]]
+
+            self.assertEqual(self.dispatcher.nearest(pickup, 5), expected)
+
+        self.assertEqual(repr(self.dispatcher), '<Dispatcher(300)>')
+        self.assertEqual(Dispatcher().nearest(Point()), [])
+        with self.assertRaises(TypeError):
+            self.dispatcher.nearest((0, 0))
+        with self.assertRaises(TypeError):
+            Dispatcher(['car'])
+
+    def test_drive_refill(self):
+        dispatcher = Dispatcher({'a': Car(10, 1, Point(), 'Zpa'),
+                                 'b': Car(10, 1, Point(5, 0), 'Zpa')})
+
+        self.assertEqual(dispatcher.nearest(Point(1, 0)), [])
+
+        dispatcher.refill('a', 10)
+        dispatcher.refill('b', 3)
+        self.assertEqual(dispatcher.nearest(Point(3, 0), 2),
+                         [('b', 2), ('a', 3)])
+
+        self.assertIs(dispatcher.try_drive('a', Point(4, 0)),
+                      DriveStatus.MOVED)
+        self.assertEqual(dispatcher.nearest(Point(3, 0), 2),
+                         [('a', 1), ('b', 2)])
+
+        dispatcher.drive('b', 8, 0)
+        self.assertEqual(dispatcher.nearest(Point(8, 0), 2), [('a', 4)])
+        with self.assertRaises(OutOfFuel):
+            dispatcher.drive('b', 9, 0)
+
+        dispatcher['a'].drive(Point())
+        dispatcher.update('a')
+        self.assertEqual(dispatcher.nearest(Point(-2, 0)), [('a', 2)])
+
+        dispatcher.remove('a')
+        self.assertNotIn('a', dispatcher)
+        self.assertEqual(dispatcher.nearest(Point(-2, 0)), [])
+
+    def test_empty_tank(self):
+        idle = Car(10, 0, Point(3, 3), 'Zpa')
+        parked = Car(10, 1, Point(), 'Zpa')
+        dispatcher = Dispatcher({'idle': idle, 'parked': parked})
+
+        self.assertEqual(dispatcher.nearest(Point(3, 3)), [])
+        self.assertEqual(dispatcher.nearest(Point()), [])
+        self.assertEqual(dispatcher.assign([Point(), Point(3, 3)]),
+                         [None, None])
+        with self.assertRaises(OutOfFuel):
+            parked.drive(Point())
+
+        dispatcher.refill('idle', 1)
+
+        self.assertEqual(dispatcher.nearest(Point()),
+                         [('idle', idle.location.distance(Point()))])
+
+    def test_assign(self):
+        rnd = random.Random(7)
+        pickups = [Point(rnd.uniform(-100, 100), rnd.uniform(-100, 100))
+                   for _ in range(400)]
+
+        assigned = self.dispatcher.assign(pickups)
+
+        taken = set()
+        for pickup, key in zip(pickups, assigned):
+            expected = self.brute_force(pickup, taken)
+            self.assertEqual(key, expected[0][1] if expected else None)
+            taken.add(key)
+
+        self.assertIn(None, assigned)
+        with self.assertRaises(TypeError):
+            self.dispatcher.assign([(0, 0)])
@@ -0,0 +1,118 @@
+import random
+import unittest
+
+import numpy as np
+
+from pack.unit.duel import duel, duel_table
+from pack.unit.unit import Unit, UnitIsDead
+
+
+def fight(a, b, first):
+    attacker, defender = (a, b) if first is a else (b, a)
+    rounds = 0
+    while a.hp > 0 and b.hp > 0:
+        rounds += 1
+        try:
+            attacker.attack(defender)
+        except UnitIsDead:
+            pass
+        attacker, defender = defender, attacker
+    return rounds
+
+
+class TestDuel(unittest.TestCase):
+
+    def stats(self):
+        rnd = random.Random(7)
+        stats = [(120, 30, 100, 30), (100, 20.5, 100, 20.5),
+                 (10.3, 0.1, 7.7, 0.3), (50, 0, 50, 10), (1, 1, 1000, 999),
+                 (100, 50, 100, 100), (75, 25, 75, 50), (3, 2, 3, 2)]
+        for _ in range(300):
+            stats.append((rnd.randint(1, 500), rnd.randint(0, 60),
+                          rnd.randint(1, 500), rnd.randint(1, 60)))
+        for _ in range(100):
+            stats.append((rnd.uniform(1, 300), rnd.uniform(0.5, 40),
+                          rnd.uniform(1, 300), rnd.uniform(0.5, 40)))
+        return stats
+
+    def test_duel(self):
+        for hp_a, dmg_a, hp_b, dmg_b in self.stats():
+            for first_a in (True, False):
+                a, b = Unit('a', hp_a, dmg_a), Unit('b', hp_b, dmg_b)
+                result = duel(a, b, a if first_a else b)
+
+                self.assertEqual((a.hp, b.hp), (hp_a, hp_b))
+
+                rounds = fight(a, b, a if first_a else b)
+
+                self.assertEqual(result.rounds, rounds)
+                self.assertEqual(repr(result.hp_a), repr(a.hp))
+                self.assertEqual(repr(result.hp_b), repr(b.hp))
+                self.assertIs(result.winner, a if a.hp > 0 else b)
+
+    def test_duel_special(self):
+        a, b = Unit('a', 100, 0), Unit('b', 100, -5)
+
+        self.assertEqual(duel(a, b), (None, None, 100, 100))
+
+        b = Unit('b', 100, 10)
+        b._health_points = 0
+
+        self.assertEqual(duel(a, b), (a, 0, 100, 0))
+
+        with self.assertRaises(TypeError):
+            duel(a, 'b')
+        with self.assertRaises(ValueError):
+            duel(a, b, Unit('c'))
+
+    def test_duel_table(self):
+        stats = np.array(self.stats(), dtype=np.float64)
+        first = np.arange(len(stats)) % 2 == 0
+        table = duel_table(*stats.T, a_first=first)
+
+        for row, a_first, winner, rounds, hp_a, hp_b in zip(
+                stats.tolist(), first, table.winner, table.rounds,
+                table.hp_a, table.hp_b):
+            a, b = Unit('a', *row[:2]), Unit('b', *row[2:])
+            expected = duel(a, b, a if a_first else b)
+
+            self.assertEqual(rounds, expected.rounds)
+            self.assertEqual(hp_a, expected.hp_a)
+            self.assertEqual(hp_b, expected.hp_b)
+            self.assertEqual(winner, 0 if expected.winner is a else 1)
+
+    def test_duel_table_broadcast(self):
+        table = duel_table([[100], [40]], [[30], [10]],
+                           [100, 10], [30, 0], a_first=False)
+
+        self.assertEqual(table.rounds.shape, (2, 2))
+        self.assertEqual(table.winner.tolist(), [[1, 0], [1, 0]])
+
+        table = duel_table([100, 0], [0, 10], [100, 10], [-1, 10])
+
+        self.assertEqual(table.winner.tolist(), [-1, 1])
+        self.assertEqual(table.rounds.tolist(), [-1, 0])
+
+    def test_duel_table_scalar(self):
+        table = duel_table(10.3, 0.1, 7.7, 0.3)
+        expected = duel(Unit('a', 10.3, 0.1), Unit('b', 7.7, 0.3))
+
+        self.assertEqual(table.rounds.shape, ())
+        self.assertEqual(table.rounds, expected.rounds)
+        self.assertEqual((table.hp_a, table.hp_b),
+                         (expected.hp_a, expected.hp_b))
+        self.assertEqual(table.winner, 1)
+        self.assertEqual(duel_table(120, 30, 100, 30).winner, 0)
+
+    def test_duel_long_inexact(self):
+        a, b = Unit('a', 1e6, 0.1), Unit('b', 1e6, 0.3)
+        result = duel(a, b)
+
+        # Every cycle a takes 0.15 + 0.3 and b takes 0.1 + 0.05, a dies on
+        # the counter attack after 2222222 cycles.
+        self.assertIs(result.winner, b)
+        self.assertEqual(result.rounds, 2 * 2222222 + 1)
+        self.assertEqual(result.hp_a, 0)
+        self.assertAlmostEqual(result.hp_b, 666666.6, delta=1e-6)
+        self.assertEqual(duel_table(1e6, 0.1, 1e6, 0.3).rounds,
+                         result.rounds)
@@ -0,0 +1,102 @@
+import copy
+import unittest
+
+import numpy as np
+
+from pack.unit.arena import Arena
+from pack.unit.effects import EffectEngine
+from pack.unit.unit import Unit
+
+
+class TestEffectEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = EffectEngine(np.array([50.0, 100.0, 10.0, 80.0]),
+                                   np.array([100.0, 100.0, 100.0, 80.0]))
+
+    def test_duration(self):
+        self.engine.damage_over_time(0, 5, 3)
+        self.engine.heal_over_time([2], 10, 2)
+
+        self.assertEqual(len(self.engine), 2)
+
+        self.engine.tick(2)
+
+        self.assertEqual(self.engine.hp.tolist(), [40, 100, 30, 80])
+        self.assertEqual(len(self.engine), 1)
+
+        self.engine.tick(5)
+
+        self.assertEqual(self.engine.hp.tolist(), [35, 100, 30, 80])
+        self.assertEqual(len(self.engine), 0)
+        self.assertEqual(self.engine.now, 7)
+
+    def test_damage_before_heal(self):
+        self.engine.add([2, 2, 1, 3], [-10, 25, 30, -5], [1, 1, 1, 1])
+        self.engine.tick()
+
+        self.assertEqual(self.engine.hp.tolist(), [50, 100, 0, 75])
+
+        self.engine.add([2, 3, 3], [5, 30, -10], 2)
+        self.engine.tick(2)
+
+        self.assertEqual(self.engine.hp.tolist(), [50, 100, 0, 80])
+
+    def test_stacking(self):
+        self.engine.add([1] * 1000, -0.0001, np.arange(1, 1001))
+        self.engine.tick(1000)
+
+        self.assertAlmostEqual(self.engine.hp[1], 49.95)
+        self.assertEqual(len(self.engine), 0)
+        self.assertEqual(repr(self.engine),
+                         '<EffectEngine [effects:0, units:0, tick:1000]>')
+
+    def test_matches_units(self):
+        units = [Unit('Zulu', 100, 10) for _ in range(3)]
+        for unit, damage in zip(units, (30, 60, 99)):
+            unit.take_damage(damage)
+        expected = [copy.copy(unit) for unit in units]
+        effects = [(0, -4, 5), (1, 7, 3), (2, 2.5, 4), (1, -1, 2)]
+
+        engine = EffectEngine.from_units(units)
+        engine.add(*map(list, zip(*effects)))
+        engine.tick(6)
+        engine.update_units(units)
+
+        for tick in range(1, 7):
+            for index, unit in enumerate(expected):
+                active = [amount for target, amount, duration in effects
+                          if target == index and tick <= duration]
+                unit.take_damage(-sum(min(amount, 0) for amount in active))
+                if unit.hp > 0:
+                    unit.add_health_points(sum(max(amount, 0)
+                                               for amount in active))
+
+        self.assertEqual([unit.hp for unit in units],
+                         [unit.hp for unit in expected])
+        self.assertEqual([unit.hp for unit in units], [50, 59, 11])
+
+    def test_arena_in_place(self):
+        arena = Arena.from_arrays([30, 40], 5, [30], 5)
+        engine = EffectEngine(arena.hp[0], arena.hp_limit[0])
+        arena.attack(1)
+        engine.heal_over_time([0, 1], 10, 1)
+        engine.tick()
+
+        self.assertEqual(arena.hp[0].tolist(), [30, 40])
+
+    def test_validation(self):
+        with self.assertRaises(TypeError):
+            EffectEngine([1.0], np.array([1.0]))
+        with self.assertRaises(ValueError):
+            EffectEngine(np.array([1.0]), np.array([1.0, 2.0]))
+        with self.assertRaises(TypeError):
+            EffectEngine.from_units([Unit('Zulu'), 'Alpha'])
+        with self.assertRaises(TypeError):
+            self.engine.add([0.5], -1, 1)
+        with self.assertRaises(TypeError):
+            self.engine.add([0], -1, 1.5)
+        with self.assertRaises(ValueError):
+            self.engine.add([4], -1, 1)
+        with self.assertRaises(ValueError):
+            self.engine.add([0], -1, 0)
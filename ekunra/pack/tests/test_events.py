@@ -0,0 +1,117 @@
+import unittest
+
+from pack.car.car import Car, OutOfFuel
+from pack.car.events import Scheduler
+from pack.point.point import Point
+
+
+class TestScheduler(unittest.TestCase):
+
+    def test_order(self):
+        scheduler = Scheduler()
+        log = []
+
+        scheduler.schedule(5, log.append, 'c')
+        scheduler.schedule(1, log.append, 'a')
+        scheduler.schedule(5, log.append, 'd')
+        scheduler.schedule_in(3, log.append, 'b')
+        self.assertEqual(len(scheduler), 4)
+
+        self.assertEqual(scheduler.run(until=4), 2)
+        self.assertEqual(scheduler.now, 4)
+        self.assertEqual(log, ['a', 'b'])
+
+        scheduler.schedule(6, lambda: scheduler.schedule_in(1, log.append,
+                                                            'e'))
+        self.assertEqual(scheduler.run(), 4)
+        self.assertEqual(log, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(scheduler.now, 7)
+        self.assertFalse(scheduler.step())
+
+        with self.assertRaises(ValueError):
+            scheduler.schedule(1, log.append, 'f')
+        with self.assertRaises(TypeError):
+            scheduler.schedule('8', log.append, 'f')
+
+    def test_cancel_reschedule(self):
+        scheduler = Scheduler()
+        log = []
+
+        first = scheduler.schedule(1, log.append, 1)
+        second = scheduler.schedule(2, log.append, 2)
+        third = scheduler.schedule(3, log.append, 3)
+
+        scheduler.cancel(second)
+        scheduler.cancel(second)
+        scheduler.reschedule(first, 4)
+        self.assertEqual(len(scheduler), 2)
+
+        self.assertTrue(scheduler.step())
+        self.assertEqual(log, [3])
+        scheduler.run()
+        self.assertEqual(log, [3, 1])
+        self.assertEqual(len(scheduler), 0)
+
+        with self.assertRaises(ValueError):
+            scheduler.reschedule(second, 5)
+        with self.assertRaises(ValueError):
+            scheduler.reschedule(third, 5)
+
+    def test_stale_entries_dropped(self):
+        scheduler = Scheduler()
+        events = [scheduler.schedule(i, print) for i in range(1000)]
+        for event in events[1:]:
+            scheduler.cancel(event)
+
+        self.assertLess(len(scheduler._queue), 100)
+        self.assertEqual(len(scheduler), 1)
+
+    def test_trip(self):
+        scheduler = Scheduler()
+        car = Car(50, 0.5, Point(), 'Zpa')
+        car.refill(30)
+        arrived = []
+
+        trip = scheduler.drive(car, Point(30, 40), speed=5,
+                               on_arrival=arrived.append)
+
+        self.assertEqual(trip.arrival, 10)
+        scheduler.run(until=4)
+        self.assertEqual(scheduler.location(car), Point(12, 16))
+        self.assertEqual(scheduler.fuel_amount(car), 20)
+        self.assertEqual(car.location, Point())
+        self.assertIs(scheduler.trip(car), trip)
+
+        scheduler.run()
+        self.assertEqual(car.location, Point(30, 40))
+        self.assertEqual(car.fuel_amount, 5)
+        self.assertEqual(arrived, [car])
+        self.assertIsNone(scheduler.trip(car))
+
+    def test_stop(self):
+        scheduler = Scheduler()
+        car = Car(50, 1, Point(), 'Zpa')
+        car.refill(50)
+
+        scheduler.drive(car, Point(10, 0))
+        scheduler.run(until=4)
+        scheduler.drive(car, Point(4, 10), speed=2)
+
+        self.assertEqual(car.location, Point(4, 0))
+        self.assertEqual(car.fuel_amount, 46)
+
+        scheduler.schedule(6, car.refill, 4)
+        scheduler.run(until=7)
+        self.assertEqual(scheduler.fuel_amount(car), 44)
+        scheduler.stop(car)
+        self.assertEqual(car.location, Point(4, 6))
+        self.assertIsNone(scheduler.stop(car))
+        self.assertEqual(len(scheduler), 0)
+
+        self.assertIsNone(scheduler.drive(car, Point(100, 0)))
+        with self.assertRaises(OutOfFuel):
+            scheduler.drive(Car(50, 1, Point(), 'Zpa'), Point(1, 0))
+        with self.assertRaises(ValueError):
+            scheduler.drive(car, Point(1, 0), speed=0)
+        with self.assertRaises(TypeError):
+            scheduler.drive(car, (1, 0))
@@ -0,0 +1,128 @@
+import unittest
+
+import numpy as np
+
+from pack.car.car import Car, DriveStatus, OutOfFuel, RefillStatus, \
+    TooMuchFuel
+from pack.car.fleet import CarFleet
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+class TestCarFleet(unittest.TestCase):
+
+    def make_cars(self):
+        cars = [Car(50, 0.7, Point(2, 21.11), 'Zpa'),
+                Car(40, 0.5, Point(0, 0), 'Lada'),
+                Car(60, 1.5, Point(-3, 4), 'Volga')]
+        cars[1].refill(5)
+        cars[2].refill(60)
+        return cars
+
+    def test_init(self):
+        fleet = CarFleet.from_cars(self.make_cars())
+
+        self.assertEqual(len(fleet), 3)
+        self.assertEqual(repr(fleet), '<CarFleet(3)>')
+        self.assertEqual(fleet.fuel_amount.tolist(), [0, 5, 60])
+        self.assertEqual(fleet.fuel_capacity.tolist(), [50, 40, 60])
+        self.assertEqual(fleet.fuel_consumption.tolist(), [0.7, 0.5, 1.5])
+        self.assertEqual(fleet.location.to_points(),
+                         [Point(2, 21.11), Point(0, 0), Point(-3, 4)])
+        self.assertEqual(fleet.models, ['Zpa', 'Lada', 'Volga'])
+        for car, expected in zip(fleet.to_cars(), self.make_cars()):
+            self.assertEqual(car.fuel_amount, expected.fuel_amount)
+            self.assertEqual(car.fuel_capacity, expected.fuel_capacity)
+            self.assertEqual(car.fuel_consumption, expected.fuel_consumption)
+            self.assertEqual(car.location, expected.location)
+            self.assertEqual(car.model, expected.model)
+        self.assertEqual(CarFleet([50], [0.6]).location.to_points(),
+                         [Point()])
+
+        with self.assertRaises(TypeError):
+            _ = CarFleet.from_cars([Car(), 'car'])
+        with self.assertRaises(TypeError):
+            _ = CarFleet(['50'], [0.6])
+        with self.assertRaises(TypeError):
+            _ = CarFleet([50], [0.6], [Point()])
+
+    def test_drive_all(self):
+        cars = self.make_cars()
+        fleet = CarFleet.from_cars(cars)
+        destinations = [Point(22, 21.11), Point(30, 40), Point(1, 1)]
+
+        status = fleet.drive_all(PointArray.from_points(destinations))
+
+        expected = []
+        for car, destination in zip(cars, destinations):
+            before = car.fuel_amount
+            try:
+                car.drive(destination)
+            except OutOfFuel:
+                expected.append(DriveStatus.EMPTY_TANK)
+                continue
+            expected.append(DriveStatus.MOVED if car.fuel_amount != before
+                            else DriveStatus.INSUFFICIENT_FUEL)
+
+        self.assertEqual(status.tolist(), expected)
+        self.assertEqual(
+            status.tolist(),
+            [DriveStatus.EMPTY_TANK, DriveStatus.INSUFFICIENT_FUEL,
+             DriveStatus.MOVED])
+        np.testing.assert_allclose(fleet.fuel_amount,
+                                   [car.fuel_amount for car in cars])
+        self.assertEqual(fleet.location.to_points(),
+                         [car.location for car in cars])
+
+        with self.assertRaises(TypeError):
+            fleet.drive_all((1, 2))
+        with self.assertRaises(ValueError):
+            fleet.drive_all(PointArray([1], [2]))
+
+    def test_drive_all_broadcast(self):
+        fleet = CarFleet([50, 50], [1, 1], PointArray([0, 10], [0, 0]),
+                         [20, 20])
+
+        status = fleet.drive_all(Point(5, 0), where=np.array([True, False]))
+
+        self.assertEqual(status.tolist(),
+                         [DriveStatus.MOVED, DriveStatus.SKIPPED])
+        self.assertEqual(fleet.fuel_amount.tolist(), [15, 20])
+        self.assertEqual(fleet.location.x.tolist(), [5, 10])
+
+    def test_drive_all_exact_fuel(self):
+        destination = Point(18.187797131868248, 7.85952094034661)
+        car = Car(100, 1, Point(0, 0))
+        car.refill(Point(0, 0).distance(destination))
+        fleet = CarFleet.from_cars([car])
+
+        status = fleet.drive_all(destination)
+
+        self.assertEqual(car.try_drive(destination), DriveStatus.MOVED)
+        self.assertEqual(status.tolist(), [DriveStatus.MOVED])
+        self.assertEqual(fleet.fuel_amount.tolist(), [car.fuel_amount])
+
+    def test_refill_all(self):
+        cars = self.make_cars()
+        fleet = CarFleet.from_cars(cars)
+
+        status = fleet.refill_all([10, 35, 1])
+
+        expected = []
+        for car, amount in zip(cars, [10, 35, 1]):
+            try:
+                car.refill(amount)
+                expected.append(RefillStatus.REFILLED)
+            except TooMuchFuel:
+                expected.append(RefillStatus.TOO_MUCH_FUEL)
+
+        self.assertEqual(status.tolist(), expected)
+        self.assertEqual(fleet.fuel_amount.tolist(),
+                         [car.fuel_amount for car in cars])
+        self.assertEqual(fleet.refill_all(5).tolist(),
+                         [RefillStatus.REFILLED,
+                          RefillStatus.TOO_MUCH_FUEL,
+                          RefillStatus.TOO_MUCH_FUEL])
+
+        with self.assertRaises(TypeError):
+            fleet.refill_all('mnogo')
@@ -0,0 +1,120 @@
+import random
+import unittest
+from math import inf, nan
+
+from pack.point.grid_index import GridIndex
+from pack.point.point import Point
+
+
+class TestGridIndex(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(42)
+        self.points = [Point(rnd.uniform(-100, 100), rnd.uniform(-50, 50))
+                       for _ in range(500)]
+        self.index = GridIndex.from_points(self.points)
+
+    def brute_force(self, target):
+        return sorted((point.distance(target), key)
+                      for key, point in enumerate(self.points))
+
+    def test_init(self):
+        self.assertEqual(len(self.index), 500)
+        self.assertTrue(499 in self.index)
+        self.assertFalse(500 in self.index)
+        self.assertEqual(self.index.location(3), self.points[3])
+        self.assertEqual(repr(GridIndex(2)), '<GridIndex(0, cell_size=2)>')
+
+        with self.assertRaises(TypeError):
+            _ = GridIndex('1')
+        with self.assertRaises(ValueError):
+            _ = GridIndex(0)
+        with self.assertRaises(TypeError):
+            _ = GridIndex.from_points([Point(), (1, 2)])
+        with self.assertRaises(TypeError):
+            _ = GridIndex.from_arrays(['1'], [2])
+        with self.assertRaises(ValueError):
+            _ = GridIndex.from_arrays([1, 2], [2])
+
+    def test_from_arrays(self):
+        index = GridIndex.from_arrays([0, 10, 20], [0, 0, 0], keys='abc',
+                                      cell_size=5)
+
+        self.assertEqual(index.cell_size, 5)
+        self.assertEqual(index.nearest(Point(12, 1)),
+                         [('b', Point(12, 1).distance(Point(10, 0)))])
+
+    def test_nearest(self):
+        for target in [Point(), Point(99.5, -49), Point(1000, 1000)]:
+            expected = self.brute_force(target)[:7]
+            found = self.index.nearest(target, 7)
+
+            self.assertEqual([d for _, d in found], [d for d, _ in expected])
+
+        self.assertEqual(GridIndex().nearest(Point()), [])
+        self.assertEqual(self.index.nearest(Point(), 0), [])
+        with self.assertRaises(TypeError):
+            self.index.nearest((0, 0))
+
+    def test_nearest_filtered(self):
+        target = Point(10, -5)
+        expected = [(key, d) for d, key in self.brute_force(target)
+                    if key % 2 and d <= 30][:5]
+
+        found = self.index.nearest(target, 5, max_distance=30,
+                                   accept=lambda key, d: key % 2)
+
+        self.assertEqual(found, expected)
+        self.assertEqual(self.index.nearest(target, 3, max_distance=0), [])
+        with self.assertRaises(TypeError):
+            self.index.nearest(target, max_distance='30')
+
+    def test_within(self):
+        target = Point(10, -5)
+        expected = [(key, d) for d, key in self.brute_force(target)
+                    if d <= 15]
+
+        self.assertEqual(self.index.within(target, 15), expected)
+        self.assertEqual(self.index.within(target, 0), [])
+        self.assertEqual(self.index.within(target, inf),
+                         [(key, d) for d, key in self.brute_force(target)])
+        self.assertEqual(GridIndex().within(target, inf), [])
+        with self.assertRaises(TypeError):
+            self.index.within(target, '15')
+        with self.assertRaises(ValueError):
+            self.index.within(target, -1)
+        with self.assertRaises(ValueError):
+            self.index.within(target, nan)
+
+    def test_in_box(self):
+        lower, upper = Point(-20, -10), Point(30.5, 12)
+        expected = [key for key, point in enumerate(self.points)
+                    if -20 <= point.x <= 30.5 and -10 <= point.y <= 12]
+
+        self.assertEqual(sorted(self.index.in_box(lower, upper)), expected)
+        self.assertEqual(
+            sorted(self.index.in_box(Point(-inf, -inf), Point(inf, inf))),
+            list(range(len(self.points))))
+
+    def test_insert_remove(self):
+        index = GridIndex(1)
+        index.insert('car', Point(5, 5))
+        index.insert('bus', Point(-3, 2))
+
+        self.assertEqual(index.nearest(Point())[0][0], 'bus')
+
+        index.move('bus', Point(50, 50))
+
+        self.assertEqual(index.nearest(Point())[0][0], 'car')
+        self.assertEqual(index.location('bus'), Point(50, 50))
+
+        index.remove('car')
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.nearest(Point())[0][0], 'bus')
+        with self.assertRaises(KeyError):
+            index.remove('car')
+        with self.assertRaises(KeyError):
+            index.move('car', Point())
+        with self.assertRaises(TypeError):
+            index.insert('car', 7)
@@ -0,0 +1,107 @@
+import copy
+import io
+import json
+import random
+import unittest
+
+import numpy as np
+
+from pack.car.car import Car
+from pack.car.ingest import drive_fixes, ingest, read_csv, read_ndjson
+from pack.point.point import Point
+
+
+class TestIngest(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(17)
+        self.fixes = [(rnd.choice('abc'), rnd.randint(-50, 50),
+                       round(rnd.uniform(-50, 50), 2)) for _ in range(500)]
+        self.cars = {key: Car(1000, 1, Point(), 'Zpa') for key in 'ab'}
+        for car in self.cars.values():
+            car.refill(700)
+        self.reference = self.expected()
+
+    def expected(self):
+        """Drives copies of cars fix by fix with Car.try_drive"""
+        cars = {key: copy.copy(car) for key, car in self.cars.items()}
+        skipped = 0
+        for key, x, y in self.fixes:
+            if key in cars and cars[key].try_drive(Point(x, y)):
+                skipped += 1
+
+        return cars, skipped
+
+    def check(self, stats, rows, rejects):
+        cars, skipped = self.reference
+        for key, car in self.cars.items():
+            self.assertAlmostEqual(car.location.x, cars[key].location.x)
+            self.assertAlmostEqual(car.location.y, cars[key].location.y)
+            self.assertAlmostEqual(car.fuel_amount, cars[key].fuel_amount)
+
+        unknown = sum(1 for key, _, _ in self.fixes if key == 'c')
+        self.assertEqual(stats.rows, rows)
+        self.assertEqual(stats.rejects, rejects)
+        self.assertEqual(stats.unknown, unknown)
+        self.assertEqual(stats.out_of_fuel, skipped)
+        self.assertEqual(stats.applied, len(self.fixes) - unknown - skipped)
+        self.assertGreater(stats.out_of_fuel, 0)
+        self.assertGreater(stats.rows_per_second, 0)
+
+    def test_csv(self):
+        lines = ['x,car_id,y'] + [f'{x},{key},{y}' for key, x, y in self.fixes]
+        lines[100:100] = ['1,a', 'one,a,2', '1,a,']
+        chunks = list(read_csv(io.StringIO('\n'.join(lines)), chunk_size=64))
+
+        self.assertEqual(len(chunks), 8)
+        self.assertEqual(chunks[1].rejects, 3)
+        self.assertEqual(chunks[0].ids[0], self.fixes[0][0])
+
+        stats = ingest(self.cars, iter(chunks))
+
+        self.check(stats, 503, 3)
+        with self.assertRaises(ValueError):
+            next(read_csv(io.StringIO('id,x,y\n')))
+
+    def test_ndjson(self):
+        lines = [json.dumps({'car_id': key, 'x': x, 'y': y})
+                 for key, x, y in self.fixes]
+        lines[7:7] = ['{"car_id": "a", "x": "1", "y": 2}', '[1, 2]',
+                      '{"car_id": "a", "x": true, "y": 2}', 'nope', '',
+                      '{"car_id": "a", "y": 2}',
+                      '{"car_id": null, "x": 1, "y": 2}',
+                      '{"car_id": [1], "x": 1, "y": 2}',
+                      '{"car_id": true, "x": 1, "y": 2}']
+
+        stats = ingest(self.cars, read_ndjson(io.StringIO('\n'.join(lines)),
+                                              chunk_size=100))
+
+        self.check(stats, 508, 8)
+
+    def test_ids_of_different_types(self):
+        cars = {1: Car(100, 1, Point(), 'Zpa'), '1': Car(100, 1, Point())}
+        for car in cars.values():
+            car.refill(50)
+        lines = ['{"car_id": 1, "x": 3, "y": 4}',
+                 '{"car_id": "1", "x": 6, "y": 8}',
+                 '{"car_id": 1, "x": 0, "y": 0}']
+
+        stats = ingest(cars, read_ndjson(io.StringIO('\n'.join(lines))))
+
+        self.assertEqual(stats.applied, 3)
+        self.assertEqual(cars[1].location, Point())
+        self.assertEqual(cars[1].fuel_amount, 40)
+        self.assertEqual(cars['1'].location, Point(6, 8))
+        self.assertEqual(cars['1'].fuel_amount, 40)
+
+    def test_drive_fixes(self):
+        car = Car(10, 1, Point(), 'Zpa')
+        car.refill(10)
+        xs = [3.0, 20.0, 6.0, 6.0, 30.0, 9.0, 10.0, 11.0]
+        ys = [0.0] * len(xs)
+
+        skipped = drive_fixes(car, np.array(xs), np.array(ys), window=3)
+
+        self.assertEqual(skipped, 3)
+        self.assertEqual(car.location, Point(10, 0))
+        self.assertEqual(car.fuel_amount, 0)
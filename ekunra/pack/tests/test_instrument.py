@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from pack.car.car import Car, OutOfFuel, TooMuchFuel
+from pack.car.server import FleetClient, FleetServer
+from pack.instrument import instrument
+from pack.point.point import Point
+from pack.unit.unit import Unit, UnitIsDead
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = instrument.Registry()
+
+    def tearDown(self):
+        instrument.disable()
+
+    def test_disabled_untouched(self):
+        try_drive, distance = Car.try_drive, Point.distance
+
+        instrument.enable(self.registry)
+
+        self.assertTrue(instrument.enabled())
+        self.assertIsNot(Car.try_drive, try_drive)
+        with self.assertRaises(RuntimeError):
+            instrument.enable(self.registry)
+
+        instrument.disable()
+
+        self.assertFalse(instrument.enabled())
+        self.assertIs(Car.try_drive, try_drive)
+        self.assertIs(Point.distance, distance)
+
+    def test_car(self):
+        car = Car(50, 1)
+        with instrument.instrumented(self.registry) as registry:
+            with self.assertRaises(OutOfFuel):
+                car.drive(3, 4)
+            car.refill(20)
+            with self.assertRaises(TooMuchFuel):
+                car.refill(40)
+            car.drive(3, 4)
+            car.try_drive(100, 0)
+            car.drive_route([Point(3, 5), Point(3, 8), Point(50, 50)])
+
+        car.drive(0, 0)
+        values = registry.snapshot()
+
+        self.assertEqual(values['ekunra_car_drives_total{status="moved"}'],
+                         1)
+        self.assertEqual(
+            values['ekunra_car_drives_total{status="empty_tank"}'], 1)
+        self.assertEqual(
+            values['ekunra_car_drives_total{status="insufficient_fuel"}'], 1)
+        self.assertEqual(values['ekunra_car_fuel_refilled_total'], 20)
+        self.assertEqual(values['ekunra_car_waypoints_reached_total'], 2)
+        self.assertEqual(values['ekunra_car_fuel_burned']['sum'], 9)
+        self.assertEqual(values['ekunra_car_fuel_burned']['count'], 2)
+        self.assertEqual(values['ekunra_errors_total{error="OutOfFuel",'
+                                'method="Car.drive"}'], 1)
+        self.assertEqual(values['ekunra_errors_total{error="TooMuchFuel",'
+                                'method="Car.refill"}'], 1)
+
+    def test_server(self):
+        cars = {'car': Car(50, 1)}
+
+        async def main():
+            async with FleetServer(cars) as server:
+                client = FleetClient(server)
+                await client.refill('car', 20)
+                await client.drive('car', Point(3, 4))
+
+        with instrument.instrumented(self.registry) as registry:
+            asyncio.run(main())
+
+        values = registry.snapshot()
+
+        self.assertEqual(values['ekunra_car_drives_total{status="moved"}'],
+                         1)
+        self.assertEqual(values['ekunra_car_fuel_refilled_total'], 20)
+
+    def test_unit(self):
+        unit, enemy = Unit('Zulu', 100, 30), Unit('Alpha', 20, 10)
+        with instrument.instrumented(self.registry) as registry:
+            unit.attack(Unit('Bravo', 100, 1))
+            with self.assertRaises(UnitIsDead):
+                unit.attack(enemy)
+            with self.assertRaises(UnitIsDead):
+                enemy.add_health_points(10)
+
+        values = registry.snapshot()
+
+        self.assertEqual(values['ekunra_unit_attacks_total{status="hit"}'],
+                         1)
+        self.assertEqual(
+            values['ekunra_unit_attacks_total{status="target_killed"}'], 1)
+        self.assertEqual(values['ekunra_errors_total{error="UnitIsDead",'
+                                'method="Unit.add_health_points"}'], 1)
+
+    def test_sampled(self):
+        with instrument.instrumented(self.registry, sample_every=3):
+            for _ in range(10):
+                Point().distance(Point(3, 4))
+
+        values = self.registry.snapshot()
+        timing = values['ekunra_call_seconds{method="Point.distance"}']
+
+        self.assertEqual(values['ekunra_calls_total{method="Point.distance"}'],
+                         10)
+        self.assertEqual(timing['count'], 3)
+        self.assertEqual(timing['buckets'][float('inf')], 3)
+
+    def test_prometheus(self):
+        counter = self.registry.counter('jobs_total', 'Jobs done',
+                                        {'kind': 'a'})
+        counter.inc(2)
+        histogram = self.registry.histogram('size', (1, 10, float('inf')),
+                                            'Sizes')
+        for value in (0.5, 5, 50):
+            histogram.observe(value)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ekunra.prom')
+            self.registry.write_prometheus(path)
+            with open(path) as file:
+                text = file.read()
+
+        self.assertEqual(text.splitlines(), [
+            '# HELP jobs_total Jobs done',
+            '# TYPE jobs_total counter',
+            'jobs_total{kind="a"} 2',
+            '# HELP size Sizes',
+            '# TYPE size histogram',
+            'size_bucket{le="1.0"} 1',
+            'size_bucket{le="10.0"} 2',
+            'size_bucket{le="+Inf"} 3',
+            'size_sum 55.5',
+            'size_count 3',
+        ])
+
+        with self.assertRaises(ValueError):
+            self.registry.histogram('jobs_total', (float('inf'),))
+        with self.assertRaises(ValueError):
+            self.registry.histogram('other', (10, 1))
@@ -0,0 +1,168 @@
+import copy
+import pickle
+import unittest
+
+from pack.car.car import Car
+from pack.point.point import Point
+from pack.snapshot.journal import Journal, NoCheckpoint
+from pack.unit.unit import Unit
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.cars = [Car(50, 1, Point(i, 0), 'Zpa') for i in range(10)]
+        for car in self.cars:
+            car.refill(20)
+        self.units = [Unit('Zulu', 100, 30), Unit('Hotel', 80, 20)]
+        self.journal = Journal(self.cars + self.units)
+
+    def state(self):
+        return [str(item) for item in self.cars + self.units]
+
+    def test_rollback(self):
+        before = self.state()
+
+        mark = self.journal.checkpoint()
+        self.cars[0].drive(Point(5, 0))
+        self.cars[0].refill(3)
+        self.units[0].attack(self.units[1])
+
+        self.assertEqual(len(self.journal), 5)
+        self.assertIsInstance(self.cars[0], Car)
+        self.assertEqual(repr(self.units[0])[:6], '<Unit ')
+
+        self.cars[1].drive(Point(9, 0))
+        inner = self.journal.checkpoint()
+        self.cars[2].drive(Point(9, 0))
+
+        self.journal.rollback(inner)
+        self.assertEqual(self.state()[2], before[2])
+        self.assertEqual(self.cars[1].location, Point(9, 0))
+
+        self.journal.rollback(mark)
+        self.assertEqual(self.state(), before)
+        self.assertEqual(self.journal.checkpoints, (mark,))
+
+        self.journal.rollback()
+        self.assertEqual(len(self.journal), 0)
+
+    def test_commit(self):
+        self.journal.checkpoint()
+        self.cars[0].drive(Point(5, 0))
+        self.journal.checkpoint()
+        self.cars[1].drive(Point(5, 0))
+
+        self.journal.commit()
+        self.journal.rollback()
+        self.assertEqual(self.cars[1].location, Point(1, 0))
+        self.assertEqual(self.cars[0].location, Point(0, 0))
+
+        self.cars[0].drive(Point(5, 0))
+        self.journal.commit()
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(self.cars[0].location, Point(5, 0))
+
+        with self.assertRaises(NoCheckpoint):
+            self.journal.rollback()
+        with self.assertRaises(NoCheckpoint):
+            self.journal.commit()
+
+    def test_location_changed_in_place(self):
+        car = Car(50, 1, Point(1, 1), 'Zpa')
+        journal = Journal([car])
+        journal.checkpoint()
+
+        car.location += Point(5, 5)
+
+        self.assertEqual(car.location, Point(6, 6))
+
+        journal.rollback()
+
+        self.assertEqual(car.location, Point(1, 1))
+
+        car.location.x = 9
+        car.location.y = 9.5
+        journal.rollback()
+
+        self.assertEqual(car.location, Point(1, 1))
+
+    def test_assigned_location_changed_in_place(self):
+        car = self.cars[0]
+        location = Point(3, 3)
+        self.journal.checkpoint()
+
+        car.location = location
+        location -= Point(1, 1)
+
+        self.assertEqual(car.location, Point(2, 2))
+
+        self.journal.rollback()
+
+        self.assertEqual(car.location, Point(0, 0))
+        self.assertEqual(location, Point(3, 3))
+
+        car.drive(location)
+        self.journal.checkpoint()
+        location.x = 7
+        self.journal.rollback()
+
+        self.assertEqual(car.location, Point(3, 3))
+
+    def test_untracked_changes(self):
+        self.cars[0].drive(Point(5, 0))
+
+        self.assertEqual(len(self.journal), 0)
+
+    def test_release(self):
+        self.journal.checkpoint()
+        self.cars[0].drive(Point(5, 0))
+        self.journal.release()
+
+        self.assertIs(type(self.cars[0]), Car)
+        self.assertIs(type(self.cars[0].location), Point)
+        self.assertIs(type(self.units[0]), Unit)
+        self.assertEqual(len(self.journal), 0)
+        pickle.dumps(self.cars)
+
+        with self.assertRaises(TypeError):
+            Journal([object()])
+        with Journal(self.cars):
+            with self.assertRaises(ValueError):
+                Journal(self.cars[:1])
+        self.assertIs(type(self.cars[0]), Car)
+
+    def test_derived_objects(self):
+        car = self.cars[3]
+        car_copy = copy.copy(car)
+        points = [car.location + Point(1, 1), car.location - Point(1, 1),
+                  copy.copy(car.location), car_copy.location,
+                  copy.deepcopy(car).location]
+        self.journal.release()
+
+        self.assertIs(type(car_copy), Car)
+        for point in points:
+            self.assertIs(type(point), Point)
+        self.assertEqual(pickle.loads(pickle.dumps(points))[0], Point(4, 1))
+
+        journal = Journal(points + [car_copy])
+        journal.checkpoint()
+        points[0].x = 9
+        journal.rollback()
+
+        self.assertEqual(points[0], Point(4, 1))
+
+    def test_pickle_tracked(self):
+        car = pickle.loads(pickle.dumps(self.cars[0]))
+
+        self.assertIs(type(car), Car)
+        self.assertIs(type(car.location), Point)
+
+    def test_unit_copy(self):
+        unit = self.units[0]
+        unit_copy = copy.copy(unit)
+        unit.take_damage(10)
+
+        self.assertIs(type(unit_copy), Unit)
+        self.assertEqual(unit_copy.hp, 100)
+        self.assertEqual(repr(copy.copy(unit)), repr(unit))
@@ -0,0 +1,222 @@
+import copy
+import unittest
+
+import numpy as np
+
+from pack.car.car import Car, DriveStatus
+from pack.car.dispatch import Dispatcher
+from pack.car.fleet import CarFleet
+from pack.car.planner import RoutePlanner
+from pack.car.tour import plan_tour
+from pack.point.metric import EQUIRECTANGULAR, HAVERSINE, PLANAR, \
+    CachedMetric, HaversineMetric, Metric, SphericalMetric, is_planar, \
+    require_planar
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+class TestMetric(unittest.TestCase):
+
+    london = Point(-0.1278, 51.5074)
+    paris = Point(2.3522, 48.8566)
+
+    def setUp(self):
+        generator = np.random.default_rng(7)
+        self.points = PointArray(generator.uniform(-180, 180, 500),
+                                 generator.uniform(-89, 89, 500))
+
+    def test_distance(self):
+        self.assertAlmostEqual(HAVERSINE.distance(self.london, self.paris),
+                               343.56, delta=0.1)
+        self.assertAlmostEqual(
+            EQUIRECTANGULAR.distance(self.london, self.paris),
+            HAVERSINE.distance(self.london, self.paris), delta=0.5)
+        self.assertEqual(PLANAR.distance(Point(), Point(3, 4)), 5)
+        self.assertAlmostEqual(
+            HaversineMetric(1).distance(Point(0, 0), Point(180, 0)), np.pi)
+
+    def test_antimeridian(self):
+        east, west = Point(179.5, 10), Point(-179.5, 10)
+        expected = HAVERSINE.distance(east, west)
+
+        self.assertAlmostEqual(expected, 109.5, delta=0.1)
+        self.assertAlmostEqual(EQUIRECTANGULAR.distance(east, west),
+                               expected, delta=0.01)
+        self.assertAlmostEqual(EQUIRECTANGULAR.distance(west, east),
+                               expected, delta=0.01)
+        np.testing.assert_allclose(
+            EQUIRECTANGULAR.distances(east, PointArray([-179.5], [10])),
+            [EQUIRECTANGULAR.distance(east, west)])
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            Metric()
+        with self.assertRaises(TypeError):
+            SphericalMetric()
+        self.assertIsInstance(EQUIRECTANGULAR, SphericalMetric)
+        self.assertNotIsInstance(EQUIRECTANGULAR, HaversineMetric)
+
+    def test_point_distance(self):
+        self.assertEqual(self.london.distance(self.paris, HAVERSINE),
+                         HAVERSINE.distance(self.london, self.paris))
+        self.assertEqual(Point().distance(Point(3, 4), PLANAR), 5)
+
+    def test_distances_match_scalar(self):
+        for metric in (PLANAR, HAVERSINE, EQUIRECTANGULAR):
+            prepared = metric.prepare(self.points)
+            distances = metric.distances(self.london, prepared)
+            expected = [metric.distance(self.london, point)
+                        for point in self.points]
+
+            np.testing.assert_allclose(distances, expected)
+            np.testing.assert_allclose(
+                metric.distances(self.london, self.points), expected)
+
+    def test_pairwise(self):
+        prepared = HAVERSINE.prepare(self.points)
+        matrix = HAVERSINE.pairwise(prepared)
+
+        self.assertEqual(matrix.shape, (500, 500))
+        np.testing.assert_allclose(matrix, matrix.T)
+        np.testing.assert_allclose(matrix[3], HAVERSINE.distances(
+            self.points[3], prepared))
+        np.testing.assert_allclose(HAVERSINE.pairwise(prepared[:10],
+                                                      prepared),
+                                   matrix[:10])
+        np.testing.assert_allclose(
+            self.points.pairwise_distance(metric=HAVERSINE), matrix)
+
+    def test_paired(self):
+        shifted = self.points + Point(0.5, 0.5)
+
+        np.testing.assert_allclose(
+            self.points.distance(shifted, EQUIRECTANGULAR),
+            [EQUIRECTANGULAR.distance(a, b)
+             for a, b in zip(self.points, shifted)])
+        np.testing.assert_allclose(
+            self.points.distance(self.paris, HAVERSINE),
+            HAVERSINE.distances(self.paris, self.points))
+
+    def test_prepared_for_other_metric(self):
+        prepared = HAVERSINE.prepare(self.points)
+
+        self.assertIs(HAVERSINE.prepare(prepared), prepared)
+        with self.assertRaises(ValueError):
+            EQUIRECTANGULAR.distances(self.london, prepared)
+        with self.assertRaises(TypeError):
+            HAVERSINE.prepare([(1, 2)])
+
+    def test_car(self):
+        car = Car(50, 0.1, copy.copy(self.london), metric=HAVERSINE)
+        car.refill(40)
+
+        self.assertAlmostEqual(car.compute_fuel_needed(self.paris), 34.356,
+                               delta=0.01)
+        self.assertEqual(car.try_drive(Point(10, 10)),
+                         DriveStatus.INSUFFICIENT_FUEL)
+        self.assertEqual(car.try_drive(self.paris), DriveStatus.MOVED)
+        self.assertIs(copy.copy(car).metric, HAVERSINE)
+        self.assertIs(Car.bulk([50], [0.1], metric=HAVERSINE)[0].metric,
+                      HAVERSINE)
+        self.assertIsNone(Car().metric)
+
+        with self.assertRaises(TypeError):
+            Car(metric='haversine')
+
+    def test_car_drive_route(self):
+        route = [Point(-0.1 + i / 10, 51.5) for i in range(20)]
+        car = Car(50, 0.5, copy.copy(self.london), metric=EQUIRECTANGULAR)
+        car.refill(30)
+        stepwise = copy.copy(car)
+
+        reached = car.drive_route(route)
+        for point in route[:reached]:
+            stepwise.drive(point)
+
+        self.assertTrue(0 < reached < len(route))
+        self.assertAlmostEqual(car.fuel_amount, stepwise.fuel_amount)
+
+    def test_planar_only(self):
+        car = Car(50, 0.1, copy.copy(self.london), metric=HAVERSINE)
+        car.refill(50)
+        planar = Car(50, 1, metric=CachedMetric(PLANAR))
+
+        self.assertTrue(is_planar(None))
+        self.assertTrue(is_planar(planar.metric))
+        self.assertFalse(is_planar(CachedMetric(HAVERSINE)))
+        require_planar(planar.metric, 'Test')
+        with self.assertRaisesRegex(ValueError, '^Test supports cars of '
+                                                'planar metric only'):
+            require_planar(HAVERSINE, 'Test')
+        self.assertEqual(len(Dispatcher([planar])), 1)
+        self.assertEqual(len(CarFleet.from_cars([planar])), 1)
+
+        with self.assertRaises(ValueError):
+            Dispatcher([car])
+        with self.assertRaises(ValueError):
+            Dispatcher().add('car', car)
+        with self.assertRaises(ValueError):
+            RoutePlanner([self.paris]).plan(car, self.paris)
+        with self.assertRaises(ValueError):
+            plan_tour(car, [self.paris], [self.paris])
+        with self.assertRaises(ValueError):
+            CarFleet.from_cars([planar, car])
+
+
+class TestCachedMetric(unittest.TestCase):
+
+    def test_symmetric(self):
+        metric = CachedMetric(HAVERSINE)
+        a, b = Point(-0.1278, 51.5074), Point(2.3522, 48.8566)
+
+        self.assertEqual(metric.distance(a, b), HAVERSINE.distance(a, b))
+        self.assertEqual(metric.distance(b, a), metric.distance(a, b))
+        self.assertEqual((metric.hits, metric.misses), (2, 1))
+
+        metric.cache_clear()
+
+        self.assertEqual((metric.hits, metric.misses), (0, 0))
+
+    def test_eviction(self):
+        metric = CachedMetric(maxsize=2)
+        origin = Point()
+        for x in (1, 2, 3, 1):
+            metric.distance(origin, Point(x, 0))
+
+        self.assertEqual(metric.misses, 4)
+        self.assertEqual(metric.cache_info().currsize, 2)
+
+    def test_mutated_point(self):
+        metric, origin, point = CachedMetric(), Point(), Point(3, 4)
+
+        self.assertEqual(point.distance(origin, metric), 5)
+
+        point.x = 6
+        point.y = 8
+
+        self.assertEqual(point.distance(origin, metric), 10)
+
+        point -= Point(6, 8)
+
+        self.assertEqual(point.distance(origin, metric), 0)
+        self.assertEqual(metric.hits, 0)
+
+    def test_car(self):
+        metric = CachedMetric()
+        car = Car(50, 0.5, Point(), metric=metric)
+        for _ in range(3):
+            self.assertEqual(car.compute_fuel_needed(Point(3, 4)), 2.5)
+
+        self.assertEqual((metric.hits, metric.misses), (2, 1))
+
+    def test_batch(self):
+        metric = CachedMetric(HAVERSINE)
+        points = PointArray([0, 10, 20], [0, 5, 10])
+
+        np.testing.assert_allclose(
+            metric.distances(Point(1, 1), metric.prepare(points)),
+            HAVERSINE.distances(Point(1, 1), points))
+        self.assertEqual(metric.misses, 0)
+
+        with self.assertRaises(TypeError):
+            CachedMetric('planar')
@@ -0,0 +1,105 @@
+import copy
+import random
+import unittest
+from math import inf
+
+from pack.car.car import Car
+from pack.car.planner import RoutePlanner, Unreachable, execute, \
+    refill_needed
+from pack.point.point import Point
+
+
+class TestPlanner(unittest.TestCase):
+
+    stations = [Point(10, 0), Point(20, 0), Point(20, 5), Point(30, 0),
+                Point(10, 40)]
+
+    def test_refill_needed(self):
+        self.assertEqual(refill_needed(10, 5, 50), 0)
+        self.assertEqual(refill_needed(3, 5, 50), 2)
+        self.assertEqual(refill_needed(0, 0, 50), 5e-324)
+        self.assertEqual(refill_needed(10, 100, 50), 40)
+
+        fuel, fuel_needed = 0.1, 0.7
+        self.assertTrue(fuel + refill_needed(fuel, fuel_needed, 50)
+                        >= fuel_needed)
+
+    def test_plan(self):
+        planner = RoutePlanner(self.stations)
+        car = Car(12, 1, Point(), 'Zpa')
+        car.refill(11)
+
+        plan = planner.plan(car, Point(40, 0))
+
+        self.assertEqual(repr(planner), '<RoutePlanner(5)>')
+        self.assertEqual(plan.stops, [Point(10, 0), Point(20, 0),
+                                      Point(30, 0), Point(40, 0)])
+        self.assertEqual(plan.refills, [0, 9, 10, 10])
+        self.assertEqual(plan.distance, 40)
+
+        execute(car, plan)
+
+        self.assertEqual(car.location, Point(40, 0))
+        self.assertEqual(car.fuel_amount, 0)
+
+    def test_plan_direct(self):
+        planner = RoutePlanner(self.stations)
+        car = Car(50, 0.5, Point(), 'Zpa')
+        car.refill(50)
+
+        self.assertEqual(planner.plan(car, Point(40, 0)).stops,
+                         [Point(40, 0)])
+        self.assertEqual(planner.plan(car, Point()).stops, [])
+
+    def test_plan_reserve(self):
+        planner = RoutePlanner(self.stations)
+        car = Car(12, 1, Point(), 'Zpa')
+        car.refill(12)
+
+        self.assertEqual(planner.plan(car, Point(8, 0)).stops, [Point(8, 0)])
+
+        plan = planner.plan(car, Point(8, 0), reserve=5)
+
+        self.assertEqual(plan.stops, [Point(10, 0), Point(8, 0)])
+        self.assertEqual(plan.refills, [0, 5])
+        self.assertEqual(plan.distance, 12)
+        self.assertEqual(planner.nearest_fuel(car, Point(8, 0)), 2)
+        self.assertEqual(RoutePlanner([]).nearest_fuel(car, Point()), inf)
+        with self.assertRaises(ValueError):
+            planner.plan(car, Point(8, 0), reserve=-1)
+
+    def test_unreachable(self):
+        planner = RoutePlanner(self.stations)
+        car = Car(12, 1, Point(), 'Zpa')
+
+        with self.assertRaises(Unreachable):
+            planner.plan(car, Point(40, 0))
+
+        car.refill(12)
+
+        with self.assertRaises(Unreachable):
+            planner.plan(car, Point(100, 100))
+        with self.assertRaises(TypeError):
+            planner.plan(car, (40, 0))
+        with self.assertRaises(TypeError):
+            planner.plan('car', Point(40, 0))
+
+    def test_plan_random(self):
+        rnd = random.Random(3)
+        stations = [Point(rnd.uniform(0, 1000), rnd.uniform(0, 1000))
+                    for _ in range(2000)]
+        planner = RoutePlanner(stations)
+        car = Car(30, 0.7, Point(1, 1), 'Zpa')
+        car.refill(20)
+        destination = Point(990.5, 980)
+
+        plan = planner.plan(car, destination)
+        driven = copy.copy(car)
+        execute(driven, plan)
+
+        self.assertEqual(driven.location, destination)
+        self.assertTrue(plan.distance >= Point(1, 1).distance(destination))
+        legs = [Point(1, 1)] + plan.stops
+        self.assertAlmostEqual(plan.distance,
+                               sum(a.distance(b)
+                                   for a, b in zip(legs, legs[1:])))
@@ -1,7 +1,9 @@
 import copy
 import unittest
 
-from pack.point.point import Point
+import numpy as np
+
+from pack.point.point import FrozenPoint, Point
 
 
 class TestPoint(unittest.TestCase):
@@ -67,3 +69,58 @@ class TestPoint(unittest.TestCase):
 
         self.assertEqual(str(x), '(1, 5.5)')
         self.assertEqual(repr(x), '<Point(1, 5.5)>')
+
+    def test_slots(self):
+        x = Point(1, 5)
+
+        self.assertFalse(hasattr(x, '__dict__'))
+        with self.assertRaises(AttributeError):
+            x.z = 10
+
+    def test_frozen(self):
+        x = FrozenPoint(1, 5)
+        y = x
+
+        y += Point(1, 1)
+
+        self.assertEqual(x, Point(1, 5))
+        self.assertEqual(y, FrozenPoint(2, 6))
+        self.assertIsInstance(x - Point(1, 1), FrozenPoint)
+        self.assertIs(copy.copy(x), x)
+        self.assertIs(copy.deepcopy(x), x)
+        self.assertEqual({x: 'depot'}[FrozenPoint(1, 5)], 'depot')
+        with self.assertRaises(AttributeError):
+            x.x = 3
+        with self.assertRaises(TypeError):
+            FrozenPoint('1', 5)
+
+    def test_interned(self):
+        self.addCleanup(FrozenPoint.set_intern_size, FrozenPoint.intern_size)
+        FrozenPoint.set_intern_size(2)
+
+        a = FrozenPoint.interned(1, 5)
+
+        self.assertIs(FrozenPoint.interned(1, 5), a)
+        self.assertIsNot(FrozenPoint.interned(1.0, 5), a)
+        self.assertIsNot(FrozenPoint.interned(2, 5), a)
+        self.assertIsNot(FrozenPoint.interned(1, 5), a)
+        self.assertEqual(FrozenPoint.intern_info().maxsize, 2)
+
+    def test_from_arrays(self):
+        points = Point.from_arrays([1, 42], [5, 17.7])
+
+        self.assertEqual(points, [Point(1, 5), Point(42, 17.7)])
+        self.assertEqual(repr(points[0]), '<Point(1, 5)>')
+        self.assertEqual(Point.from_arrays(np.array([1.5]), np.array([2])),
+                         [Point(1.5, 2)])
+        self.assertEqual(type(Point.from_arrays(np.array([3]), [4])[0].x),
+                         int)
+
+        with self.assertRaises(TypeError):
+            Point.from_arrays([1, '5'], [5, 6])
+        with self.assertRaises(TypeError):
+            Point.from_arrays(np.array(['1']), [5])
+        with self.assertRaises(TypeError):
+            Point.from_arrays(np.array([True]), [5])
+        with self.assertRaises(ValueError):
+            Point.from_arrays([1, 2], [5])
@@ -0,0 +1,111 @@
+import copy
+import unittest
+
+import numpy as np
+
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+class TestPointArray(unittest.TestCase):
+
+    def test_init(self):
+        points = PointArray([1, 2.5], [3, 4])
+
+        self.assertEqual(len(points), 2)
+        self.assertEqual(points.x.dtype, np.float64)
+        self.assertTrue(points.x.flags['C_CONTIGUOUS'])
+        self.assertEqual(repr(points), '<PointArray(2)>')
+        self.assertEqual(str(points), '[(1.0, 3.0), (2.5, 4.0)]')
+        self.assertEqual(len(PointArray()), 0)
+
+        with self.assertRaises(TypeError):
+            _ = PointArray(['1'], [2])
+        with self.assertRaises(TypeError):
+            _ = PointArray([True], [2])
+        with self.assertRaises(ValueError):
+            _ = PointArray([1, 2], [2])
+
+    def test_points_conversion(self):
+        points = [Point(1, 5), Point(42, 17.7), Point()]
+        array = PointArray.from_points(points)
+
+        self.assertEqual(array.to_points(), points)
+        self.assertEqual(array[1], Point(42, 17.7))
+        self.assertEqual(array[1:].to_points(), points[1:])
+        self.assertEqual(list(array), points)
+
+        with self.assertRaises(TypeError):
+            _ = PointArray.from_points([Point(), (1, 2)])
+
+    def test_operators(self):
+        a = PointArray([1, 2], [5, 6])
+        b = PointArray([42, 0], [17.7, 1])
+
+        self.assertEqual((a + b).to_points(), [Point(43, 22.7), Point(2, 7)])
+        self.assertEqual((b - a).to_points(),
+                         [Point(41, 17.7 - 5), Point(-2, -5)])
+        self.assertEqual((a + Point(1, 1)).to_points(),
+                         [Point(2, 6), Point(3, 7)])
+        self.assertEqual((Point(1, 1) + a).to_points(),
+                         [Point(2, 6), Point(3, 7)])
+        self.assertEqual((Point(1, 1) - a).to_points(),
+                         [Point(0, -4), Point(-1, -5)])
+        self.assertEqual((a * 2).to_points(), [Point(2, 10), Point(4, 12)])
+        self.assertEqual((2 * a).to_points(), [Point(2, 10), Point(4, 12)])
+
+        c = copy.copy(a)
+        c += b
+        c -= b
+
+        self.assertEqual(c, a)
+        self.assertFalse(c is a)
+        self.assertFalse(c != a)
+
+        with self.assertRaises(TypeError):
+            _ = a + 1
+
+    def test_as_bool(self):
+        points = [Point(), Point(1, 0), Point(0, -1), Point(0.0, 0.0)]
+        mask = PointArray.from_points(points).as_bool()
+
+        self.assertEqual(mask.tolist(), [bool(point) for point in points])
+
+    def test_distance(self):
+        points = [Point(1.5, 7), Point(-3, 4.25), Point(10, 0)]
+        array = PointArray.from_points(points)
+        target = Point(42, 7)
+
+        self.assertEqual(array.distance(target).tolist(),
+                         [point.distance(target) for point in points])
+
+        others = PointArray([0, 1, 2], [3, 4, 5])
+
+        self.assertEqual(array.distance(others).tolist(),
+                         [a.distance(b) for a, b in
+                          zip(points, others.to_points())])
+
+    def test_pairwise_distance(self):
+        points = [Point(1.5, 7), Point(-3, 4.25), Point(10, 0)]
+        array = PointArray.from_points(points)
+        others = PointArray([0, 1], [3, 4])
+
+        self.assertEqual(array.pairwise_distance().tolist(),
+                         [[a.distance(b) for b in points] for a in points])
+        self.assertEqual(array.pairwise_distance(others).shape, (3, 2))
+        self.assertEqual(array.pairwise_distance(others)[2, 1],
+                         points[2].distance(Point(1, 4)))
+        self.assertEqual(array.pairwise_distance(Point(1, 4)).tolist(),
+                         [[point.distance(Point(1, 4))] for point in points])
+
+    def test_distance_rounding(self):
+        rng = np.random.default_rng(7)
+        array = PointArray(rng.normal(size=5000) * 100,
+                           rng.normal(size=5000) * 100)
+        target = Point(18.187797131868248, 7.85952094034661)
+
+        self.assertEqual(array.distance(target).tolist(),
+                         [point.distance(target) for point in array])
+        self.assertEqual(PointArray([np.inf, 0, 5e-324], [np.nan, 0, 0])
+                         .distance(Point(0, 0)).tolist(),
+                         [np.inf, 0, 5e-324])
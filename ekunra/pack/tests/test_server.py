@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+
+from pack.car.car import Car, DriveStatus, OutOfFuel, RefillStatus
+from pack.car.server import FleetClient, FleetServer
+from pack.point.point import Point
+
+
+class TestFleetServer(unittest.TestCase):
+
+    def fleet(self, size=20):
+        return {f'car{i}': Car(100, 1, Point(), 'Zpa') for i in range(size)}
+
+    def test_order_per_car(self):
+        cars = self.fleet()
+
+        async def feed(client, key):
+            statuses = [await client.refill(key, 10)]
+            for step in range(1, 6):
+                statuses.append(await client.drive(key, Point(step, 0)))
+            return statuses
+
+        async def main():
+            async with FleetServer(cars, shards=3, queue_size=4,
+                                   batch_size=2) as server:
+                client = FleetClient(server)
+                results = await asyncio.gather(*(feed(client, key)
+                                                 for key in cars))
+            return server, results
+
+        server, results = asyncio.run(main())
+
+        for statuses in results:
+            self.assertEqual(statuses, [RefillStatus.REFILLED]
+                             + [DriveStatus.MOVED] * 5)
+        for car in cars.values():
+            self.assertEqual(car.location, Point(5, 0))
+            self.assertEqual(car.fuel_amount, 5)
+
+        self.assertEqual(server.processed, 120)
+        self.assertFalse(server.running)
+        self.assertEqual(set(server.latency()), {50, 90, 99})
+        self.assertTrue(all(value >= 0 for value in
+                            server.latency((0, 100)).values()))
+
+    def test_concurrent_commands(self):
+        cars = self.fleet(1)
+
+        async def main():
+            async with FleetServer(cars, queue_size=2) as server:
+                client = FleetClient(server)
+                return await asyncio.gather(
+                    *(client.refill('car0', 1) for _ in range(150)))
+
+        statuses = asyncio.run(main())
+
+        self.assertEqual(statuses.count(RefillStatus.REFILLED), 100)
+        self.assertEqual(statuses[100:],
+                         [RefillStatus.TOO_MUCH_FUEL] * 50)
+        self.assertEqual(cars['car0'].fuel_amount, 100)
+
+    def test_errors(self):
+        cars = self.fleet(2)
+
+        async def main():
+            server = FleetServer(cars)
+            client = FleetClient(server)
+            with self.assertRaises(RuntimeError):
+                await client.drive('car0', Point(1, 0))
+
+            async with server:
+                with self.assertRaises(OutOfFuel):
+                    await client.drive_route('car0', [Point(1, 0)])
+                with self.assertRaises(TypeError):
+                    await client.drive('car1', (1, 0))
+                with self.assertRaises(KeyError):
+                    await client.drive('car2', Point(1, 0))
+                with self.assertRaises(ValueError):
+                    await server.submit('car0', 'fly')
+                self.assertEqual(await client.refill('car1', 1),
+                                 RefillStatus.REFILLED)
+
+        asyncio.run(main())
+
+        self.assertEqual(repr(FleetServer(cars)), '<FleetServer(2, shards=4)>')
+        self.assertEqual(FleetServer(cars).latency(), {})
+        with self.assertRaises(TypeError):
+            FleetServer(['car'])
+        with self.assertRaises(TypeError):
+            FleetClient(cars)
@@ -0,0 +1,135 @@
+import threading
+import unittest
+
+import numpy as np
+
+from pack.car.fleet import CarFleet
+from pack.car.shard import ShardOverflow, ShardedFleet, WorkerFailed, \
+    _work
+from pack.point.point import Point
+from pack.point.point_array import PointArray
+
+
+class TestShardedFleet(unittest.TestCase):
+
+    def setUp(self):
+        generator = np.random.default_rng(1)
+        size = 500
+        self.fleet = CarFleet(generator.uniform(20, 60, size),
+                              generator.uniform(0.1, 1, size),
+                              PointArray(generator.uniform(0, 100, size),
+                                         generator.uniform(0, 100, size)),
+                              generator.uniform(0, 20, size))
+        self.targets = [PointArray(generator.uniform(0, 100, size),
+                                   generator.uniform(0, 100, size))
+                        for _ in range(2)]
+
+    def test_matches_fleet(self):
+        expected = CarFleet(self.fleet.fuel_capacity,
+                            self.fleet.fuel_consumption,
+                            self.fleet.location, self.fleet.fuel_amount)
+
+        with ShardedFleet(self.fleet, shards=3) as sharded:
+            self.assertEqual(sum(sharded.shard_sizes()), 500)
+
+            handed_off = 0
+            for step in range(4):
+                sharded.set_destinations(self.targets[step % 2])
+                sharded.refill(5)
+                stats = sharded.step()
+                handed_off += stats['handed_off']
+
+                refilled = expected.refill_all(5)
+                status = expected.drive_all(self.targets[step % 2])
+                self.assertEqual(stats['moved'],
+                                 np.count_nonzero(status == 0))
+                self.assertEqual(stats['too_much_fuel'],
+                                 np.count_nonzero(refilled))
+
+            fleet = sharded.to_fleet()
+
+        self.assertTrue(handed_off)
+        np.testing.assert_allclose(fleet.fuel_amount, expected.fuel_amount)
+        self.assertEqual(fleet.location, expected.location)
+
+    def test_handoff(self):
+        fleet = CarFleet([50] * 4, [0.1] * 4, PointArray([0, 1, 10, 11],
+                                                         [0] * 4), 50)
+
+        with ShardedFleet(fleet, shards=2, edges=[5]) as sharded:
+            self.assertEqual(sharded.shard_sizes(), [2, 2])
+
+            sharded.set_destinations(Point(20, 0))
+            stats = sharded.step(2)
+
+            self.assertEqual(stats['moved'], 8)
+            self.assertEqual(stats['handed_off'], 2)
+            self.assertEqual(sharded.shard_sizes(), [0, 4])
+            self.assertEqual(sharded.to_fleet().location,
+                             PointArray([20] * 4, [0] * 4))
+
+    def test_exact_fuel(self):
+        destination = Point(18.187797131868248, 7.85952094034661)
+        fuel = Point(0, 0).distance(destination)
+        fleet = CarFleet([100], [1], PointArray([0], [0]), fuel)
+
+        with ShardedFleet(fleet, shards=1) as sharded:
+            sharded.set_destinations(destination)
+            stats = sharded.step()
+
+            self.assertEqual(stats['moved'], 1)
+            self.assertEqual(sharded.to_fleet().fuel_amount.tolist(), [0])
+
+    def test_overflow(self):
+        fleet = CarFleet([50] * 4, [0.1] * 4, PointArray([0, 1, 10, 11],
+                                                         [0] * 4), 50)
+        sharded = ShardedFleet(fleet, shards=2, edges=[5], capacity=3)
+        try:
+            sharded.start()
+            sharded.set_destinations(Point(20, 0))
+            with self.assertRaises(ShardOverflow):
+                sharded.step()
+            self.assertFalse(sharded.running)
+
+            # Broken barrier of the next run is not the old overflow.
+            sharded.start()
+            sharded._barrier.abort()
+            with self.assertRaises(WorkerFailed):
+                sharded.step()
+        finally:
+            sharded.close()
+
+    def test_validation(self):
+        with self.assertRaises(TypeError):
+            ShardedFleet([1, 2])
+        with self.assertRaises(ValueError):
+            ShardedFleet(self.fleet, shards=3, edges=[50])
+        with self.assertRaises(ValueError):
+            ShardedFleet(self.fleet, shards=2, capacity=10)
+
+        sharded = ShardedFleet(self.fleet, shards=2)
+        try:
+            with self.assertRaises(RuntimeError):
+                sharded.step()
+            with self.assertRaises(ValueError):
+                sharded.set_destinations(PointArray([1], [1]))
+            with self.assertRaises(TypeError):
+                sharded.refill('5')
+        finally:
+            sharded.close()
+
+        sharded.close()
+        with self.assertRaises(RuntimeError):
+            sharded.start()
+        with self.assertRaises(RuntimeError):
+            sharded.shard_sizes()
+        with self.assertRaises(RuntimeError):
+            sharded.to_fleet()
+
+    def test_attach_failure(self):
+        barrier = threading.Barrier(2)
+
+        with self.assertRaises(FileNotFoundError):
+            _work(0, [], 'ekunra-missing-block', [], 1, barrier)
+
+        self.assertTrue(barrier.broken)
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from pack.unit.arena import spread
+from pack.unit.simulation import BattleStats, RECORD_DTYPE, run_battles, \
+    simulate
+from pack.unit.unit import Unit
+
+
+class TestSimulation(unittest.TestCase):
+
+    team_a = ([100, 100, 80], [30, 20, 25])
+    team_b = ([120, 90, 90], 25)
+
+    def test_run_battles(self):
+        team_a = tuple(np.asarray(column, dtype=float)
+                       for column in self.team_a)
+        team_b = (np.array([120., 90, 90]), np.full(3, 25.))
+        records = run_battles(team_a, team_b, 50, 11)
+
+        self.assertEqual(records.dtype, RECORD_DTYPE)
+        self.assertEqual(len(records), 50)
+        self.assertTrue(set(records['winner'].tolist()) <= {-1, 0, 1})
+        self.assertTrue(((records['hp_a'] == 0) |
+                         (records['hp_b'] == 0)).all())
+        self.assertEqual(run_battles(team_a, team_b, 50, 11).tolist(),
+                         records.tolist())
+
+    def test_stats(self):
+        stats = BattleStats(bins=4)
+        records = np.array([(0, 3, 0.5, 0), (1, 5, 0, 0.9), (0, 4, 1, 0)],
+                           dtype=RECORD_DTYPE)
+        stats.add(records)
+
+        self.assertEqual(stats.battles, 3)
+        self.assertAlmostEqual(stats.win_rate(0), 2 / 3)
+        self.assertAlmostEqual(stats.win_rate(1), 1 / 3)
+        self.assertEqual(stats.win_rate(None), 0)
+        self.assertEqual(stats.mean_rounds, 4)
+        self.assertEqual(stats.hp_histogram[0].tolist(), [1, 0, 1, 1])
+        self.assertEqual(stats.hp_histogram[1].tolist(), [2, 0, 0, 1])
+
+    def test_simulate(self):
+        seen = []
+        local = simulate(self.team_a, self.team_b, 90, workers=1,
+                         chunk_size=20, seed=5,
+                         on_chunk=lambda stats: seen.append(stats.battles))
+        pooled = simulate(self.team_a, self.team_b, 90, workers=2,
+                          chunk_size=20, seed=5)
+
+        self.assertEqual(seen, [20, 40, 60, 80, 90])
+        self.assertEqual(pooled.battles, 90)
+        self.assertEqual(pooled.win_rate(0), local.win_rate(0))
+        self.assertEqual(pooled.mean_rounds, local.mean_rounds)
+        for pooled_hp, local_hp in zip(pooled.hp_histogram,
+                                       local.hp_histogram):
+            self.assertEqual(pooled_hp.tolist(), local_hp.tolist())
+
+    def test_simulate_units(self):
+        strong = [Unit('Zulu', 300, 60) for _ in range(3)]
+        weak = [Unit('Drozd', 50, 5) for _ in range(3)]
+        stats = simulate(strong, weak, 20, workers=1, policy=spread)
+
+        self.assertEqual(stats.win_rate(0), 1)
+
+        with self.assertRaises(TypeError):
+            simulate([Unit('Zulu'), 'Drozd'], weak, 1, workers=1)
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+
+from pack.car.car import Car
+from pack.point.metric import HAVERSINE, PLANAR, CachedMetric, \
+    EquirectangularMetric, PlanarMetric
+from pack.point.point import Point
+from pack.snapshot.snapshot import Snapshot, SnapshotError, save
+from pack.unit.unit import Unit
+
+
+class ScaledMetric(PlanarMetric):
+
+    def measure(self, x0, y0, x1, y1):
+        return 2 * super().measure(x0, y0, x1, y1)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.snap')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_cars(self):
+        cars = [Car(50 + i, 0.5, Point(i, i + 0.25),
+                    'Zpa' if i % 2 else 'Lada')
+                for i in range(1000)]
+        cars[3].refill(7.5)
+        cars[4].refill(7)
+
+        size = save(self.path, cars)
+
+        self.assertEqual(size, os.path.getsize(self.path))
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 1000)
+            self.assertEqual(repr(snapshot), '<Snapshot(1000 cars)>')
+            self.assertFalse(snapshot.records.flags.writeable)
+            self.assertEqual(snapshot.column('x')[10], 10)
+            self.assertEqual(snapshot.column('model')[:3].tolist(),
+                             [0, 1, 0])
+
+            for car, loaded in [(cars[3], snapshot[3]),
+                                (cars[4], snapshot[4]),
+                                (cars[-1], snapshot[-1])]:
+                self.assertEqual(str(loaded), str(car))
+                self.assertEqual(loaded.location, car.location)
+                self.assertIs(type(loaded.fuel_amount),
+                              type(car.fuel_amount))
+
+            self.assertEqual([car.model for car in snapshot[:4]],
+                             ['Lada', 'Zpa', 'Lada', 'Zpa'])
+            self.assertEqual(sum(1 for _ in snapshot), 1000)
+
+    def test_car_metrics(self):
+        cached = CachedMetric(HAVERSINE, 16)
+        cars = [Car(), Car(metric=PLANAR), Car(metric=HAVERSINE),
+                Car(metric=EquirectangularMetric(1)), Car(metric=cached),
+                Car(metric=cached)]
+
+        save(self.path, cars)
+
+        with Snapshot(self.path) as snapshot:
+            loaded = list(snapshot)
+            self.assertIsNone(loaded[0].metric)
+            self.assertIs(loaded[1].metric, PLANAR)
+            self.assertIs(loaded[2].metric, HAVERSINE)
+            self.assertIsInstance(loaded[3].metric, EquirectangularMetric)
+            self.assertEqual(loaded[3].metric.radius, 1)
+            self.assertIs(loaded[4].metric, loaded[5].metric)
+            self.assertIs(loaded[4].metric.metric, HAVERSINE)
+            self.assertEqual(loaded[4].metric.cache_info().maxsize, 16)
+
+    def test_unbounded_cache(self):
+        save(self.path, [Car(metric=CachedMetric(HAVERSINE, None))])
+
+        with Snapshot(self.path) as snapshot:
+            metric = snapshot[0].metric
+            self.assertIsInstance(metric, CachedMetric)
+            self.assertIs(metric.metric, HAVERSINE)
+            self.assertIsNone(metric.cache_info().maxsize)
+
+    def test_units(self):
+        units = [Unit('Zulu', 100, 20.5), Unit('Hotel', 90.5, 10)]
+        units[1].attack(units[0])
+
+        save(self.path, units)
+
+        with Snapshot(self.path) as snapshot:
+            loaded = list(snapshot)
+            self.assertEqual([str(unit) for unit in loaded],
+                             [str(unit) for unit in units])
+            self.assertEqual(loaded[0].hp_limit, 100)
+
+        save(self.path, [Unit('Zulu', 2 ** 53, -2 ** 53)])
+
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(snapshot[0].hp_limit, 2 ** 53)
+            self.assertEqual(snapshot[0].damage, -2 ** 53)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            save(self.path, [Car(), Unit('Zulu')])
+        with self.assertRaises(TypeError):
+            save(self.path, [Car(car_model=None)])
+        with self.assertRaises(TypeError):
+            save(self.path, [Car(metric=ScaledMetric())])
+        with self.assertRaises(ValueError):
+            save(self.path, [Car(50, 1, Point(10 ** 17 + 1, 0))])
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
+
+        with open(self.path, 'wb') as file:
+            file.write(b'NOTASNAPSHOT' * 10)
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
+
+        save(self.path, [Unit('Zulu')])
+        with open(self.path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.path) - 2)
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
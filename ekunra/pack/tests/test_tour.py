@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from pack.car.car import Car
+from pack.car.planner import Unreachable, execute
+from pack.car.tour import order_drops, plan_tour
+from pack.point.point import Point
+
+
+def path_length(origin, points):
+    legs = [origin] + points
+    return sum(a.distance(b) for a, b in zip(legs, legs[1:]))
+
+
+class TestTour(unittest.TestCase):
+
+    def test_order_drops(self):
+        drops = [Point(3, 0), Point(1, 0), Point(4, 0), Point(2, 0)]
+
+        self.assertEqual(order_drops(Point(), drops), [1, 3, 0, 2])
+        self.assertEqual(order_drops(Point(), []), [])
+        self.assertEqual(order_drops(Point(), [Point(1, 1)]), [0])
+        with self.assertRaises(TypeError):
+            order_drops((0, 0), drops)
+
+    def test_order_improves(self):
+        rnd = random.Random(5)
+        drops = [Point(rnd.uniform(0, 100), rnd.uniform(0, 100))
+                 for _ in range(200)]
+        order = order_drops(Point(50, 50), drops, time_budget=0.5)
+
+        self.assertEqual(sorted(order), list(range(200)))
+
+        nearest = order_drops(Point(50, 50), drops, time_budget=0)
+
+        self.assertLess(path_length(Point(50, 50),
+                                    [drops[i] for i in order]),
+                        path_length(Point(50, 50),
+                                    [drops[i] for i in nearest]))
+
+    def test_plan_tour(self):
+        drops = [Point(30, 0), Point(10, 0), Point(40, 0), Point(20, 0)]
+        stations = [Point(12, 1), Point(30, 1)]
+        car = Car(20, 1, Point(), 'Zpa')
+        car.refill(15)
+
+        tour = plan_tour(car, drops, stations)
+
+        self.assertEqual(tour.order, [1, 3, 0, 2])
+        self.assertEqual(tour.stops[0], Point(10, 0))
+        self.assertIn(Point(12, 1), tour.stops)
+        self.assertEqual(car.fuel_amount, 15)
+        self.assertEqual(car.location, Point())
+
+        execute(car, tour)
+
+        self.assertEqual(car.location, Point(40, 0))
+        self.assertAlmostEqual(tour.distance,
+                               path_length(Point(), tour.stops))
+
+        with self.assertRaises(Unreachable):
+            plan_tour(Car(20, 1, Point(), 'Zpa'), drops, stations[1:])
+        with self.assertRaises(TypeError):
+            plan_tour('car', drops, stations)
+
+    def test_plan_tour_dense_stations(self):
+        for seed in range(5):
+            rnd = random.Random(seed)
+            stations = [Point(rnd.uniform(0, 100), rnd.uniform(0, 100))
+                        for _ in range(200)]
+            drops = [Point(rnd.uniform(0, 100), rnd.uniform(0, 100))
+                     for _ in range(80)]
+            car = Car(30, 1, Point(50, 50))
+            car.refill(30)
+
+            tour = plan_tour(car, drops, stations)
+            execute(car, tour)
+
+            self.assertEqual(car.location, drops[tour.order[-1]])
+
+    def test_plan_tour_without_stations(self):
+        drops = [Point(10, 0), Point(20, 0), Point(30, 0)]
+        car = Car(40, 1, Point())
+        car.refill(30)
+
+        tour = plan_tour(car, drops)
+
+        self.assertEqual(tour.stops, drops)
+        self.assertEqual(tour.refills, [0, 0, 0])
@@ -1,6 +1,7 @@
+import copy
 import unittest
 
-from pack.unit.unit import Unit, UnitIsDead
+from pack.unit.unit import AttackStatus, Unit, UnitIsDead
 
 
 class TestUnit(unittest.TestCase):
@@ -36,6 +37,32 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(repr(self.unit),
                          '<Unit [name:Zulu, hp:120/120, damage:30]>')
 
+    def test_slots(self):
+        u = Unit('Drozd', hp=100, dmg=30)
+        u_copy = copy.copy(u)
+
+        self.assertFalse(hasattr(u, '__dict__'))
+        self.assertFalse(u is u_copy)
+        self.assertEqual(repr(u_copy), repr(u))
+        with self.assertRaises(AttributeError):
+            u.armor = 10
+
+    def test_bulk(self):
+        units = Unit.bulk(['Zulu', 'Drozd'], [120, 100.5], [30, 20])
+
+        self.assertEqual([repr(unit) for unit in units],
+                         ['<Unit [name:Zulu, hp:120/120, damage:30]>',
+                          '<Unit [name:Drozd, hp:100.5/100.5, damage:20]>'])
+
+        with self.assertRaises(TypeError):
+            Unit.bulk(['Zulu', 10], [120, 100], [30, 20])
+        with self.assertRaises(TypeError):
+            Unit.bulk(['Zulu', 'Drozd'], [120, '100'], [30, 20])
+        with self.assertRaises(TypeError):
+            Unit.bulk(['Zulu', 'Drozd'], [120, 100], [30, None])
+        with self.assertRaises(ValueError):
+            Unit.bulk(['Zulu'], [120, 100], [30, 20])
+
     def test_ensure_is_alive(self):
         u = Unit('Kolya')
         u._health_points = 0
@@ -110,3 +137,26 @@ class TestUnit(unittest.TestCase):
             u.attack(v)
         self.assertEqual(u.hp, 0)
         self.assertEqual(v.hp, 40)
+
+    def test_try_attack(self):
+        u = Unit('Drozd', hp=100, dmg=30)
+        v = Unit('Grach', hp=100, dmg=30)
+
+        self.assertEqual(u.try_attack(v), AttackStatus.HIT)
+        self.assertEqual(u.hp, 85)
+        self.assertEqual(v.hp, 70)
+
+        v._health_points = 20
+
+        self.assertEqual(u.try_attack(v), AttackStatus.TARGET_KILLED)
+        self.assertEqual(u.hp, 85)
+        self.assertEqual(v.hp, 0)
+        self.assertEqual(v.try_attack(u), AttackStatus.ATTACKER_DEAD)
+        self.assertEqual(u.hp, 85)
+
+        w = Unit('Sokol', hp=100, dmg=200)
+        u._health_points = 50
+
+        self.assertEqual(u.try_attack(w), AttackStatus.ATTACKER_KILLED)
+        self.assertEqual(u.hp, 0)
+        self.assertEqual(w.hp, 70)
@@ -0,0 +1,294 @@
+import numpy as np
+
+from pack.unit.unit import Unit
+
+
+def spread(attackers, targets, enemy_hp, rng):
+    """Targeting policy spreading attackers evenly over alive enemies"""
+    return targets[np.arange(len(attackers)) % len(targets)]
+
+
+def focus_weakest(attackers, targets, enemy_hp, rng):
+    """Targeting policy sending every attacker to the weakest enemy"""
+    weakest = targets[np.argmin(enemy_hp[targets])]
+    return np.full(len(attackers), weakest)
+
+
+def focus_strongest(attackers, targets, enemy_hp, rng):
+    """Targeting policy sending every attacker to the strongest enemy"""
+    strongest = targets[np.argmax(enemy_hp[targets])]
+    return np.full(len(attackers), strongest)
+
+
+def random_target(attackers, targets, enemy_hp, rng):
+    """Targeting policy picking an alive enemy at random per attacker"""
+    return targets[rng.integers(0, len(targets), len(attackers))]
+
+
+class Arena:
+    """Class representing a battle of two teams of units kept as columns of
+    their health points, health points limit and damage"""
+
+    dtype = np.float64
+
+    def _validate_numeric(self, values, size):
+        """
+        Checks if column of numbers of correct Type.
+
+        :param values: Numbers to validate, single number is broadcast
+        :type values: Any
+        :param size: Expected column length
+        :type size: int
+        :raise TypeError: In case values are not int or float numbers
+
+        :return: Validated float64 column
+        :rtype: numpy.ndarray
+        """
+
+        column = np.asarray(values)
+
+        if column.dtype.kind not in 'iuf' or column.ndim > 1:
+            raise TypeError
+
+        return np.array(np.broadcast_to(column, (size,)), dtype=self.dtype)
+
+    def _validate_side(self, side):
+        if side not in (0, 1):
+            raise ValueError('Side must be 0 or 1')
+
+        return side
+
+    def __init__(self, team_a, team_b, policy=spread, seed=None):
+        """
+        Initializer
+
+        :param team_a: Units of first side
+        :type team_a: iterable of Unit
+        :param team_b: Units of second side
+        :type team_b: iterable of Unit
+        :param policy: Targeting policy of both sides
+        :type policy: callable
+        :param seed: Seed of random generator passed to policies
+        :type seed: int
+        :raise TypeError: object instantiated with incorrect data
+        """
+
+        self._hp = [None, None]
+        self._hp_limit = [None, None]
+        self._damage = [None, None]
+        self._names = [None, None]
+
+        for side, team in enumerate((team_a, team_b)):
+            team = list(team)
+            if not all(isinstance(unit, Unit) for unit in team):
+                raise TypeError
+
+            self._set_side(side,
+                           [unit.hp for unit in team],
+                           [unit.hp_limit for unit in team],
+                           [unit.damage for unit in team],
+                           [unit.name for unit in team])
+
+        self._policy = [policy, policy]
+        self._rng = np.random.default_rng(seed)
+        self._rounds = 0
+
+    @classmethod
+    def from_arrays(cls, hp_a, dmg_a, hp_b, dmg_b, policy=spread,
+                    seed=None):
+        """
+        Builds arena of fresh units from columns of their stats.
+
+        :param hp_a: Health points of first side
+        :type hp_a: sequence or numpy.ndarray
+        :param dmg_a: Damage of first side, one or per unit
+        :type dmg_a: int, float, sequence or numpy.ndarray
+        :param hp_b: Health points of second side
+        :type hp_b: sequence or numpy.ndarray
+        :param dmg_b: Damage of second side, one or per unit
+        :type dmg_b: int, float, sequence or numpy.ndarray
+        :raise TypeError: In case stats are not int or float numbers
+        :rtype: Arena
+        """
+
+        arena = cls((), (), policy, seed)
+        for side, (hp, dmg) in enumerate(((hp_a, dmg_a), (hp_b, dmg_b))):
+            arena._set_side(side, hp, hp, dmg, ['Unit'] * len(hp))
+
+        return arena
+
+    def _set_side(self, side, hp, hp_limit, damage, names):
+        size = len(names)
+        self._hp[side] = self._validate_numeric(hp, size)
+        self._hp_limit[side] = self._validate_numeric(hp_limit, size)
+        self._damage[side] = self._validate_numeric(damage, size)
+        self._names[side] = names
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} ' \
+               f'[{self.alive(0).sum()}/{len(self._hp[0])} vs ' \
+               f'{self.alive(1).sum()}/{len(self._hp[1])}, ' \
+               f'rounds:{self._rounds}]>'
+
+    def set_policy(self, side, policy):
+        """
+        Sets targeting policy of one side.
+
+        A policy is called as policy(attackers, targets, enemy_hp, rng)
+        with indices of alive attackers and alive enemies and returns
+        index of enemy attacked by every attacker.
+
+        :param side: Side number, 0 or 1
+        :type side: int
+        :param policy: Targeting policy
+        :type policy: callable
+        """
+
+        self._policy[self._validate_side(side)] = policy
+
+    def alive(self, side):
+        """Returns mask of alive units of the side"""
+        return self._hp[self._validate_side(side)] > 0
+
+    def attack(self, side):
+        """
+        Makes every alive unit of the side attack an alive enemy chosen by
+        side's policy.
+
+        The volley is simultaneous: enemies take all the damage first, then
+        every enemy still alive counter attacks each of its attackers with
+        half damage power. Dead units neither attack nor counter attack.
+
+        :param side: Attacking side number, 0 or 1
+        :type side: int
+
+        :return: Number of enemies killed by the volley
+        :rtype: int
+        """
+
+        side = self._validate_side(side)
+        enemy = 1 - side
+        hp, enemy_hp = self._hp[side], self._hp[enemy]
+
+        attackers = np.flatnonzero(hp > 0)
+        targets = np.flatnonzero(enemy_hp > 0)
+        if not len(attackers) or not len(targets):
+            return 0
+
+        chosen = np.asarray(self._policy[side](attackers, targets, enemy_hp,
+                                               self._rng))
+
+        damage = np.bincount(chosen, weights=self._damage[side][attackers],
+                             minlength=len(enemy_hp))
+        enemy_hp -= damage
+        np.maximum(enemy_hp, 0, out=enemy_hp)
+
+        survived = enemy_hp[chosen] > 0
+        counter_damage = self._damage[enemy][chosen[survived]] / 2
+        counter = np.bincount(attackers[survived], weights=counter_damage,
+                              minlength=len(hp))
+        hp -= counter
+        np.maximum(hp, 0, out=hp)
+
+        return int(np.count_nonzero(enemy_hp[targets] <= 0))
+
+    def heal(self, side, amounts, where=None):
+        """
+        Adds health points to alive units of the side, capped at their
+        health points limit. Dead units are skipped.
+
+        :param side: Side number, 0 or 1
+        :type side: int
+        :param amounts: Health points to be added, one or per unit
+        :type amounts: int, float, sequence or numpy.ndarray
+        :param where: Mask of units to heal, all units by default, truthy
+        values count as True
+        :type where: sequence or numpy.ndarray
+        :raise TypeError: In case amounts are not int or float numbers
+        """
+
+        side = self._validate_side(side)
+        hp = self._hp[side]
+        amounts = self._validate_numeric(amounts, len(hp))
+
+        healed = hp > 0
+        if where is not None:
+            healed &= np.asarray(where, dtype=bool)
+
+        np.add(hp, amounts, out=hp, where=healed)
+        np.minimum(hp, self._hp_limit[side], out=hp, where=healed)
+
+    def round(self, first=0):
+        """
+        Plays one round: the first side attacks, then the other one.
+
+        :param first: Side attacking first, 0 or 1
+        :type first: int
+        """
+
+        first = self._validate_side(first)
+        self.attack(first)
+        self.attack(1 - first)
+        self._rounds += 1
+
+    def run(self, max_rounds=None, first=0):
+        """
+        Plays rounds until one of sides has no alive units, or a round
+        changes no health points, so that the next ones would not either.
+
+        :param max_rounds: Limit of rounds, unlimited by default
+        :type max_rounds: int
+        :param first: Side attacking first in every round, 0 or 1
+        :type first: int
+
+        :return: Winner side number, None if there is no winner yet or
+        fight stalls
+        :rtype: int or None
+        """
+
+        played = 0
+        while self.alive(0).any() and self.alive(1).any() \
+                and (max_rounds is None or played < max_rounds):
+            before = [hp.copy() for hp in self._hp]
+            self.round(first)
+            played += 1
+            if all(np.array_equal(hp, old)
+                   for hp, old in zip(self._hp, before)):
+                break
+
+        return self.winner
+
+    def to_units(self, side):
+        """Returns list of Units with the same state as side's units"""
+        side = self._validate_side(side)
+        units = Unit.bulk(self._names[side], self._hp_limit[side],
+                          self._damage[side])
+        for unit, hp in zip(units, self._hp[side].tolist()):
+            unit._health_points = hp
+
+        return units
+
+    @property
+    def winner(self):
+        alive_a, alive_b = self.alive(0).any(), self.alive(1).any()
+        if alive_a and not alive_b:
+            return 0
+        if alive_b and not alive_a:
+            return 1
+        return None
+
+    @property
+    def rounds(self):
+        return self._rounds
+
+    @property
+    def hp(self):
+        return tuple(self._hp)
+
+    @property
+    def hp_limit(self):
+        return tuple(self._hp_limit)
+
+    @property
+    def damage(self):
+        return tuple(self._damage)
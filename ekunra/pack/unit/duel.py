@@ -0,0 +1,373 @@
+from collections import namedtuple
+from fractions import Fraction
+from math import ceil
+
+import numpy as np
+
+from pack.unit.unit import Unit
+
+
+DuelResult = namedtuple('DuelResult', ['winner', 'rounds', 'hp_a', 'hp_b'])
+DuelResult.__doc__ = """Outcome of a duel.
+
+Attributes:
+    winner -- surviving Unit, None if nobody dies or both were dead
+    rounds -- number of attack() calls made, None if fight never ends
+    hp_a, hp_b -- final health points of both units
+"""
+
+DuelTable = namedtuple('DuelTable', ['winner', 'rounds', 'hp_a', 'hp_b'])
+DuelTable.__doc__ = """Outcomes of many duels as arrays.
+
+Attributes:
+    winner -- 0 if a wins, 1 if b wins, -1 if there is no winner
+    rounds -- number of attack() calls made, -1 if fight never ends
+    hp_a, hp_b -- final health points of both sides
+"""
+
+# Grid values below this bound are exact float64 integers.
+_EXACT_LIMIT = 2 ** 53
+
+# Most rounds of inexact fights replayed hit by hit, longer ones are
+# resolved in closed form with exact rational math instead.
+_SIMULATE_LIMIT = 10000
+
+# Kill events in the order they can happen during one cycle of the fight:
+# (attack of the cycle, unit which dies, full hits and counter hits taken
+# by the first attacker, full hits and counter hits taken by the other).
+_EVENTS = (
+    (1, 'other', 0, 0, 1, 0),
+    (1, 'first', 0, 1, 1, 0),
+    (2, 'first', 1, 1, 1, 0),
+    (2, 'other', 1, 1, 1, 1),
+)
+
+
+def _validate_unit(unit):
+    """
+    Checks if unit of correct Type.
+
+    :param unit: Unit to validate
+    :type unit: Any
+    :raise TypeError: In case argument is not Unit class object
+
+    :return: Validated unit
+    :rtype: Unit
+    """
+
+    if not isinstance(unit, Unit):
+        raise TypeError
+
+    return unit
+
+
+def _hits_needed(hp, full, counter, full_hits, counter_hits):
+    """
+    Returns number of whole cycles after which the unit's health points
+    drop to zero at the given event, None if they never do.
+    """
+
+    per_cycle = full + counter
+    if per_cycle <= 0:
+        return None
+
+    left = hp - full_hits * full - counter_hits * counter
+    return max(0, ceil(left / per_cycle))
+
+
+def _after_hits(hp, full, counter, full_hits, counter_hits):
+    """
+    Returns health points after hits taken one by one with take_damage,
+    keeping its int/float result types and clamp to zero.
+    """
+
+    left = hp
+    if full_hits:
+        left = left - full_hits * full
+    if counter_hits:
+        left = left - counter_hits * counter
+
+    if left < 0:
+        return 0
+
+    return left
+
+
+def _is_exact(values):
+    """
+    Checks if every partial sum of hits is exactly representable, so
+    that closed-form results are identical to hits taken one by one.
+    """
+
+    grid = max(value.denominator for value in values)
+    bound = max(abs(value) for value in values) * grid
+
+    return bound < _EXACT_LIMIT
+
+
+def _simulate(hp_first, dmg_first, hp_other, dmg_other):
+    """
+    Resolves fight hit by hit, the same arithmetic attack() does.
+
+    :return: rounds and final health points, None rounds if fight stalls
+    :rtype: tuple
+    """
+
+    half_first, half_other = dmg_first / 2, dmg_other / 2
+    rounds = 0
+
+    while True:
+        start = hp_first, hp_other
+
+        rounds += 1
+        hp_other -= dmg_first
+        if hp_other < 0:
+            hp_other = 0
+        if hp_other <= 0:
+            break
+        hp_first -= half_other
+        if hp_first < 0:
+            hp_first = 0
+        if hp_first <= 0:
+            break
+
+        rounds += 1
+        hp_first -= dmg_other
+        if hp_first < 0:
+            hp_first = 0
+        if hp_first <= 0:
+            break
+        hp_other -= half_first
+        if hp_other < 0:
+            hp_other = 0
+        if hp_other <= 0:
+            break
+
+        if (hp_first, hp_other) == start:
+            return None, hp_first, hp_other
+
+    return rounds, hp_first, hp_other
+
+
+def _resolve(hp_first, dmg_first, hp_other, dmg_other):
+    """
+    Resolves fight of two alive units in closed form.
+
+    Stats whose hits add up exactly give the results of hits taken one by
+    one. Other fights are replayed hit by hit up to _SIMULATE_LIMIT rounds,
+    longer ones keep the exact rational result rounded to float, which may
+    differ from the step-by-step fight by accumulated rounding error.
+
+    :return: rounds and final health points, None rounds if fight never
+    ends
+    :rtype: tuple
+    """
+
+    half_first, half_other = dmg_first / 2, dmg_other / 2
+    h_first, h_other = Fraction(hp_first), Fraction(hp_other)
+    d_first, d_other = Fraction(dmg_first), Fraction(dmg_other)
+    c_first, c_other = Fraction(half_first), Fraction(half_other)
+
+    end = None
+    for number, (attack, dying, f_full, f_counter, o_full, o_counter) \
+            in enumerate(_EVENTS):
+        if dying == 'first':
+            cycles = _hits_needed(h_first, d_other, c_other,
+                                  f_full, f_counter)
+        else:
+            cycles = _hits_needed(h_other, d_first, c_first,
+                                  o_full, o_counter)
+        if cycles is None:
+            continue
+
+        key = (2 * cycles + attack, number)
+        if end is None or key < end[0]:
+            end = key, cycles, f_full, f_counter, o_full, o_counter
+
+    if end is None:
+        return None, hp_first, hp_other
+
+    (rounds, _), cycles, f_full, f_counter, o_full, o_counter = end
+    hits_first = cycles + f_full, cycles + f_counter
+    hits_other = cycles + o_full, cycles + o_counter
+
+    final_first = h_first - hits_first[0] * d_other \
+        - hits_first[1] * c_other
+    final_other = h_other - hits_other[0] * d_first \
+        - hits_other[1] * c_first
+
+    if not _is_exact([h_first, h_other, d_first, d_other, c_first, c_other,
+                      final_first, final_other]):
+        if rounds <= _SIMULATE_LIMIT:
+            return _simulate(hp_first, dmg_first, hp_other, dmg_other)
+        return rounds, float(max(final_first, 0)), float(max(final_other, 0))
+
+    return (rounds,
+            _after_hits(hp_first, dmg_other, half_other, *hits_first),
+            _after_hits(hp_other, dmg_first, half_first, *hits_other))
+
+
+def duel(a, b, first=None):
+    """
+    Computes the outcome of two units attacking each other in turns
+    until one of them dies, without touching the units.
+
+    The result is the same as of the step-by-step fight::
+
+        attacker, defender = first, other
+        while a.hp > 0 and b.hp > 0:
+            try:
+                attacker.attack(defender)
+            except UnitIsDead:
+                pass
+            attacker, defender = defender, attacker
+
+    Fights of float stats longer than _SIMULATE_LIMIT rounds, whose hits
+    do not add up exactly, are resolved with exact rational math instead,
+    so their health points may differ by the rounding error the
+    step-by-step fight accumulates.
+
+    :param a: First duelist
+    :type a: Unit
+    :param b: Second duelist
+    :type b: Unit
+    :param first: Duelist attacking first, a by default
+    :type first: Unit
+    :raise TypeError: In case duelists are not Unit class objects
+    :raise ValueError: In case first is neither a nor b
+
+    :return: Winner, rounds and final health points
+    :rtype: DuelResult
+    """
+
+    a, b = _validate_unit(a), _validate_unit(b)
+    first = a if first is None else first
+
+    if first is not a and first is not b:
+        raise ValueError('First attacker must be one of duelists')
+
+    if a.hp <= 0 or b.hp <= 0:
+        winner = a if a.hp > 0 else b if b.hp > 0 else None
+        return DuelResult(winner, 0, a.hp, b.hp)
+
+    other = b if first is a else a
+    rounds, hp_first, hp_other = _resolve(first.hp, first.damage,
+                                          other.hp, other.damage)
+
+    hp_a, hp_b = (hp_first, hp_other) if first is a else (hp_other, hp_first)
+    if rounds is None:
+        winner = None
+    else:
+        winner = a if hp_a > 0 else b
+
+    return DuelResult(winner, rounds, hp_a, hp_b)
+
+
+def _is_integral(values):
+    """Checks which values are integers small enough for exact math"""
+    return (values == np.floor(values)) & (np.abs(values) < 2 ** 50)
+
+
+def duel_table(hp_a, dmg_a, hp_b, dmg_b, a_first=True):
+    """
+    Computes outcomes of many duels at once, e.g. a whole matchup table
+    from a column and a row of unit stats which broadcast to a matrix.
+
+    Integer stats are resolved with exact integer array math in half
+    health points, the rest falls back to duel arithmetic per pair. Float
+    fights whose hits do not add up exactly are replayed hit by hit up to
+    _SIMULATE_LIMIT rounds, longer ones are resolved with exact rational
+    math and may differ from the step-by-step fight by its accumulated
+    rounding error. Scalar stats give 0-d arrays.
+
+    :param hp_a: Health points of first duelists
+    :type hp_a: numpy.ndarray
+    :param dmg_a: Damage of first duelists
+    :type dmg_a: numpy.ndarray
+    :param hp_b: Health points of second duelists
+    :type hp_b: numpy.ndarray
+    :param dmg_b: Damage of second duelists
+    :type dmg_b: numpy.ndarray
+    :param a_first: Whether first duelists attack first
+    :type a_first: bool or numpy.ndarray
+
+    :return: Winners, rounds and final health points as arrays
+    :rtype: DuelTable
+    """
+
+    hp_a, dmg_a, hp_b, dmg_b, a_first = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64)
+          for value in (hp_a, dmg_a, hp_b, dmg_b)),
+        np.asarray(a_first, dtype=bool))
+    shape = hp_a.shape
+    hp_a, dmg_a, hp_b, dmg_b, a_first = (
+        np.atleast_1d(value) for value in (hp_a, dmg_a, hp_b, dmg_b, a_first))
+
+    hp_f = np.where(a_first, hp_a, hp_b)
+    dmg_f = np.where(a_first, dmg_a, dmg_b)
+    hp_o = np.where(a_first, hp_b, hp_a)
+    dmg_o = np.where(a_first, dmg_b, dmg_a)
+
+    alive = (hp_f > 0) & (hp_o > 0)
+    exact = alive & _is_integral(hp_f) & _is_integral(dmg_f) \
+        & _is_integral(hp_o) & _is_integral(dmg_o)
+
+    # In half health points every hit is an integer: full hits are 2 * dmg
+    # and counter hits are dmg.
+    h_f = np.where(exact, 2 * hp_f, 0).astype(np.int64)
+    h_o = np.where(exact, 2 * hp_o, 0).astype(np.int64)
+    d_f = np.where(exact, dmg_f, 0).astype(np.int64)
+    d_o = np.where(exact, dmg_o, 0).astype(np.int64)
+
+    never = np.iinfo(np.int64).max
+    end_time = np.full(hp_f.shape, never, dtype=np.int64)
+    end_event = np.full(hp_f.shape, -1, dtype=np.int64)
+    end_cycles = np.zeros(hp_f.shape, dtype=np.int64)
+
+    for number, event in enumerate(_EVENTS):
+        attack, dying, f_full, f_counter, o_full, o_counter = event
+        if dying == 'first':
+            hp, dmg, full, counter = h_f, d_o, f_full, f_counter
+        else:
+            hp, dmg, full, counter = h_o, d_f, o_full, o_counter
+
+        per_cycle = np.where(dmg > 0, 3 * dmg, 1)
+        left = hp - full * 2 * dmg - counter * dmg
+        cycles = np.maximum(0, -(-left // per_cycle))
+        time = np.where(dmg > 0, 2 * cycles + attack, never)
+
+        better = time < end_time
+        end_time = np.where(better, time, end_time)
+        end_event = np.where(better, number, end_event)
+        end_cycles = np.where(better, cycles, end_cycles)
+
+    hits = np.array([event[2:] for event in _EVENTS], dtype=np.int64)
+    picked = hits[np.maximum(end_event, 0)] + end_cycles[..., None]
+
+    final_f = h_f - picked[..., 0] * 2 * d_o - picked[..., 1] * d_o
+    final_o = h_o - picked[..., 2] * 2 * d_f - picked[..., 3] * d_f
+    ended = end_event >= 0
+
+    rounds = np.where(ended, end_time, -1)
+    hp_f_end = np.where(ended, np.maximum(final_f, 0) / 2, hp_f)
+    hp_o_end = np.where(ended, np.maximum(final_o, 0) / 2, hp_o)
+
+    for index in zip(*np.nonzero(alive & ~exact)):
+        pair_rounds, pair_f, pair_o = _resolve(float(hp_f[index]),
+                                               float(dmg_f[index]),
+                                               float(hp_o[index]),
+                                               float(dmg_o[index]))
+        rounds[index] = -1 if pair_rounds is None else pair_rounds
+        hp_f_end[index], hp_o_end[index] = pair_f, pair_o
+
+    rounds = np.where(alive, rounds, 0)
+    hp_f_end = np.where(alive, hp_f_end, hp_f)
+    hp_o_end = np.where(alive, hp_o_end, hp_o)
+
+    result_a = np.where(a_first, hp_f_end, hp_o_end)
+    result_b = np.where(a_first, hp_o_end, hp_f_end)
+    winner = np.where(result_a > 0, 0, np.where(result_b > 0, 1, -1))
+    winner = np.where(rounds < 0, -1, winner).astype(np.int8)
+
+    return DuelTable(*(value.reshape(shape) for value in (
+        winner, rounds, result_a, result_b)))
@@ -0,0 +1,226 @@
+import numpy as np
+
+from pack.unit.unit import Unit
+
+
+class EffectEngine:
+    """Class applying timed effects, such as poison or regeneration, to
+    units kept as columns of their health points and health points limit.
+
+    Effects are summed into per unit damage and heal rates, so a tick
+    costs as much as the number of units under some effect, however many
+    effects they are. Effects are bucketed by their last tick and taken
+    off the rates only when that tick is over, units without effects are
+    never touched."""
+
+    def _validate_column(self, values, size=None):
+        """
+        Checks if column of health points of correct Type.
+
+        :param values: Column to validate
+        :type values: Any
+        :param size: Expected column length
+        :type size: int
+        :raise TypeError: In case values are not one-dimensional float64
+        numpy.ndarray
+        :raise ValueError: In case column is of wrong length
+
+        :return: Validated column
+        :rtype: numpy.ndarray
+        """
+
+        if not isinstance(values, np.ndarray) or values.dtype != np.float64 \
+                or values.ndim != 1:
+            raise TypeError
+        if size is not None and len(values) != size:
+            raise ValueError('Columns must be of equal length')
+
+        return values
+
+    def __init__(self, hp, hp_limit):
+        """
+        Initializer
+
+        :param hp: Health points of units, updated in place, such as
+        Arena.hp of a side
+        :type hp: numpy.ndarray
+        :param hp_limit: Health points limit of units
+        :type hp_limit: numpy.ndarray
+        :raise TypeError: In case columns are not float64 numpy.ndarray
+        :raise ValueError: In case columns are of different length
+        """
+
+        self._hp = self._validate_column(hp)
+        self._hp_limit = self._validate_column(hp_limit, len(hp))
+
+        size = len(hp)
+        self._damage = np.zeros(size)
+        self._heal = np.zeros(size)
+        self._count = np.zeros(size, dtype=np.int64)
+        self._touched = np.zeros(0, dtype=np.intp)
+        self._buckets = {}
+        self._active = 0
+        self._now = 0
+
+    @classmethod
+    def from_units(cls, units):
+        """
+        Builds engine over columns of units' state.
+
+        :param units: Units to apply effects to
+        :type units: iterable of Unit
+        :raise TypeError: In case some item is not Unit
+        :rtype: EffectEngine
+        """
+
+        units = list(units)
+        if not all(isinstance(unit, Unit) for unit in units):
+            raise TypeError
+
+        return cls(np.array([unit.hp for unit in units], dtype=np.float64),
+                   np.array([unit.hp_limit for unit in units],
+                            dtype=np.float64))
+
+    def update_units(self, units):
+        """
+        Writes health points back to the units engine was built from.
+
+        :param units: Units in the same order
+        :type units: sequence of Unit
+        :raise ValueError: In case number of units differs
+        """
+
+        if len(units) != len(self._hp):
+            raise ValueError('One unit per column item expected')
+
+        for unit, hp in zip(units, self._hp.tolist()):
+            unit._health_points = hp
+
+    def __len__(self):
+        return self._active
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [effects:{self._active}, ' \
+               f'units:{len(self._touched)}, tick:{self._now}]>'
+
+    def _spread(self, targets, damage, heal, sign):
+        """Adds or takes effects off rates of their targets"""
+        np.add.at(self._count, targets, sign)
+        np.add.at(self._damage, targets, damage * sign)
+        np.add.at(self._heal, targets, heal * sign)
+
+    def add(self, targets, amounts, duration):
+        """
+        Adds effects applied on each of the next duration ticks: negative
+        amounts damage their target, positive ones heal it.
+
+        :param targets: Index of unit of every effect
+        :type targets: int, sequence or numpy.ndarray
+        :param amounts: Health points per tick, one or per effect
+        :type amounts: int, float, sequence or numpy.ndarray
+        :param duration: Number of ticks, one or per effect
+        :type duration: int, sequence or numpy.ndarray
+        :raise TypeError: In case arguments are not numbers of proper type
+        :raise ValueError: In case targets are out of range or durations
+        are not positive
+        """
+
+        targets = np.atleast_1d(np.asarray(targets))
+        amounts = np.asarray(amounts)
+        durations = np.asarray(duration)
+        if targets.dtype.kind not in 'iu' or targets.ndim != 1 \
+                or amounts.dtype.kind not in 'iuf' \
+                or durations.dtype.kind not in 'iu':
+            raise TypeError
+        if not len(targets):
+            return
+        if targets.min() < 0 or targets.max() >= len(self._hp):
+            raise ValueError('Targets must be indices of units')
+        if durations.min() < 1:
+            raise ValueError('Duration must be positive')
+
+        size = len(targets)
+        targets = targets.astype(np.intp)
+        amounts = np.broadcast_to(amounts, (size,)).astype(np.float64)
+        durations = durations if durations.ndim == 0 \
+            else np.broadcast_to(durations, (size,))
+        damage, heal = np.maximum(-amounts, 0), np.maximum(amounts, 0)
+
+        fresh = targets[self._count[targets] == 0]
+        self._spread(targets, damage, heal, 1)
+        if len(fresh) * 16 > len(self._hp):
+            self._touched = np.flatnonzero(self._count)
+        elif len(fresh):
+            self._touched = np.union1d(self._touched, fresh)
+
+        if durations.ndim == 0 or size == 1:
+            batches = [(int(durations.flat[0]), slice(None))]
+        else:
+            order = np.argsort(durations, kind='stable')
+            ordered = durations[order]
+            bounds = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+            batches = [(int(durations[group[0]]), group)
+                       for group in np.split(order, bounds)]
+
+        for last, batch in batches:
+            self._buckets.setdefault(self._now + last, []).append(
+                (targets[batch], damage[batch], heal[batch]))
+        self._active += size
+
+    def damage_over_time(self, targets, amount, duration):
+        """Adds effects taking amount of health points per tick"""
+        self.add(targets, -np.asarray(amount), duration)
+
+    def heal_over_time(self, targets, amount, duration):
+        """Adds effects restoring amount of health points per tick"""
+        self.add(targets, amount, duration)
+
+    def _expire(self, last):
+        """Takes effects which ended on the tick off the rates"""
+        for targets, damage, heal in self._buckets.pop(last, ()):
+            self._spread(targets, damage, heal, -1)
+            self._active -= len(targets)
+
+            # Units left without effects get exact zero rates back.
+            idle = targets[self._count[targets] == 0]
+            self._damage[idle] = 0
+            self._heal[idle] = 0
+
+        touched = self._touched
+        self._touched = touched[self._count[touched] > 0]
+
+    def tick(self, count=1):
+        """
+        Applies effects of the next ticks. On every tick units take the
+        damage of all their effects first, then units still alive are
+        healed, capped at their health points limit. Dead units are not
+        healed.
+
+        :param count: Number of ticks
+        :type count: int
+        """
+
+        for _ in range(count):
+            self._now += 1
+            touched = self._touched
+            if len(touched):
+                hp = self._hp[touched] - self._damage[touched]
+                np.maximum(hp, 0, out=hp)
+                np.add(hp, self._heal[touched], out=hp, where=hp > 0)
+                np.minimum(hp, self._hp_limit[touched], out=hp)
+                self._hp[touched] = hp
+
+            if self._now in self._buckets:
+                self._expire(self._now)
+
+    @property
+    def hp(self):
+        return self._hp
+
+    @property
+    def hp_limit(self):
+        return self._hp_limit
+
+    @property
+    def now(self):
+        return self._now
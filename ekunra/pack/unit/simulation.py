@@ -0,0 +1,203 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from pack.unit.arena import Arena, random_target
+from pack.unit.unit import Unit
+
+
+# One compact record per battle, shipped from workers instead of Units.
+RECORD_DTYPE = np.dtype([('winner', np.int8), ('rounds', np.int32),
+                         ('hp_a', np.float32), ('hp_b', np.float32)])
+
+
+def _team_stats(team):
+    """
+    Converts team to picklable columns of health points and damage.
+
+    :param team: Units or (hp, damage) columns
+    :type team: iterable of Unit or tuple
+    :raise TypeError: In case team has items which are not Units
+    :rtype: tuple
+    """
+
+    if isinstance(team, tuple) and len(team) == 2 \
+            and not isinstance(team[0], Unit):
+        hp, damage = team
+        hp = np.asarray(hp, dtype=np.float64)
+        return hp, np.broadcast_to(np.asarray(damage, dtype=np.float64),
+                                   hp.shape).copy()
+
+    team = list(team)
+    if not all(isinstance(unit, Unit) for unit in team):
+        raise TypeError
+
+    return (np.array([unit.hp for unit in team], dtype=np.float64),
+            np.array([unit.damage for unit in team], dtype=np.float64))
+
+
+def run_battles(team_a, team_b, battles, seed, policy=random_target,
+                max_rounds=1000):
+    """
+    Plays a batch of randomized battles of two teams in arenas.
+
+    Every battle starts from full health points, the side attacking
+    first is drawn at random and targets are chosen by policy.
+
+    :param team_a: Health points and damage columns of first side
+    :type team_a: tuple
+    :param team_b: Health points and damage columns of second side
+    :type team_b: tuple
+    :param battles: Number of battles to play
+    :type battles: int
+    :param seed: Seed of the batch random generator
+    :type seed: int or numpy.random.SeedSequence
+    :param policy: Targeting policy of both sides
+    :type policy: callable
+    :param max_rounds: Rounds after which a battle is a draw
+    :type max_rounds: int
+
+    :return: One record per battle, winner -1 for a draw
+    :rtype: numpy.ndarray
+    """
+
+    rng = np.random.default_rng(seed)
+    records = np.zeros(battles, dtype=RECORD_DTYPE)
+    limit_a, limit_b = team_a[0].sum(), team_b[0].sum()
+
+    for record in range(battles):
+        arena = Arena.from_arrays(team_a[0], team_a[1],
+                                  team_b[0], team_b[1], policy, rng)
+        winner = arena.run(max_rounds, first=int(rng.integers(2)))
+
+        records[record] = (-1 if winner is None else winner, arena.rounds,
+                           arena.hp[0].sum() / limit_a if limit_a else 0,
+                           arena.hp[1].sum() / limit_b if limit_b else 0)
+
+    return records
+
+
+class BattleStats:
+    """Class representing win rates and health points distributions
+    aggregated over battle records as they come"""
+
+    def __init__(self, bins=20):
+        """
+        Initializer
+
+        :param bins: Number of bins of remaining health points histograms
+        :type bins: int
+        """
+
+        self._edges = np.linspace(0, 1, bins + 1)
+        self._battles = 0
+        self._wins = np.zeros(3, dtype=np.int64)
+        self._rounds = 0
+        self._hp_a = np.zeros(bins, dtype=np.int64)
+        self._hp_b = np.zeros(bins, dtype=np.int64)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} [battles:{self._battles}, ' \
+               f'win rate:{self.win_rate(0):.3f}/{self.win_rate(1):.3f}]>'
+
+    def add(self, records):
+        """
+        Merges battle records into statistics.
+
+        :param records: Battle records
+        :type records: numpy.ndarray of RECORD_DTYPE
+        """
+
+        self._battles += len(records)
+        self._wins += np.bincount(records['winner'] + 1, minlength=3)
+        self._rounds += int(records['rounds'].sum())
+        self._hp_a += np.histogram(records['hp_a'], self._edges)[0]
+        self._hp_b += np.histogram(records['hp_b'], self._edges)[0]
+
+    def win_rate(self, side):
+        """Returns share of battles won by side, None for draws"""
+        wins = self._wins[0 if side is None else side + 1]
+        return wins / self._battles if self._battles else 0.0
+
+    @property
+    def battles(self):
+        return self._battles
+
+    @property
+    def mean_rounds(self):
+        return self._rounds / self._battles if self._battles else 0.0
+
+    @property
+    def hp_edges(self):
+        return self._edges
+
+    @property
+    def hp_histogram(self):
+        """Remaining health points share histograms of both sides"""
+        return self._hp_a, self._hp_b
+
+
+def simulate(team_a, team_b, battles, workers=None, chunk_size=1000,
+             seed=0, policy=random_target, max_rounds=1000, bins=20,
+             on_chunk=None):
+    """
+    Plays many randomized battles spread over a pool of processes.
+
+    Battles are split into chunks, every chunk gets its own seed spawned
+    from the root seed, so results don't depend on number of workers.
+    Statistics are aggregated as soon as every chunk finishes.
+
+    :param team_a: Units or (hp, damage) columns of first side
+    :type team_a: iterable of Unit or tuple
+    :param team_b: Units or (hp, damage) columns of second side
+    :type team_b: iterable of Unit or tuple
+    :param battles: Number of battles to play
+    :type battles: int
+    :param workers: Number of processes, CPU count by default, 1 plays
+    in the current process
+    :type workers: int
+    :param chunk_size: Number of battles per task
+    :type chunk_size: int
+    :param seed: Root seed
+    :type seed: int
+    :param policy: Targeting policy of both sides, must be picklable
+    :type policy: callable
+    :param max_rounds: Rounds after which a battle is a draw
+    :type max_rounds: int
+    :param bins: Number of bins of remaining health points histograms
+    :type bins: int
+    :param on_chunk: Called with statistics after every merged chunk
+    :type on_chunk: callable
+    :raise TypeError: In case teams have items which are not Units
+
+    :return: Aggregated statistics
+    :rtype: BattleStats
+    """
+
+    team_a, team_b = _team_stats(team_a), _team_stats(team_b)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    sizes = [min(chunk_size, battles - start)
+             for start in range(0, battles, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    stats = BattleStats(bins)
+
+    def merge(records):
+        stats.add(records)
+        if on_chunk is not None:
+            on_chunk(stats)
+
+    if workers == 1:
+        for size, chunk_seed in zip(sizes, seeds):
+            merge(run_battles(team_a, team_b, size, chunk_seed, policy,
+                              max_rounds))
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_battles, team_a, team_b, size,
+                               chunk_seed, policy, max_rounds)
+                   for size, chunk_seed in zip(sizes, seeds)]
+        for future in as_completed(futures):
+            merge(future.result())
+
+    return stats
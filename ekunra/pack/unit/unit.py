@@ -1,3 +1,6 @@
+from enum import IntEnum
+
+from pack.column import validate_column
 
 
 class Error(Exception):
@@ -19,7 +22,19 @@ class UnitIsDead(Error):
             self.message = 'Unit is dead!'
 
 
+class AttackStatus(IntEnum):
+    """Outcome of an attack."""
+
+    HIT = 0
+    ATTACKER_DEAD = 1
+    TARGET_KILLED = 2
+    ATTACKER_KILLED = 3
+
+
 class Unit(object):
+    __slots__ = ('_health_points', '_health_points_limit', '_damage',
+                 '_name')
+
     def __ensure_is_alive(self, message):
         if self._health_points <= 0:
             raise UnitIsDead(message=message)
@@ -78,6 +93,53 @@ class Unit(object):
         self._damage = self._validate_numeric(dmg)
         self._name = self._validate_string(name)
 
+    @classmethod
+    def bulk(cls, names, hps, dmgs):
+        """
+        Bulk constructor validating whole columns of data at once.
+
+        :param names: Units' names
+        :type names: sequence of str
+        :param hps: Units' health points
+        :type hps: sequence or numpy.ndarray of int or float
+        :param dmgs: Units' damage dealing points
+        :type dmgs: sequence or numpy.ndarray of int or float
+        :raise TypeError: objects instantiated with incorrect data
+        :raise ValueError: columns are of different length
+
+        :return: New Units
+        :rtype: list
+        """
+
+        names = list(names)
+        hps = validate_column(hps)
+        dmgs = validate_column(dmgs)
+
+        if not all(isinstance(name, str) for name in names):
+            raise TypeError
+        if not len(names) == len(hps) == len(dmgs):
+            raise ValueError('Columns must be of equal length')
+
+        new = cls.__new__
+        units = []
+        for name, hp, dmg in zip(names, hps, dmgs):
+            unit = new(cls)
+            unit._health_points = hp
+            unit._health_points_limit = hp
+            unit._damage = dmg
+            unit._name = name
+            units.append(unit)
+
+        return units
+
+    def __copy__(self):
+        unit_copy = Unit.__new__(Unit)
+        unit_copy._health_points = self._health_points
+        unit_copy._health_points_limit = self._health_points_limit
+        unit_copy._damage = self._damage
+        unit_copy._name = self._name
+        return unit_copy
+
     def __str__(self):
         return f'{self._name} [' \
                f'hp:{round(self._health_points, 2)}/' \
@@ -136,11 +198,41 @@ class Unit(object):
         :rtype: None
         """
 
-        self.__ensure_is_alive("Unit can't attack as it is dead")
+        status = self.try_attack(enemy)
+
+        if status is AttackStatus.ATTACKER_DEAD:
+            raise UnitIsDead(message="Unit can't attack as it is dead")
+        if status is AttackStatus.TARGET_KILLED:
+            raise UnitIsDead(message="Unit can't counter attack as it is "
+                                     "dead")
+
+    def try_attack(self, enemy):
+        """
+        Making physical damage to an enemy, reporting the outcome instead
+        of raising.
+
+        :param enemy: Enemy need to be attacked
+        :type enemy: Unit
+
+        :return: HIT, ATTACKER_DEAD, TARGET_KILLED or ATTACKER_KILLED
+        :rtype: AttackStatus
+        """
+
+        if self._health_points <= 0:
+            return AttackStatus.ATTACKER_DEAD
 
         enemy.take_damage(self._damage)
+
+        if enemy.hp <= 0:
+            return AttackStatus.TARGET_KILLED
+
         enemy.counter_attack(self)
 
+        if self._health_points <= 0:
+            return AttackStatus.ATTACKER_KILLED
+
+        return AttackStatus.HIT
+
     def counter_attack(self, enemy):
         """
         Making physical damage to an enemy with half damage power.